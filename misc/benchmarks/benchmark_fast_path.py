@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmark of the processing overhead saved by obspy.core.trace.fast_path().
+
+Processes many short traces with a chain of cheap Trace methods and prints
+the time per method call with and without the fast path.
+
+Usage::
+
+    python benchmark_fast_path.py [number_of_traces] [npts]
+"""
+from __future__ import (absolute_import, division, print_function,
+                        unicode_literals)
+from future.builtins import *  # NOQA
+
+import sys
+import timeit
+
+import numpy as np
+
+from obspy import Trace
+from obspy.core.trace import fast_path
+
+
+# number of processing calls per trace in process()
+CALLS_PER_TRACE = 4
+
+
+def process(traces):
+    for tr in traces:
+        tr.detrend("demean")
+        tr.taper(0.05)
+        tr.normalize()
+        tr.data = tr.data * 2.0
+
+
+def process_fast(traces):
+    with fast_path():
+        process(traces)
+
+
+def main(number_of_traces=10000, npts=100):
+    data = np.random.RandomState(815).randn(npts)
+    results = {}
+    for name, func in (("default", process), ("fast_path", process_fast)):
+        traces = [Trace(data=data.copy()) for _ in range(number_of_traces)]
+        timer = timeit.Timer(lambda: func(traces))
+        # best of 3 to reduce noise
+        results[name] = min(timer.repeat(repeat=3, number=1))
+    calls = number_of_traces * CALLS_PER_TRACE
+    print("%d traces with %d samples, %d calls per run" % (
+        number_of_traces, npts, calls))
+    for name, seconds in sorted(results.items()):
+        print("%-10s %8.3f s  %8.2f us/call" % (
+            name, seconds, seconds / calls * 1e6))
+    saved = results["default"] - results["fast_path"]
+    print("saved      %8.3f s  %8.2f us/call (%.0f%%)" % (
+        saved, saved / calls * 1e6, 100.0 * saved / results["default"]))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:3]])
@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmark of the time needed for ``import obspy``.
+
+Imports ObsPy in fresh interpreters and prints the best and median wall
+clock time. If a maximum time in seconds is given, the script exits with a
+non-zero status if the best time exceeds it, so that it can be used to catch
+import time regressions.
+
+Usage::
+
+    python benchmark_import.py [number_of_runs] [max_seconds]
+"""
+from __future__ import (absolute_import, division, print_function,
+                        unicode_literals)
+from future.builtins import *  # NOQA
+
+import subprocess
+import sys
+
+import numpy as np
+
+
+CODE = ("import time; t = time.time(); import obspy; "
+        "print(time.time() - t)")
+
+
+def import_time():
+    """
+    Returns the time in seconds ``import obspy`` takes in a new interpreter.
+    """
+    output = subprocess.check_output([sys.executable, "-c", CODE])
+    return float(output.decode().strip().splitlines()[-1])
+
+
+def main(number_of_runs=10, max_seconds=None):
+    # the first run warms up the file system cache and byte code
+    import_time()
+    times = [import_time() for _ in range(number_of_runs)]
+    best = min(times)
+    print("import obspy: best %.3f s, median %.3f s (%d runs)" % (
+        best, np.median(times), number_of_runs))
+    if max_seconds is not None and best > max_seconds:
+        print("import obspy took longer than %.3f s" % max_seconds)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:3]
+    main(*[int(args[0])] + [float(arg) for arg in args[1:]]
+         if args else [])
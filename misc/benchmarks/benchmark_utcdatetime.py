@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmark of UTCDateTime construction from different input types.
+
+Compares construction from fixed width ISO8601 strings (fast path, with and
+without the cache of parsed strings), other string formats, floats, datetime
+objects and integer nanoseconds.
+
+Usage::
+
+    python benchmark_utcdatetime.py [number]
+"""
+from __future__ import (absolute_import, division, print_function,
+                        unicode_literals)
+from future.builtins import *  # NOQA
+
+import sys
+import timeit
+
+from obspy import UTCDateTime
+from obspy.core import utcdatetime
+
+
+def _inputs(number):
+    """
+    Returns a list of (name, constructor, values) tuples.
+    """
+    start = UTCDateTime(2010, 1, 1)
+    times = [start + i * 1.001 for i in range(number)]
+    iso = [str(t) for t in times]
+    other = [t.strftime("%Y%m%d %H%M%S") for t in times]
+    floats = [t.timestamp for t in times]
+    datetimes = [t.datetime for t in times]
+    ns = [t._ns for t in times]
+
+    def from_ns(value):
+        return UTCDateTime(ns=value)
+
+    return [
+        ("iso8601 string", UTCDateTime, iso),
+        ("iso8601 cached", UTCDateTime, iso),
+        ("other string", UTCDateTime, other),
+        ("float", UTCDateTime, floats),
+        ("datetime", UTCDateTime, datetimes),
+        ("ns int", from_ns, ns),
+    ]
+
+
+def main(number=20000):
+    print("constructing %d UTCDateTime objects per run" % number)
+    for name, func, values in _inputs(number):
+        def run():
+            for value in values:
+                func(value)
+
+        def setup():
+            if name != "iso8601 cached":
+                utcdatetime._STRING_CACHE.clear()
+            else:
+                run()
+
+        results = []
+        for _ in range(3):
+            setup()
+            results.append(timeit.timeit(run, number=1))
+        # best of 3 to reduce noise
+        seconds = min(results)
+        print("%-15s %8.3f s  %8.2f us/object" % (
+            name, seconds, seconds / number * 1e6))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
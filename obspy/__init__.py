@@ -33,7 +33,6 @@ from future.builtins import *  # NOQA
 from future.utils import PY2, native_str
 
 import warnings
-import requests
 
 # don't change order
 from obspy.core.utcdatetime import UTCDateTime  # NOQA
@@ -87,10 +86,14 @@ else:
             "inventory", "write", numspaces=8)
 
 
-if requests.__version__ in ('2.12.0', '2.12.1', '2.12.2'):
+# look up the version without importing requests, it is only needed by the
+# clients and importing it takes a considerable part of ``import obspy``
+from obspy.core.util.base import get_dependency_version
+_requests_version = get_dependency_version('requests', raw_string=True)
+if _requests_version in ('2.12.0', '2.12.1', '2.12.2'):
     msg = ("ObsPy has some known issues with 'requests' version {} (see "
            "github issue #1599). Please consider updating module 'requests' "
-           "to a newer version.").format(requests.__version__)
+           "to a newer version.").format(_requests_version)
     warnings.warn(msg)
 
 
@@ -30,20 +30,21 @@ import warnings
 
 import numpy as np
 
-from obspy.core.utcdatetime import UTCDateTime
+from obspy.core.utcdatetime import UTCDateTime, UTCDateTimeArray
 from obspy.core.util import NamedTemporaryFile, _read_from_plugin
 from obspy.core.util.base import ENTRY_POINTS, download_to_file
 from obspy.core.util.decorator import (map_example_filename, rlock,
                                        uncompress_file)
 from obspy.core.util.misc import buffered_load_entry_point
-from obspy.imaging.cm import obspy_sequential
 
 from .base import CreationInfo, ResourceIdentifier
 
 from .event import Event
 
-EVENT_ENTRY_POINTS = ENTRY_POINTS['event']
-EVENT_ENTRY_POINTS_WRITE = ENTRY_POINTS['event_write']
+
+# range of points in time that can be compared as int64 nanoseconds
+_NS_MIN = int(np.iinfo(np.int64).min)
+_NS_MAX = int(np.iinfo(np.int64).max)
 
 
 class Catalog(object):
@@ -348,6 +349,10 @@ class Catalog(object):
                         "<=": _is_smaller_or_equal,
                         ">": _is_greater,
                         ">=": _is_greater_or_equal}
+        time_operator_map = {"<": UTCDateTimeArray.__lt__,
+                             "<=": UTCDateTimeArray.__le__,
+                             ">": UTCDateTimeArray.__gt__,
+                             ">=": UTCDateTimeArray.__ge__}
 
         try:
             inverse = kwargs["inverse"]
@@ -370,14 +375,37 @@ class Catalog(object):
                             float(value))):
                         temp_events.append(event)
                 events = temp_events
-            elif key in ("longitude", "latitude", "depth", "time"):
+            elif key == "time":
+                # compare all origin times at once
+                events = [event for event in events
+                          if event.origins and key in event.origins[0]]
+                times = [event.origins[0].time for event in events]
+                value = UTCDateTime(value)
+                try:
+                    # nanoseconds are stored as int64, i.e. only times
+                    # between the years 1678 and 2261 can be compared at
+                    # once
+                    if not _NS_MIN <= value._ns <= _NS_MAX:
+                        raise OverflowError
+                    time_array = UTCDateTimeArray(
+                        [UTCDateTime(0) if t is None else t for t in times])
+                except OverflowError:
+                    selected = [operator_map[operator](t, value)
+                                for t in times]
+                else:
+                    selected = time_operator_map[operator](time_array, value)
+                    # same handling of missing times as for the other keys
+                    missing = np.array([t is None for t in times],
+                                       dtype=bool)
+                    selected[missing] = operator in ("<", "<=")
+                events = [event for event, selected_ in zip(events, selected)
+                          if selected_]
+            elif key in ("longitude", "latitude", "depth"):
                 temp_events = []
                 for event in events:
                     if (event.origins and key in event.origins[0] and
                         operator_map[operator](
-                            event.origins[0].get(key),
-                            UTCDateTime(value) if key == 'time' else
-                            float(value))):
+                            event.origins[0].get(key), float(value))):
                         temp_events.append(event)
                 events = temp_events
             elif key in ('standard_error', 'azimuthal_gap',
@@ -492,7 +520,7 @@ class Catalog(object):
         format = format.upper()
         try:
             # get format specific entry point
-            format_ep = EVENT_ENTRY_POINTS_WRITE[format]
+            format_ep = ENTRY_POINTS['event_write'][format]
             # search writeFormat method for given entry point
             write_format = buffered_load_entry_point(
                 format_ep.dist.key, 'obspy.plugin.event.%s' % (format_ep.name),
@@ -500,7 +528,7 @@ class Catalog(object):
         except (IndexError, ImportError, KeyError):
             msg = "Writing format \"%s\" is not supported. Supported types: %s"
             raise ValueError(msg % (format,
-                                    ', '.join(EVENT_ENTRY_POINTS_WRITE)))
+                                    ', '.join(ENTRY_POINTS['event_write'])))
         return write_format(self, filename, **kwargs)
 
     def plot(self, projection='global', resolution='l',
@@ -648,6 +676,7 @@ class Catalog(object):
             fig = inv.plot(show=False)
             cat.plot(fig=fig)
         """
+        from obspy.imaging.cm import obspy_sequential
         from obspy.imaging.maps import plot_map, _plot_basemap_into_axes
         import matplotlib
         import matplotlib.pyplot as plt
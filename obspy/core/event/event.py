@@ -25,7 +25,6 @@ import copy
 from obspy.core.event.header import (
     EventType, EventTypeCertainty, EventDescriptionType)
 from obspy.core.util.decorator import rlock
-from obspy.imaging.source import plot_radiation_pattern, _setup_figure_and_axes
 
 
 from .base import (_event_type_class_factory,
@@ -232,6 +231,8 @@ class Event(__Event):
             event.plot(kind=[['global'], ['p_sphere', 'p_quiver']])
         """
         import matplotlib.pyplot as plt
+        from obspy.imaging.source import (plot_radiation_pattern,
+                                          _setup_figure_and_axes)
         try:
             fm = self.preferred_focal_mechanism() or self.focal_mechanisms[0]
             mtensor = fm.moment_tensor.tensor
@@ -15,13 +15,15 @@ from future.builtins import *  # NOQA
 
 import copy
 import ctypes as C
+import hashlib
+import pickle
+import threading
 import warnings
-from collections import defaultdict, Iterable
+from collections import defaultdict, Iterable, OrderedDict
 from copy import deepcopy
 from math import pi
 
 import numpy as np
-import scipy.interpolate
 
 from obspy.core.util.base import ComparingObject
 from obspy.core.util.obspy_types import (ComplexWithUncertainties,
@@ -33,6 +35,87 @@ from obspy.core.util.obspy_types import (ComplexWithUncertainties,
 from .util import Angle, Frequency
 
 
+# maximum number of frequency responses kept by
+# Response.get_evalresp_response() and obspy.signal.invsim.evalresp(),
+# set to 0 to disable caching
+RESPONSE_CACHE_SIZE = 32
+_RESPONSE_CACHE = OrderedDict()
+_RESPONSE_CACHE_LOCK = threading.Lock()
+_RESPONSE_CACHE_STATS = {'hits': 0, 'misses': 0}
+
+
+def _get_cached_response(key, func, *args, **kwargs):
+    """
+    Returns the frequency response ``func(*args, **kwargs)`` from a least
+    recently used cache of at most ``RESPONSE_CACHE_SIZE`` responses.
+
+    Callers get a copy of the cached array as they usually modify the
+    response in place (e.g. when inverting it).
+    """
+    with _RESPONSE_CACHE_LOCK:
+        try:
+            value = _RESPONSE_CACHE.pop(key)
+        except KeyError:
+            _RESPONSE_CACHE_STATS['misses'] += 1
+        else:
+            _RESPONSE_CACHE[key] = value
+            _RESPONSE_CACHE_STATS['hits'] += 1
+            return value.copy()
+    value = func(*args, **kwargs)
+    with _RESPONSE_CACHE_LOCK:
+        _RESPONSE_CACHE[key] = value.copy()
+        while len(_RESPONSE_CACHE) > RESPONSE_CACHE_SIZE:
+            _RESPONSE_CACHE.popitem(last=False)
+    return value
+
+
+def get_response_cache_info():
+    """
+    Returns statistics of the cache of frequency responses used by
+    :meth:`Response.get_evalresp_response` and
+    :func:`obspy.signal.invsim.evalresp` (and thereby e.g. by
+    :meth:`~obspy.core.trace.Trace.remove_response`,
+    :meth:`~obspy.core.trace.Trace.simulate` and
+    :class:`~obspy.signal.spectral_estimation.PPSD`).
+
+    :rtype: dict
+    :returns: Number of cache ``hits`` and ``misses``, the current number of
+        cached responses (``size``) and the maximum number (``maxsize``).
+
+    The three channels of the example stream have the same response, it is
+    evaluated only once:
+
+    >>> from obspy import read
+    >>> clear_response_cache()
+    >>> st = read()
+    >>> st.remove_response()  # doctest: +ELLIPSIS
+    <...Stream object at 0x...>
+    >>> info = get_response_cache_info()
+    >>> print(info['hits'], info['misses'], info['size'])
+    2 1 1
+    >>> st = read()
+    >>> st.remove_response()  # doctest: +ELLIPSIS
+    <...Stream object at 0x...>
+    >>> info = get_response_cache_info()
+    >>> print(info['hits'], info['misses'], info['size'])
+    5 1 1
+    """
+    with _RESPONSE_CACHE_LOCK:
+        return dict(_RESPONSE_CACHE_STATS, size=len(_RESPONSE_CACHE),
+                    maxsize=RESPONSE_CACHE_SIZE)
+
+
+def clear_response_cache():
+    """
+    Removes all frequency responses from the cache and resets its
+    statistics, see :func:`get_response_cache_info`.
+    """
+    with _RESPONSE_CACHE_LOCK:
+        _RESPONSE_CACHE.clear()
+        _RESPONSE_CACHE_STATS['hits'] = 0
+        _RESPONSE_CACHE_STATS['misses'] = 0
+
+
 class ResponseStage(ComparingObject):
     """
     From the StationXML Definition:
@@ -913,8 +996,9 @@ class Response(ComparingObject):
                    "stages.")
             raise ObsPyException(msg)
 
+        import scipy.interpolate
         import obspy.signal.evrespwrapper as ew
-        from obspy.signal.headers import clibevresp
+        from obspy.signal.headers import clibevresp, evresp_lock
 
         out_units = output.upper()
         if out_units not in ("DISP", "VEL", "ACC"):
@@ -1329,36 +1413,37 @@ class Response(ComparingObject):
         output = np.empty(len(frequencies), dtype=np.complex128)
         out_units = C.c_char_p(out_units.encode('ascii', 'strict'))
 
-        # Set global variables
-        if self.resource_id:
-            clibevresp.curr_file.value = self.resource_id.encode('utf-8')
-        else:
-            clibevresp.curr_file.value = None
+        with evresp_lock:
+            # Set global variables
+            if self.resource_id:
+                clibevresp.curr_file.value = self.resource_id.encode('utf-8')
+            else:
+                clibevresp.curr_file.value = None
 
-        try:
-            rc = clibevresp._obspy_check_channel(C.byref(chan))
-            if rc:
-                e, m = ew.ENUM_ERROR_CODES[rc]
-                raise e('check_channel: ' + m)
-            rc = clibevresp._obspy_norm_resp(
-                C.byref(chan), -1, 0,
-                1 if hide_sensitivity_mismatch_warning else 0)
-            if rc:
-                e, m = ew.ENUM_ERROR_CODES[rc]
-                raise e('norm_resp: ' + m)
-
-            rc = clibevresp._obspy_calc_resp(C.byref(chan), frequencies,
-                                             len(frequencies),
-                                             output, out_units, -1, 0, 0)
-            if rc:
-                e, m = ew.ENUM_ERROR_CODES[rc]
-                raise e('calc_resp: ' + m)
-
-            # XXX: Check if this is really not needed.
-            # output *= scale_factor[0]
-
-        finally:
-            clibevresp.curr_file.value = None
+            try:
+                rc = clibevresp._obspy_check_channel(C.byref(chan))
+                if rc:
+                    e, m = ew.ENUM_ERROR_CODES[rc]
+                    raise e('check_channel: ' + m)
+                rc = clibevresp._obspy_norm_resp(
+                    C.byref(chan), -1, 0,
+                    1 if hide_sensitivity_mismatch_warning else 0)
+                if rc:
+                    e, m = ew.ENUM_ERROR_CODES[rc]
+                    raise e('norm_resp: ' + m)
+
+                rc = clibevresp._obspy_calc_resp(C.byref(chan), frequencies,
+                                                 len(frequencies),
+                                                 output, out_units, -1, 0, 0)
+                if rc:
+                    e, m = ew.ENUM_ERROR_CODES[rc]
+                    raise e('calc_resp: ' + m)
+
+                # XXX: Check if this is really not needed.
+                # output *= scale_factor[0]
+
+            finally:
+                clibevresp.curr_file.value = None
 
         return output, chan
 
@@ -1421,16 +1506,31 @@ class Response(ComparingObject):
             used (disregarding all later stages).
         :rtype: tuple of two arrays
         :returns: frequency response and corresponding frequencies
+
+        Responses are cached, a response with the same content evaluated for
+        the same parameters again is taken from the cache, see
+        :func:`get_response_cache_info`.
         """
         # Calculate the output frequencies.
         fy = 1 / (t_samp * 2.0)
         # start at zero to get zero for offset/ DC of fft
         freqs = np.linspace(0, fy, nfft // 2 + 1).astype(np.float64)
 
-        response = self.get_evalresp_response_for_frequencies(
-            freqs, output=output, start_stage=start_stage, end_stage=end_stage)
+        key = ('response', self._fingerprint(), float(t_samp), int(nfft),
+               output, start_stage, end_stage)
+        response = _get_cached_response(
+            key, self.get_evalresp_response_for_frequencies, freqs,
+            output=output, start_stage=start_stage, end_stage=end_stage)
         return response, freqs
 
+    def _fingerprint(self):
+        """
+        Returns a hash of the content of the response, used as cache key
+        for the evaluated response. Responses changed after evaluation get a
+        new fingerprint.
+        """
+        return hashlib.sha1(pickle.dumps(self, protocol=2)).hexdigest()
+
     def __str__(self):
         i_s = self.instrument_sensitivity
         if i_s:
@@ -16,22 +16,27 @@ from future.utils import PY3, native_str
 import copy
 import fnmatch
 import math
+import multiprocessing
 import os
 import pickle
 import re
 import warnings
 from glob import glob, has_magic
+from multiprocessing.pool import ThreadPool
 
 import numpy as np
 
 from obspy.core import compatibility
-from obspy.core.trace import Trace
+from obspy.core import trace as trace_module
+from obspy.core.trace import Trace, _get_processing_info
 from obspy.core.utcdatetime import UTCDateTime
 from obspy.core.util import NamedTemporaryFile
 from obspy.core.util.base import (ENTRY_POINTS, _get_function_from_entry_point,
-                                  _read_from_plugin, download_to_file)
+                                  _read_from_plugin, create_empty_data_chunk,
+                                  download_to_file)
 from obspy.core.util.decorator import (map_example_filename,
-                                       raise_if_masked, uncompress_file)
+                                       raise_if_masked, uncompress_file,
+                                       _load_lazy_data)
 from obspy.core.util.misc import get_window_times, buffered_load_entry_point
 
 
@@ -42,7 +47,8 @@ _headonly_warning_msg = (
 @map_example_filename("pathname_or_url")
 def read(pathname_or_url=None, format=None, headonly=False, starttime=None,
          endtime=None, nearest_sample=True, dtype=None, apply_calib=False,
-         check_compression=True, **kwargs):
+         check_compression=True, pin_format=False, n_jobs=1,
+         executor='thread', mmap=False, **kwargs):
     """
     Read waveform files into an ObsPy Stream object.
 
@@ -87,6 +93,31 @@ def read(pathname_or_url=None, format=None, headonly=False, starttime=None,
     :param check_compression: Check for compression on file and decompress
         if needed. This may be disabled for a moderate speed up.
     :type check_compression: bool, optional
+    :type pin_format: bool, optional
+    :param pin_format: Only applied if ``format`` is not given and a file
+        name with wildcards matches multiple files. If set to ``True``, the
+        format detected for the first file is used for all other files
+        without checking their format. All files have to be of the same
+        format.
+    :type n_jobs: int, optional
+    :param n_jobs: Number of files read concurrently if a file name with
+        wildcards matches multiple files, ``-1`` uses one job per CPU.
+        Defaults to ``1``, reading the files one after the other. The traces
+        are always returned in the order of the sorted file names.
+    :type executor: str, optional
+    :param executor: Only applied if ``n_jobs`` is not ``1``. ``'thread'``
+        reads the files in a thread pool, ``'process'`` in a pool of worker
+        processes. Readers that release the GIL (e.g. MiniSEED) usually do
+        well with threads, use processes for readers implemented in Python.
+    :type mmap: bool, optional
+    :param mmap: If set to ``True``, the data of uncompressed files are
+        memory-mapped instead of read into memory, so that only the samples
+        actually accessed are read from disk. Changing the data does not
+        change the files. Supported by the formats ``"OBSPYBIN"``, ``"SAC"``
+        and ``"SU"`` and by ``"SEGY"`` files with 2 or 4 byte integer or 4
+        byte IEEE float data, other formats ignore it. Note that each
+        memory-mapped file keeps an open file descriptor, and that the data
+        keep the byte order of the file.
     :param kwargs: Additional keyword arguments passed to the underlying
         waveform reader method.
     :return: An ObsPy :class:`~obspy.core.stream.Stream` object.
@@ -200,6 +231,9 @@ def read(pathname_or_url=None, format=None, headonly=False, starttime=None,
     kwargs['endtime'] = endtime
     kwargs['nearest_sample'] = nearest_sample
     kwargs['check_compression'] = check_compression
+    # only passed if requested, most readers do not support it
+    if mmap:
+        kwargs['mmap'] = True
     # create stream
     st = Stream()
     if pathname_or_url is None:
@@ -230,8 +264,20 @@ def read(pathname_or_url=None, format=None, headonly=False, starttime=None,
     else:
         # some file name
         pathname = pathname_or_url
-        for file in sorted(glob(pathname)):
-            st.extend(_read(file, format, headonly, **kwargs).traces)
+        files = sorted(glob(pathname))
+        streams = []
+        if pin_format and not format:
+            # detect the format with the first files, until a file with
+            # traces is found
+            while files and not format:
+                stream = _read(files.pop(0), format, headonly, **kwargs)
+                if stream:
+                    format = stream[0].stats._format
+                streams.append(stream)
+        streams.extend(_read_files(files, format, headonly, n_jobs=n_jobs,
+                                   executor=executor, **kwargs))
+        for stream in streams:
+            st.extend(stream.traces)
         if len(st) == 0:
             # try to give more specific information why the stream is empty
             if has_magic(pathname) and not glob(pathname):
@@ -267,6 +313,40 @@ def read(pathname_or_url=None, format=None, headonly=False, starttime=None,
     return st
 
 
+def _read_files(filenames, format=None, headonly=False, n_jobs=1,
+                executor='thread', **kwargs):
+    """
+    Read multiple files, optionally concurrently, into a list of ObsPy
+    Stream objects in the order of the given file names.
+    """
+    n_jobs = _get_n_jobs(n_jobs, executor, len(filenames))
+    if n_jobs <= 1:
+        return [_read(filename, format, headonly, **kwargs)
+                for filename in filenames]
+    if executor == 'thread':
+        pool = ThreadPool(n_jobs)
+    else:
+        pool = multiprocessing.Pool(n_jobs)
+    try:
+        return pool.map(_read_file, [(filename, format, headonly, kwargs)
+                                     for filename in filenames])
+    finally:
+        pool.close()
+        pool.join()
+
+
+def _read_file(args):
+    """
+    Read a single file, helper for reading files in a pool, see
+    :func:`_read_files`.
+    """
+    filename, format, headonly, kwargs = args
+    stream = _read(filename, format, headonly, **kwargs)
+    # load deferred data before the stream is passed back from a worker
+    _load_lazy_data(stream)
+    return stream
+
+
 @uncompress_file
 def _read(filename, format=None, headonly=False, **kwargs):
     """
@@ -1721,6 +1801,175 @@ class Stream(object):
                 continue
             yield temp
 
+    def sliding_windows(self, window_length, step, offset=0):
+        """
+        Returns all equal length sliding windows of each Trace as arrays.
+
+        Calls :meth:`~obspy.core.trace.Trace.sliding_windows` for every
+        Trace. The windows of all traces start at the same times relative to
+        the earliest start time of all Traces, like for :meth:`slide`.
+
+        .. rubric:: Example
+
+        >>> from obspy import read
+        >>> st = read()
+        >>> for windows, times in st.sliding_windows(10.0, 5.0):
+        ...     print(windows.shape)
+        (4, 1001)
+        (4, 1001)
+        (4, 1001)
+
+        :param window_length: The length of each window in seconds.
+        :type window_length: float
+        :param step: The step between the start times of two successive
+            windows in seconds.
+        :type step: float
+        :param offset: The offset of the first window in seconds relative to
+            the earliest start time of all Traces.
+        :type offset: float
+        :rtype: list
+        :return: A list with a tuple of the windows and their start times
+            for each Trace.
+        """
+        if not self.traces:
+            return []
+        starttime = min(tr.stats.starttime for tr in self) + offset
+        result = []
+        for tr in self:
+            # Start at the first common window time within the trace.
+            count = max(0, math.ceil(
+                (tr.stats.starttime - starttime) / step - 1e-9))
+            result.append(tr.sliding_windows(
+                window_length, step,
+                offset=max(0, starttime + count * step - tr.stats.starttime)))
+        return result
+
+    def to_array(self, starttime=None, endtime=None, nearest_sample=True,
+                 fill_value=None, dtype=None):
+        """
+        Aligns the data of all Traces on a common time base in one array.
+
+        Every Trace becomes one row of a 2-D array of shape
+        ``(number of traces, number of samples)`` whose columns are the
+        samples at ``starttime + i * delta``. Traces are trimmed or padded
+        to the requested time span. The samples of each Trace are snapped to
+        the common time base in the same way as
+        :meth:`~obspy.core.trace.Trace.trim` does it. Use
+        :meth:`from_array` to turn the result back into a Stream.
+
+        .. rubric:: Example
+
+        >>> from obspy import read
+        >>> st = read()
+        >>> data, headers = st.to_array()
+        >>> print(data.shape)
+        (3, 3000)
+        >>> print(headers[0].channel, headers[0].starttime)
+        EHZ 2009-08-24T00:20:03.000000Z
+
+        :type starttime: :class:`~obspy.core.utcdatetime.UTCDateTime`
+        :param starttime: Time of the first column. Defaults to the earliest
+            start time of all Traces.
+        :type endtime: :class:`~obspy.core.utcdatetime.UTCDateTime`
+        :param endtime: Time of the last column. Defaults to the latest end
+            time of all Traces.
+        :type nearest_sample: bool, optional
+        :param nearest_sample: If ``True``, the samples of each Trace are
+            shifted to the nearest sample of the common time base, otherwise
+            to the next one. See :meth:`~obspy.core.trace.Trace.trim`.
+        :type fill_value: int, float or ``None``, optional
+        :param fill_value: Value for samples not covered by a Trace. If
+            ``None`` and any such samples exist, a
+            :class:`~numpy.ma.MaskedArray` is returned.
+        :type dtype: :class:`numpy.dtype`, optional
+        :param dtype: Data type of the array. Defaults to a type that can
+            hold the data of all Traces.
+        :rtype: tuple(:class:`numpy.ndarray`, list)
+        :return: The C-contiguous array and a list with a copy of the
+            :class:`~obspy.core.trace.Stats` of every Trace, adjusted to the
+            common start time and number of samples.
+        """
+        if not self.traces:
+            raise ValueError("Cannot convert an empty Stream to an array.")
+        sampling_rates = set(tr.stats.sampling_rate for tr in self)
+        if len(sampling_rates) != 1:
+            msg = "All Traces must have the same sampling rate."
+            raise ValueError(msg)
+        sampling_rate = sampling_rates.pop()
+        if starttime is None:
+            starttime = min(tr.stats.starttime for tr in self)
+        if endtime is None:
+            endtime = max(tr.stats.endtime for tr in self)
+        npts = max(0, int(compatibility.round_away(
+            (endtime - starttime) * sampling_rate)) + 1)
+        if dtype is None:
+            dtype = np.result_type(*[tr.data.dtype for tr in self])
+        data = np.zeros((len(self), npts), dtype=dtype)
+        mask = np.ones(data.shape, dtype=np.bool_)
+        headers = []
+        for row, tr in enumerate(self):
+            offset = (tr.stats.starttime - starttime) * sampling_rate
+            if nearest_sample:
+                offset = int(compatibility.round_away(offset))
+            else:
+                offset = int(math.ceil(round(offset, 7)))
+            start = min(max(0, offset), npts)
+            stop = max(min(npts, offset + len(tr)), start)
+            tr_data = tr.data[start - offset:stop - offset]
+            if isinstance(tr_data, np.ma.masked_array):
+                mask[row, start:stop] = np.ma.getmaskarray(tr_data)
+                tr_data = tr_data.data
+            else:
+                mask[row, start:stop] = False
+            data[row, start:stop] = tr_data
+            header = copy.deepcopy(tr.stats)
+            header.starttime = starttime
+            header.npts = npts
+            headers.append(header)
+        if mask.any():
+            if fill_value is None:
+                data = np.ma.masked_array(data, mask=mask)
+            else:
+                data[mask] = fill_value
+        return data, headers
+
+    @staticmethod
+    def from_array(data, headers):
+        """
+        Creates a Stream from a 2-D array with one Trace per row.
+
+        Inverse of :meth:`to_array`. The data of each Trace is a view of its
+        row of the array so nothing is copied and changing the data of a
+        Trace changes the array and vice versa.
+
+        .. rubric:: Example
+
+        >>> from obspy import read, Stream
+        >>> st = read()
+        >>> data, headers = st.to_array()
+        >>> st2 = Stream.from_array(data, headers)
+        >>> st2 == st
+        True
+
+        :type data: :class:`numpy.ndarray`
+        :param data: C-contiguous 2-D array with one row per Trace.
+        :type headers: list
+        :param headers: One header for each row, e.g. a
+            :class:`~obspy.core.trace.Stats` object or a dictionary.
+        """
+        if data.ndim != 2 or len(data) != len(headers):
+            msg = "Data must be a 2-D array with one row per header."
+            raise ValueError(msg)
+        if not data.flags.c_contiguous:
+            msg = "Data must be C-contiguous to create Traces without copy."
+            raise ValueError(msg)
+        traces = []
+        for row, header in zip(data, headers):
+            header = copy.deepcopy(header)
+            header["npts"] = len(row)
+            traces.append(Trace(data=row, header=header))
+        return Stream(traces=traces)
+
     def select(self, network=None, station=None, location=None, channel=None,
                sampling_rate=None, npts=None, component=None, id=None):
         """
@@ -1934,16 +2183,10 @@ class Stream(object):
         # clear traces of current stream
         self.traces = []
         # loop through ids
-        for _id in traces_dict.keys():
-            cur_trace = traces_dict[_id].pop(0)
-            # loop through traces of same id
-            for _i in range(len(traces_dict[_id])):
-                trace = traces_dict[_id].pop(0)
-                # disable sanity checks because there are already done
-                cur_trace = cur_trace.__add__(
-                    trace, method, fill_value=fill_value, sanity_checks=False,
-                    interpolation_samples=interpolation_samples)
-            self.traces.append(cur_trace)
+        for _id in list(traces_dict.keys()):
+            self.traces.append(_merge_traces(
+                traces_dict.pop(_id), method=method, fill_value=fill_value,
+                interpolation_samples=interpolation_samples))
 
         # trying to restore order, newly created traces are placed at
         # start
@@ -2053,8 +2296,59 @@ seismometer_correction_simulation.html#using-a-resp-file>`_.
                         simulate_sensitivity=simulate_sensitivity, **kwargs)
         return self
 
+    def _process_traces(self, method, args=(), kwargs=None, n_jobs=1,
+                        executor='thread'):
+        """
+        Call a processing method of all traces, optionally concurrently.
+
+        :type method: str
+        :param method: Name of the :class:`~obspy.core.trace.Trace` method.
+        :type args: tuple
+        :param args: Positional arguments passed on to the method.
+        :type kwargs: dict
+        :param kwargs: Keyword arguments passed on to the method.
+        :type n_jobs: int
+        :param n_jobs: Number of traces processed concurrently, ``-1`` uses
+            one job per CPU.
+        :type executor: str
+        :param executor: ``'thread'`` or ``'process'``.
+        """
+        kwargs = kwargs or {}
+        n_jobs = _get_n_jobs(n_jobs, executor, len(self.traces))
+        if n_jobs <= 1:
+            for tr in self:
+                getattr(tr, method)(*args, **kwargs)
+            return self
+        # fast_path() and processing_dtype() only apply to the current
+        # thread, pass them on to the workers
+        settings = trace_module._get_processing_settings()
+        if executor == 'thread':
+            def process(tr):
+                with trace_module._processing_settings(**settings):
+                    getattr(tr, method)(*args, **kwargs)
+            pool = ThreadPool(n_jobs)
+            try:
+                pool.map(process, self.traces)
+            finally:
+                pool.close()
+            return self
+        pool = multiprocessing.Pool(n_jobs)
+        try:
+            results = pool.map(
+                _call_trace_method,
+                [(tr, method, args, kwargs, settings)
+                 for tr in self.traces])
+        finally:
+            pool.close()
+            pool.join()
+        # update the original trace objects in place
+        for tr, result in zip(self.traces, results):
+            tr.stats = result.stats
+            tr.data = result.data
+        return self
+
     @raise_if_masked
-    def filter(self, type, **options):
+    def filter(self, type, n_jobs=1, executor='thread', **options):
         """
         Filter the data of all traces in the Stream.
 
@@ -2065,6 +2359,37 @@ seismometer_correction_simulation.html#using-a-resp-file>`_.
         :param options: Necessary keyword arguments for the respective filter
             that will be passed on. (e.g. ``freqmin=1.0``, ``freqmax=20.0`` for
             ``"bandpass"``)
+        :type n_jobs: int, optional
+        :param n_jobs: Number of traces processed concurrently. ``-1`` uses
+            one job per CPU. Defaults to ``1`` (serial processing).
+        :type executor: str, optional
+        :param executor: ``'thread'`` (default) processes the traces in a
+            thread pool, ``'process'`` in a pool of worker processes.
+
+        .. note::
+
+            ``n_jobs``/``executor`` are also available for
+            :meth:`~obspy.core.stream.Stream.detrend`,
+            :meth:`~obspy.core.stream.Stream.taper`,
+            :meth:`~obspy.core.stream.Stream.resample`,
+            :meth:`~obspy.core.stream.Stream.decimate`,
+            :meth:`~obspy.core.stream.Stream.interpolate` and
+            :meth:`~obspy.core.stream.Stream.remove_response`.
+            The order of the traces and the processing information in
+            ``stats.processing`` are the same as for serial processing.
+            Threads work well for the filtering, resampling and FFT based
+            routines because NumPy and SciPy release the GIL in their
+            numerical kernels. Worker processes avoid the GIL completely but
+            have to pickle every trace in both directions, they only pay off
+            for long traces and expensive, Python heavy processing.
+
+        .. note::
+
+            With serial processing, traces with the same sampling rate and
+            number of samples are filtered together as rows of one 2-D array
+            for the Butterworth and ``'lowpass_cheby_2'`` filters, which is
+            faster for many short traces. The results are the same as for
+            filtering each trace on its own.
 
         .. note::
 
@@ -2114,8 +2439,44 @@ seismometer_correction_simulation.html#using-a-resp-file>`_.
             st.filter("highpass", freq=1.0)
             st.plot()
         """
+        if _get_n_jobs(n_jobs, executor, len(self.traces)) <= 1 and \
+                type.lower() in BATCHED_FILTER_TYPES and \
+                'axis' not in options:
+            return self._filter_batched(type, options)
+        return self._process_traces('filter', (type,), options,
+                                    n_jobs=n_jobs, executor=executor)
+
+    def _filter_batched(self, type, options):
+        """
+        Filters traces with equal sampling rate and number of samples with
+        one call of the filter function on a 2-D array.
+        """
+        groups = {}
+        for tr in self:
+            # traces with masked values are left to Trace.filter(), which
+            # raises for them
+            if len(tr.data) and not np.ma.is_masked(tr.data):
+                key = (tr.stats.sampling_rate, len(tr.data))
+                groups.setdefault(key, []).append(tr)
+        batched = set(id(tr) for traces in groups.values()
+                      if len(traces) > 1 for tr in traces)
         for tr in self:
-            tr.filter(type, **options)
+            if id(tr) not in batched:
+                tr.filter(type, **options)
+        func = _get_function_from_entry_point('filter', type.lower())
+        for (sampling_rate, _), traces in sorted(groups.items()):
+            if len(traces) == 1:
+                continue
+            data = np.vstack([tr.data for tr in traces])
+            data = func(data, df=sampling_rate, axis=-1, **options)
+            dtype = trace_module._PROCESSING_SETTINGS.dtype
+            if dtype is not None and data.dtype != dtype:
+                data = np.require(data, dtype=dtype)
+            info = _get_processing_info(Trace.filter, (traces[0], type),
+                                        options)
+            for tr, row in zip(traces, data):
+                tr.data = row
+                tr._internal_add_processing_info(info)
         return self
 
     def trigger(self, type, **options):
@@ -2191,9 +2552,11 @@ seismometer_correction_simulation.html#using-a-resp-file>`_.
         return self
 
     def resample(self, sampling_rate, window='hanning', no_filter=True,
-                 strict_length=False):
+                 strict_length=False, method='fft', n_jobs=1,
+                 executor='thread'):
         """
-        Resample data in all traces of stream using Fourier method.
+        Resample data in all traces of stream using Fourier method or
+        polyphase filtering.
 
         :type sampling_rate: float
         :param sampling_rate: The sampling rate of the resampled signal.
@@ -2207,6 +2570,16 @@ seismometer_correction_simulation.html#using-a-resp-file>`_.
         :type strict_length: bool, optional
         :param strict_length: Leave traces unchanged for which end time of
             trace would change. Defaults to ``False``.
+        :type method: str, optional
+        :param method: ``'fft'`` (default) or ``'polyphase'``, see
+            :meth:`obspy.core.trace.Trace.resample`.
+        :type n_jobs: int, optional
+        :param n_jobs: Number of traces processed concurrently. ``-1`` uses
+            one job per CPU. Defaults to ``1`` (serial processing).
+        :type executor: str, optional
+        :param executor: ``'thread'`` (default) processes the traces in a
+            thread pool, ``'process'`` in a pool of worker processes. See
+            :meth:`~obspy.core.stream.Stream.filter` for details.
 
         .. note::
 
@@ -2226,8 +2599,9 @@ seismometer_correction_simulation.html#using-a-resp-file>`_.
             This also makes an entry with information on the applied processing
             in ``stats.processing`` of every trace.
 
-        Uses :func:`scipy.signal.resample`. Because a Fourier method is used,
-        the signal is assumed to be periodic.
+        With ``method='fft'`` a Fourier method is used like in
+        :func:`scipy.signal.resample` and the signal is assumed to be
+        periodic.
 
         .. rubric:: Example
 
@@ -2245,12 +2619,14 @@ seismometer_correction_simulation.html#using-a-resp-file>`_.
         BW.RJOB..EHN | 2009-08-24T00:20:03.000000Z ... | 10.0 Hz, 300 samples
         BW.RJOB..EHE | 2009-08-24T00:20:03.000000Z ... | 10.0 Hz, 300 samples
         """
-        for tr in self:
-            tr.resample(sampling_rate, window=native_str(window),
-                        no_filter=no_filter, strict_length=strict_length)
-        return self
+        return self._process_traces(
+            'resample', (sampling_rate,),
+            dict(window=native_str(window), no_filter=no_filter,
+                 strict_length=strict_length, method=method),
+            n_jobs=n_jobs, executor=executor)
 
-    def decimate(self, factor, no_filter=False, strict_length=False):
+    def decimate(self, factor, no_filter=False, strict_length=False,
+                 n_jobs=1, executor='thread'):
         """
         Downsample data in all traces of stream by an integer factor.
 
@@ -2263,6 +2639,13 @@ seismometer_correction_simulation.html#using-a-resp-file>`_.
         :type strict_length: bool, optional
         :param strict_length: Leave traces unchanged for which end time of
             trace would change. Defaults to ``False``.
+        :type n_jobs: int, optional
+        :param n_jobs: Number of traces processed concurrently. ``-1`` uses
+            one job per CPU. Defaults to ``1`` (serial processing).
+        :type executor: str, optional
+        :param executor: ``'thread'`` (default) processes the traces in a
+            thread pool, ``'process'`` in a pool of worker processes. See
+            :meth:`~obspy.core.stream.Stream.filter` for details.
 
         Currently a simple integer decimation is implemented.
         Only every decimation_factor-th sample remains in the trace, all other
@@ -2313,10 +2696,10 @@ seismometer_correction_simulation.html#using-a-resp-file>`_.
         >>> tr.data
         array([0, 4, 8])
         """
-        for tr in self:
-            tr.decimate(factor, no_filter=no_filter,
-                        strict_length=strict_length)
-        return self
+        return self._process_traces(
+            'decimate', (factor,),
+            dict(no_filter=no_filter, strict_length=strict_length),
+            n_jobs=n_jobs, executor=executor)
 
     def max(self):
         """
@@ -2394,17 +2777,21 @@ seismometer_correction_simulation.html#using-a-resp-file>`_.
         return self
 
     @raise_if_masked
-    def detrend(self, type='simple', **options):
+    def detrend(self, type='simple', n_jobs=1, executor='thread', **options):
         """
         Remove a trend from all traces.
 
         For details see the corresponding
         :meth:`~obspy.core.trace.Trace.detrend` method of
         :class:`~obspy.core.trace.Trace`.
+
+        Traces can be processed concurrently with the ``n_jobs`` and
+        ``executor`` keyword arguments, see
+        :meth:`~obspy.core.stream.Stream.filter`.
         """
-        for tr in self:
-            tr.detrend(type=type, **options)
-        return self
+        options['type'] = type
+        return self._process_traces('detrend', kwargs=options,
+                                    n_jobs=n_jobs, executor=executor)
 
     def taper(self, *args, **kwargs):
         """
@@ -2413,6 +2800,10 @@ seismometer_correction_simulation.html#using-a-resp-file>`_.
         For details see the corresponding :meth:`~obspy.core.trace.Trace.taper`
         method of :class:`~obspy.core.trace.Trace`.
 
+        Traces can be processed concurrently with the ``n_jobs`` and
+        ``executor`` keyword arguments, see
+        :meth:`~obspy.core.stream.Stream.filter`.
+
         .. note::
 
             This operation is performed in place on the actual data arrays. The
@@ -2420,9 +2811,10 @@ seismometer_correction_simulation.html#using-a-resp-file>`_.
             original data, use :meth:`~obspy.core.stream.Stream.copy` to create
             a copy of your stream object.
         """
-        for tr in self:
-            tr.taper(*args, **kwargs)
-        return self
+        n_jobs = kwargs.pop('n_jobs', 1)
+        executor = kwargs.pop('executor', 'thread')
+        return self._process_traces('taper', args, kwargs, n_jobs=n_jobs,
+                                    executor=executor)
 
     def interpolate(self, *args, **kwargs):
         """
@@ -2432,6 +2824,10 @@ seismometer_correction_simulation.html#using-a-resp-file>`_.
         :meth:`~obspy.core.trace.Trace.interpolate` method of
         :class:`~obspy.core.trace.Trace`.
 
+        Traces can be processed concurrently with the ``n_jobs`` and
+        ``executor`` keyword arguments, see
+        :meth:`~obspy.core.stream.Stream.filter`.
+
         .. note::
 
             The :class:`~Stream` object has three different methods to change
@@ -2463,9 +2859,10 @@ seismometer_correction_simulation.html#using-a-resp-file>`_.
         BW.RJOB..EHN | 2009-08-24T00:20:03... - ... | 111.1 Hz, 3332 samples
         BW.RJOB..EHE | 2009-08-24T00:20:03... - ... | 111.1 Hz, 3332 samples
         """
-        for tr in self:
-            tr.interpolate(*args, **kwargs)
-        return self
+        n_jobs = kwargs.pop('n_jobs', 1)
+        executor = kwargs.pop('executor', 'thread')
+        return self._process_traces('interpolate', args, kwargs,
+                                    n_jobs=n_jobs, executor=executor)
 
     def std(self):
         """
@@ -3036,6 +3433,10 @@ seismometer_correction_simulation.html#using-a-resp-file>`_.
         :meth:`~obspy.core.trace.Trace.remove_response` method of
         :class:`~obspy.core.trace.Trace`.
 
+        Traces can be processed concurrently with the ``n_jobs`` and
+        ``executor`` keyword arguments, see
+        :meth:`~obspy.core.stream.Stream.filter`.
+
         >>> from obspy import read, read_inventory
         >>> st = read()
         >>> inv = read_inventory()
@@ -3058,9 +3459,10 @@ seismometer_correction_simulation.html#using-a-resp-file>`_.
             original data, use :meth:`~obspy.core.stream.Stream.copy` to create
             a copy of your stream object.
         """
-        for tr in self:
-            tr.remove_response(*args, **kwargs)
-        return self
+        n_jobs = kwargs.pop('n_jobs', 1)
+        executor = kwargs.pop('executor', 'thread')
+        return self._process_traces('remove_response', args, kwargs,
+                                    n_jobs=n_jobs, executor=executor)
 
     def remove_sensitivity(self, *args, **kwargs):
         """
@@ -3333,6 +3735,177 @@ seismometer_correction_simulation.html#using-a-resp-file>`_.
         return self
 
 
+def _merge_traces(traces, method=0, fill_value=None,
+                  interpolation_samples=0):
+    """
+    Merges traces with the same id, sorted by start time, into one trace.
+
+    The result is the same as adding the traces one after the other with
+    :meth:`~obspy.core.trace.Trace.__add__`. The data pieces of all traces
+    and of gaps and overlaps are only collected and concatenated once at the
+    end instead of for every pair of traces. Only overlaps interpolated with
+    ``method=1`` and overlaps of masked data are added with
+    :meth:`~obspy.core.trace.Trace.__add__`.
+
+    See :meth:`Stream.merge` for the parameters.
+    """
+    cur_trace = traces[0]
+    pieces = [cur_trace.data]
+    npts = len(cur_trace)
+    for trace in traces[1:]:
+        # Same computation of the gap as in Trace.__add__().
+        stats = cur_trace.stats
+        endtime = stats.starttime + float(npts - 1) * stats.delta
+        delta = (trace.stats.starttime - endtime) * stats.sampling_rate
+        delta = int(compatibility.round_away(delta)) - 1
+        if delta < 0:
+            contained = endtime - trace.stats.endtime >= 0
+            if _merge_overlap(pieces, trace, -delta, contained, method,
+                              fill_value, interpolation_samples):
+                if not contained:
+                    npts += len(trace) + delta
+                continue
+            # disable sanity checks because they are already done
+            cur_trace = _concatenate_traces(cur_trace, pieces).__add__(
+                trace, method, fill_value=fill_value, sanity_checks=False,
+                interpolation_samples=interpolation_samples)
+            pieces = [cur_trace.data]
+            npts = len(cur_trace)
+            continue
+        if delta > 0:
+            # gap - use fixed value or interpolate in between
+            if fill_value == "latest":
+                value = pieces[-1][-1]
+            elif fill_value == "interpolate":
+                value = (pieces[-1][-1], trace.data[0])
+            else:
+                value = fill_value
+            pieces.append(create_empty_data_chunk(
+                delta, cur_trace.data.dtype, value))
+            npts += delta
+        pieces.append(trace.data)
+        npts += len(trace)
+    return _concatenate_traces(cur_trace, pieces)
+
+
+def _merge_overlap(pieces, trace, overlap, contained, method, fill_value,
+                   interpolation_samples):
+    """
+    Merges a trace overlapping the last ``overlap`` samples of the data
+    pieces in the same way as :meth:`~obspy.core.trace.Trace.__add__` does
+    it, i.e. overlapping samples with differing data are replaced by the fill
+    value (``method=0``) or by the data of the following trace
+    (``method=1``).
+
+    Returns ``False`` without changing the pieces for overlaps interpolated
+    with ``method=1`` and for overlaps of masked data, these are left to
+    :meth:`~obspy.core.trace.Trace.__add__`.
+    """
+    data = trace.data
+    if method not in (0, 1) or isinstance(data, np.ma.masked_array):
+        return False
+    if method == 1 and not contained and interpolation_samples != 0:
+        return False
+    tail = _pop_samples(pieces, overlap)
+    if isinstance(tail, np.ma.masked_array):
+        pieces.append(tail)
+        return False
+    if fill_value == "latest":
+        fill_value = tail[-1]
+    elif fill_value == "interpolate":
+        fill_value = (tail[-1], data[0])
+    if not contained:
+        if method == 0 and not np.all(np.equal(tail, data[:overlap])):
+            pieces.append(create_empty_data_chunk(overlap, tail.dtype,
+                                                  fill_value))
+            pieces.append(data[overlap:])
+        else:
+            pieces.append(data)
+    elif method == 0 and not np.all(np.equal(tail[:len(data)], data)):
+        pieces.append(create_empty_data_chunk(len(data), tail.dtype,
+                                              fill_value))
+        if len(tail) > len(data):
+            pieces.append(tail[len(data):])
+    else:
+        # contained trace with the same data or method 1
+        pieces.append(tail)
+    return True
+
+
+def _pop_samples(pieces, npts):
+    """
+    Removes the last ``npts`` samples from a list of data pieces and returns
+    them as one array.
+    """
+    tail = []
+    while npts > 0:
+        piece = pieces.pop()
+        if len(piece) > npts:
+            pieces.append(piece[:-npts])
+            piece = piece[-npts:]
+        tail.append(piece)
+        npts -= len(piece)
+    tail.reverse()
+    if any(isinstance(piece, np.ma.masked_array) for piece in tail):
+        return np.ma.concatenate(tail)
+    return np.concatenate(tail)
+
+
+# filter types of Stream.filter() processed as 2-D arrays
+BATCHED_FILTER_TYPES = ('bandpass', 'bandstop', 'lowpass', 'highpass',
+                        'lowpass_cheby_2')
+
+
+def _get_n_jobs(n_jobs, executor, n_tasks):
+    """
+    Check the ``n_jobs`` and ``executor`` arguments and return the number of
+    jobs to use for the given number of tasks.
+    """
+    if executor not in ('thread', 'process'):
+        msg = "executor must be 'thread' or 'process', not '%s'" % executor
+        raise ValueError(msg)
+    if n_jobs is None:
+        n_jobs = 1
+    if n_jobs < 0:
+        n_jobs = multiprocessing.cpu_count()
+    return min(n_jobs, n_tasks)
+
+
+def _call_trace_method(args):
+    """
+    Call a method of a trace and return the processed trace.
+
+    Helper for processing traces in worker processes, see
+    :meth:`Stream._process_traces`.
+    """
+    trace, method, args, kwargs, settings = args
+    with trace_module._processing_settings(**settings):
+        getattr(trace, method)(*args, **kwargs)
+    return trace
+
+
+def _concatenate_traces(trace, pieces):
+    """
+    Returns a copy of the trace with the concatenated data pieces in the
+    same way as :meth:`~obspy.core.trace.Trace.__add__` does it.
+    """
+    if len(pieces) == 1 and pieces[0] is trace.data:
+        return trace
+    out = trace.__class__(header=copy.deepcopy(trace.stats))
+    # merge traces depending on NumPy array type
+    if any(isinstance(_i, np.ma.masked_array) for _i in pieces):
+        data = np.ma.concatenate(pieces)
+    else:
+        data = np.concatenate(pieces)
+        data = np.require(data, dtype=trace.data.dtype)
+    # Check if we can downgrade to normal ndarray
+    if isinstance(data, np.ma.masked_array) and \
+            np.ma.count_masked(data) == 0:
+        data = data.compressed()
+    out.data = data
+    return out
+
+
 def _is_pickle(filename):  # @UnusedVariable
     """
     Check whether a file is a pickled ObsPy Stream file.
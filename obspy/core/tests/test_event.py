@@ -480,6 +480,21 @@ class CatalogTestCase(unittest.TestCase):
             self.assertTrue(all(event in cat_smaller
                                 for event in cat_bigger_inverse))
 
+    def test_filter_time_out_of_int64_range(self):
+        """
+        Filtering by time also works for origin times that can not be
+        represented as int64 nanoseconds, i.e. before 1678 or after 2261.
+        """
+        cat = read_events()
+        cat[0].origins[0].time = UTCDateTime(1500, 1, 1)
+        cat[1].origins[0].time = UTCDateTime(2500, 1, 1)
+        self.assertEqual(cat.filter('time < 1600-01-01').events, [cat[0]])
+        self.assertEqual(cat.filter('time > 2400-01-01').events, [cat[1]])
+        self.assertEqual(cat.filter('time > 1600-01-01',
+                                    'time < 2400-01-01').events, [cat[2]])
+        self.assertEqual(cat.filter('time >= 1000-01-01').events, cat.events)
+        self.assertEqual(cat[2:].filter('time < 1600-01-01').events, [])
+
     def test_catalog_resource_id(self):
         """
         See #662
@@ -24,8 +24,10 @@ import scipy.interpolate
 from matplotlib import rcParams
 
 from obspy import UTCDateTime, read_inventory
+from obspy.core.inventory import response as response_module
 from obspy.core.inventory.response import (
-    _pitick2latex, PolesZerosResponseStage, PolynomialResponseStage)
+    _pitick2latex, clear_response_cache, get_response_cache_info,
+    PolesZerosResponseStage, PolynomialResponseStage)
 from obspy.core.util import MATPLOTLIB_VERSION
 from obspy.core.util.misc import CatchOutput
 from obspy.core.util.obspy_types import ComplexWithUncertainties
@@ -368,6 +370,68 @@ class ResponseTestCase(unittest.TestCase):
             "\tNumber of coefficients: 0"
         )
 
+    def test_response_cache(self):
+        """
+        Evaluated responses are cached by content and parameters.
+        """
+        filename = os.path.join(self.data_dir,
+                                "IRIS_single_channel_with_response.xml")
+        # evalresp() of RESP files
+        parser = Parser(filename.replace(".xml", ".seed"))
+        # older systems don't like an end date in the year 2599
+        parser.blockettes[50][0].end_effective_date = None
+        parser.blockettes[52][0].end_date = None
+        resp_file = parser.get_resp()[0][-1]
+        resp_file.seek(0, 0)
+        clear_response_cache()
+        kwargs = dict(t_samp=0.05, nfft=4096, date=UTCDateTime(2013, 1, 1),
+                      station="ANMO", channel="BHZ", network="IU",
+                      locid="10", units="VEL")
+        expected = evalresp(filename=resp_file, **kwargs)
+        resp_file.seek(0, 0)
+        got, freqs = evalresp(filename=resp_file, freq=True, **kwargs)
+        np.testing.assert_array_equal(got, expected)
+        self.assertEqual(len(freqs), len(got))
+        self.assertEqual(resp_file.tell(), 0)
+        info = get_response_cache_info()
+        self.assertEqual((info['hits'], info['misses']), (1, 1))
+        # responses of inventories
+        response = read_inventory(filename)[0][0][0].response
+        clear_response_cache()
+        expected, freqs = response.get_evalresp_response(0.05, 4096)
+        # callers get copies of the cached response
+        expected[:] = 0.0
+        expected, freqs = response.get_evalresp_response(0.05, 4096)
+        self.assertEqual(get_response_cache_info(), {
+            'hits': 1, 'misses': 1, 'size': 1,
+            'maxsize': response_module.RESPONSE_CACHE_SIZE})
+        self.assertTrue(np.any(expected))
+        # the same response read again is found in the cache
+        response2 = read_inventory(filename)[0][0][0].response
+        got, _ = response2.get_evalresp_response(0.05, 4096)
+        np.testing.assert_array_equal(got, expected)
+        self.assertEqual(get_response_cache_info()['hits'], 2)
+        # other parameters or a changed response are evaluated anew
+        response.get_evalresp_response(0.05, 4096, output="DISP")
+        response.get_evalresp_response(0.05, 2048)
+        response.get_evalresp_response(0.1, 4096)
+        response2.response_stages[0].stage_gain *= 2
+        got, _ = response2.get_evalresp_response(0.05, 4096)
+        np.testing.assert_allclose(got, 2 * expected)
+        info = get_response_cache_info()
+        self.assertEqual((info['hits'], info['misses'], info['size']),
+                         (2, 5, 5))
+        # the cache is bounded
+        size = response_module.RESPONSE_CACHE_SIZE
+        try:
+            response_module.RESPONSE_CACHE_SIZE = 2
+            response.get_evalresp_response(0.05, 1024)
+            self.assertEqual(get_response_cache_info()['size'], 2)
+        finally:
+            response_module.RESPONSE_CACHE_SIZE = size
+        clear_response_cache()
+        self.assertEqual(get_response_cache_info()['size'], 0)
+
 
 def suite():
     return unittest.makeSuite(ResponseTestCase, 'test')
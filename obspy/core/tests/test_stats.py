@@ -228,6 +228,63 @@ class StatsTestCase(unittest.TestCase):
         self.assertEqual(ad, adict)
         self.assertEqual(adict, ad)
 
+    def test_default_attributes_in_slots(self):
+        """
+        Default attributes are not stored in the instance dictionary.
+        """
+        stats = Stats({'network': 'BW', 'npts': 10, 'mseed': {'a': 1}})
+        self.assertEqual(list(stats.__dict__.keys()), ['mseed'])
+        self.assertEqual(len(stats), 11)
+        self.assertEqual(
+            sorted(stats.keys()),
+            sorted(list(Stats.defaults.keys()) + ['mseed']))
+        self.assertEqual(stats['network'], 'BW')
+        self.assertEqual(stats.get('station'), '')
+        self.assertIsInstance(stats.mseed, AttribDict)
+        self.assertRaises(AttributeError, getattr, stats, 'sac')
+        self.assertRaises(KeyError, stats.__getitem__, 'sac')
+        # deleting a default attribute resets it to the default value
+        del stats.network
+        self.assertEqual(stats.network, '')
+        self.assertRaises(AttributeError, stats.__delitem__, 'endtime')
+        del stats['mseed']
+        self.assertNotIn('mseed', stats)
+
+    def test_endtime_cached(self):
+        """
+        The end time is recalculated after changing its derived values.
+        """
+        stats = Stats({'starttime': UTCDateTime(2000, 1, 1), 'npts': 11})
+        self.assertEqual(stats.endtime, UTCDateTime(2000, 1, 1, 0, 0, 10))
+        self.assertIs(stats.endtime, stats.endtime)
+        stats.sampling_rate = 2.0
+        self.assertEqual(stats.endtime, UTCDateTime(2000, 1, 1, 0, 0, 5))
+        stats.npts = 21
+        self.assertEqual(stats['endtime'], UTCDateTime(2000, 1, 1, 0, 0, 10))
+        stats.starttime += 1
+        self.assertEqual(stats.endtime, UTCDateTime(2000, 1, 1, 0, 0, 11))
+        stats.sampling_rate = 0
+        self.assertEqual(stats.delta, 0)
+        self.assertEqual(stats.endtime, stats.starttime)
+        stats2 = copy.deepcopy(stats)
+        self.assertEqual(stats2.endtime, stats.endtime)
+
+    def test_unpickle_old_stats_state(self):
+        """
+        Pickled states of Stats objects storing all attributes in the
+        instance dictionary can still be loaded.
+        """
+        state = {'network': 'BW', 'station': '', 'location': '',
+                 'channel': '', 'starttime': UTCDateTime(2000, 1, 1),
+                 'endtime': UTCDateTime(2000, 1, 1, 0, 0, 9),
+                 'sampling_rate': 2.0, 'delta': 0.5, 'npts': 19,
+                 'calib': 1.0, 'processing': ['info']}
+        stats = Stats.__new__(Stats)
+        stats.__setstate__(state)
+        self.assertEqual(stats, Stats(state))
+        self.assertEqual(stats.endtime, state['endtime'])
+        self.assertEqual(list(stats.__dict__.keys()), ['processing'])
+
 
 def suite():
     return unittest.makeSuite(StatsTestCase, 'test')
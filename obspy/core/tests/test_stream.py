@@ -14,7 +14,9 @@ import numpy as np
 
 from obspy import Stream, Trace, UTCDateTime, read, read_inventory
 from obspy.core.compatibility import mock
+from obspy.core.inventory.response import clear_response_cache
 from obspy.core.stream import _is_pickle, _read_pickle, _write_pickle
+from obspy.core.trace import processing_dtype
 from obspy.core.util.attribdict import AttribDict
 from obspy.core.util.base import NamedTemporaryFile
 from obspy.io.xseed import Parser
@@ -1876,6 +1878,246 @@ class StreamTestCase(unittest.TestCase):
         st.merge(fill_value='interpolate')
         self.assertEqual(len(st), 1)
 
+    def test_merge_many_traces_same_as_pairwise_add(self):
+        """
+        Merging many traces gives the same result as adding them one after
+        the other, for gaps, exact fits and overlaps.
+        """
+        start = UTCDateTime(2017, 1, 1)
+        traces = []
+        position = 0
+        for _i in range(300):
+            data = np.random.randint(-100, 100, 10).astype(np.int32)
+            if _i % 50 == 7:
+                # overlap with identical data
+                position -= 2
+                data[:2] = traces[-1].data[-2:]
+            elif _i % 50 == 23:
+                # trace contained in the previous trace
+                position -= 8
+                data = data[:5]
+                if _i % 100 == 23:
+                    data[:] = traces[-1].data[2:7]
+            elif _i:
+                # mostly continuous data with some gaps and overlaps
+                position += np.random.choice([0, 0, 0, 3, -2, -12])
+            traces.append(Trace(data=data, header={
+                'station': 'MERGE', 'sampling_rate': 10.0,
+                'starttime': start + position * 0.1}))
+            position += 10
+        for method, interpolation_samples in ((0, 0), (1, 0), (1, 2)):
+            for fill_value in (None, 0, 'latest', 'interpolate'):
+                kwargs = dict(method=method, fill_value=fill_value,
+                              interpolation_samples=interpolation_samples)
+                st = Stream(traces=deepcopy(traces))
+                st.merge(**kwargs)
+                expected = sorted(
+                    deepcopy(traces),
+                    key=lambda x: (x.stats.starttime, x.stats.endtime))
+                cur = expected[0]
+                for tr in expected[1:]:
+                    cur = cur.__add__(tr, **kwargs)
+                self.assertEqual(len(st), 1)
+                self.assertEqual(st[0].stats, cur.stats)
+                self.assertEqual(type(st[0].data), type(cur.data))
+                self.assertEqual(st[0].data.dtype, cur.data.dtype)
+                np.testing.assert_array_equal(st[0].data, cur.data)
+                if isinstance(cur.data, np.ma.masked_array):
+                    np.testing.assert_array_equal(st[0].data.mask,
+                                                  cur.data.mask)
+        # unless interpolated, overlaps do not need intermediate traces
+        from obspy.core import stream as stream_module
+        for kwargs in (dict(method=0, fill_value=0), dict(method=1)):
+            st = Stream(traces=deepcopy(traces))
+            with mock.patch("obspy.core.stream._concatenate_traces",
+                            wraps=stream_module._concatenate_traces) as patch:
+                st.merge(**kwargs)
+            self.assertEqual(patch.call_count, 1)
+
+    def test_sliding_windows(self):
+        """
+        The windows of all traces start at common times.
+        """
+        st = read()
+        st[1].stats.starttime += 2.5
+        st[2].stats.starttime -= 1.0
+        result = st.sliding_windows(window_length=4.0, step=3.0)
+        self.assertEqual(len(result), 3)
+        start = st[2].stats.starttime.timestamp
+        for tr, (windows, times) in zip(st, result):
+            self.assertEqual(windows.shape[1], 401)
+            self.assertEqual(len(windows), len(times))
+            self.assertGreaterEqual(times[0], tr.stats.starttime.timestamp)
+            self.assertLess(times[0], tr.stats.starttime.timestamp + 3.0)
+            steps = (times - start) / 3.0
+            np.testing.assert_allclose(steps, np.round(steps), atol=1e-6)
+
+    def test_to_array_and_from_array(self):
+        """
+        Tests aligning the traces in an array and creating traces from it.
+        """
+        st = read()
+        data, headers = st.to_array()
+        self.assertEqual(data.shape, (3, 3000))
+        self.assertTrue(data.flags.c_contiguous)
+        self.assertNotIsInstance(data, np.ma.masked_array)
+        for row, tr in zip(data, st):
+            np.testing.assert_array_equal(row, tr.data)
+        st2 = Stream.from_array(data, headers)
+        self.assertEqual(st2, st)
+        # The traces are views of the array.
+        st2[1].data[10] = 12345
+        self.assertEqual(data[1, 10], 12345)
+
+        # Shifted traces are padded and snapped to the nearest sample.
+        st[0].stats.starttime += 0.5 + 0.004
+        st[2].stats.starttime -= 0.2 - 0.003
+        data, headers = st.to_array(fill_value=0)
+        self.assertEqual(data.shape, (3, 3070))
+        start = st[2].stats.starttime
+        self.assertEqual(headers[0].starttime, start)
+        np.testing.assert_array_equal(data[2, :3000], st[2].data)
+        np.testing.assert_array_equal(data[1, 20:3020], st[1].data)
+        np.testing.assert_array_equal(data[0, 70:], st[0].data)
+        np.testing.assert_array_equal(data[0, :70], 0)
+        # With nearest_sample=False samples are moved to the next sample.
+        data, _ = st.to_array(fill_value=0, nearest_sample=False)
+        np.testing.assert_array_equal(data[1, 20:3020], st[1].data)
+        np.testing.assert_array_equal(data[0, 71:], st[0].data[:-1])
+
+        # The time span can be trimmed. Without a fill value missing
+        # samples are masked.
+        data, headers = st.to_array(starttime=start + 1, endtime=start + 2)
+        self.assertNotIsInstance(data, np.ma.masked_array)
+        self.assertEqual(data.shape, (3, 101))
+        self.assertEqual(headers[1].starttime, start + 1)
+        data, _ = st.to_array(endtime=start + 0.5)
+        self.assertIsInstance(data, np.ma.masked_array)
+        self.assertEqual(data.mask[0].sum(), 51)
+        self.assertEqual(data.mask[1].sum(), 20)
+        self.assertEqual(data.mask[2].sum(), 0)
+
+        st[1].stats.sampling_rate = 50.0
+        self.assertRaises(ValueError, st.to_array)
+
+    def test_processing_with_n_jobs(self):
+        """
+        Tests that concurrent processing of the traces gives the same result
+        as serial processing.
+        """
+        def process(st, **kwargs):
+            st.detrend('linear', **kwargs)
+            st.taper(0.05, **kwargs)
+            st.filter('bandpass', freqmin=1.0, freqmax=20.0, **kwargs)
+            st.decimate(2, **kwargs)
+            st.resample(25.0, **kwargs)
+            st.interpolate(20.0, **kwargs)
+            return st
+
+        st = read()
+        st += read()
+        st[3:].normalize()
+        expected = process(st.copy())
+        for executor in ('thread', 'process'):
+            for n_jobs in (2, -1):
+                st2 = st.copy()
+                ids = [id(tr) for tr in st2]
+                process(st2, n_jobs=n_jobs, executor=executor)
+                self.assertEqual([id(tr) for tr in st2], ids)
+                self.assertEqual(len(st2), len(expected))
+                for tr, tr_expected in zip(st2, expected):
+                    self.assertEqual(tr.stats, tr_expected.stats)
+                    self.assertEqual(tr.stats.processing,
+                                     tr_expected.stats.processing)
+                    np.testing.assert_array_equal(tr.data, tr_expected.data)
+        self.assertRaises(ValueError, st.filter, 'highpass', freq=1.0,
+                          n_jobs=2, executor='cluster')
+
+    def test_remove_response_with_n_jobs(self):
+        """
+        Tests that removing the response in a thread pool gives the same
+        result as serial processing, evalresp must not be called
+        concurrently.
+        """
+        st = Stream()
+        for i in range(8):
+            # different lengths, so every trace evaluates its own response
+            st += read()[i % 3].slice(endtime=UTCDateTime(
+                2009, 8, 24, 0, 20, 20) + i * 0.37)
+        inv = read_inventory()
+        clear_response_cache()
+        expected = st.copy().remove_response(inventory=inv)
+        for _ in range(3):
+            clear_response_cache()
+            st2 = st.copy().remove_response(inventory=inv, n_jobs=4)
+            for tr, tr_expected in zip(st2, expected):
+                np.testing.assert_allclose(tr.data, tr_expected.data)
+
+    def test_processing_dtype(self):
+        """
+        Tests single precision processing of all traces with
+        processing_dtype(), also concurrently in a thread pool.
+        """
+        st = read()
+        expected = st.copy().detrend('linear').taper(0.05).filter(
+            'bandpass', freqmin=1.0, freqmax=20.0)
+        for n_jobs in (1, 2):
+            st2 = st.copy()
+            with processing_dtype(np.float32):
+                st2.detrend('linear', n_jobs=n_jobs)
+                st2.taper(0.05, n_jobs=n_jobs)
+                st2.filter('bandpass', freqmin=1.0, freqmax=20.0,
+                           n_jobs=n_jobs)
+            for tr, tr_expected in zip(st2, expected):
+                self.assertEqual(tr.data.dtype, np.float32)
+                self.assertEqual(tr.stats, tr_expected.stats)
+                np.testing.assert_allclose(
+                    tr.data, tr_expected.data, rtol=0,
+                    atol=1e-6 * np.abs(tr_expected.data).max())
+
+    def test_filter_batched(self):
+        """
+        Traces of equal sampling rate and length are filtered together, the
+        results equal filtering every trace on its own.
+        """
+        st = read()
+        st += read()[:2].decimate(2)
+        st[0].data = st[0].data.astype(np.int32)
+        st += st[1].copy().trim(endtime=st[1].stats.starttime + 10)
+        for type, options in (('bandpass', dict(freqmin=1.0, freqmax=5.0)),
+                              ('lowpass', dict(freq=2.0, zerophase=True)),
+                              ('lowpass_cheby_2', dict(freq=10.0))):
+            got = st.copy().filter(type, **options)
+            for tr_got, tr in zip(got, st):
+                tr = tr.copy().filter(type, **options)
+                self.assertEqual(tr_got.stats, tr.stats)
+                self.assertEqual(tr_got.data.dtype, tr.data.dtype)
+                np.testing.assert_allclose(tr_got.data, tr.data, rtol=1e-12)
+        with processing_dtype(np.float32):
+            got = st.copy().filter('highpass', freq=1.0)
+        self.assertEqual([tr.data.dtype for tr in got if len(tr)],
+                         [np.float32] * 6)
+
+    def test_filter_batched_masked(self):
+        """
+        Traces with masked values are not filtered together with other
+        traces, but raise like for Trace.filter().
+        """
+        st = read()[:2]
+        for tr in st:
+            tr.data = np.ma.masked_array(tr.data, mask=False)
+            tr.data.mask[10:20] = True
+        self.assertRaises(NotImplementedError, st.filter, 'lowpass',
+                          freq=2.0)
+        # masked arrays without masked values are filtered
+        st = read()
+        st[0].data = np.ma.masked_array(st[0].data, mask=False)
+        expected = [tr.copy().filter('lowpass', freq=2.0) for tr in st]
+        st.filter('lowpass', freq=2.0)
+        for tr, tr_expected in zip(st, expected):
+            np.testing.assert_allclose(tr.data, tr_expected.data,
+                                       rtol=1e-12)
+
     def test_rotate(self):
         """
         Testing the rotate method.
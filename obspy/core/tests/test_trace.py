@@ -15,6 +15,8 @@ import numpy.ma as ma
 from obspy import Stream, Trace, UTCDateTime, __version__, read, read_inventory
 from obspy.core import Stats
 from obspy.core.compatibility import mock
+from obspy.core.trace import fast_path, processing_dtype
+from obspy.core.utcdatetime import UTCDateTimeArray
 from obspy.core.util.testing import ImageComparison
 from obspy.io.xseed import Parser
 
@@ -1427,6 +1429,11 @@ class TraceTestCase(unittest.TestCase):
         np.testing.assert_allclose(
             [t_.timestamp for t_ in got[:5]],
             [t_.timestamp for t_ in expected], rtol=1e-17)
+        self.assertTrue(isinstance(got, np.ndarray))
+        self.assertEqual(got.dtype, np.object_)
+        got = tr.times("utcdatetimearray")
+        self.assertTrue(isinstance(got, UTCDateTimeArray))
+        self.assertEqual(got.tolist()[:5], expected.tolist())
         got = tr.times("timestamp")
         expected = np.arange(0, 4.5 * delta, delta) + 946684800.0
         np.testing.assert_allclose(got[:5], expected, rtol=1e-17)
@@ -1711,6 +1718,26 @@ class TraceTestCase(unittest.TestCase):
         tr2.remove_response(pre_filt=(0.1, 0.5, 30, 50))
         np.testing.assert_array_almost_equal(tr1.data, tr2.data)
 
+    def test_remove_response_fir_length(self):
+        """
+        Deconvolution with an equivalent FIR filter converges to the
+        deconvolution in the frequency domain with the filter length.
+        """
+        tr = read()[0]
+        tr.data = np.tile(tr.data, 10)
+        pre_filt = (0.5, 1.0, 40.0, 45.0)
+        expected = tr.copy().remove_response(pre_filt=pre_filt).data
+        scale = np.abs(expected).max()
+        for fir_length, atol in ((5.0, 3e-3), (20.0, 1e-4)):
+            got = tr.copy().remove_response(pre_filt=pre_filt,
+                                            fir_length=fir_length)
+            self.assertEqual(got.stats.npts, tr.stats.npts)
+            np.testing.assert_allclose(got.data[500:-500],
+                                       expected[500:-500], atol=atol * scale)
+        self.assertIn('fir_length=20.0', got.stats.processing[-1])
+        self.assertRaises(ValueError, tr.remove_response, fir_length=10.0,
+                          plot=True)
+
     def test_remove_polynomial_response(self):
         """
         """
@@ -1861,6 +1888,140 @@ class TraceTestCase(unittest.TestCase):
         self.assertRaises(ValueError, tr.decimate, 7, strict_length=True)
         self.assertEqual(tr.stats.processing, [info])
 
+    def test_fast_path(self):
+        """
+        Tests skipping processing information and data checks with
+        fast_path().
+        """
+        tr = Trace(data=np.arange(20, dtype=np.float64))
+        tr2 = tr.copy()
+        with fast_path():
+            tr.detrend().taper(0.1).filter('lowpass', freq=0.2)
+            with fast_path():
+                tr.differentiate()
+            tr.decimate(2)
+        self.assertFalse("processing" in tr.stats)
+        tr2.detrend().taper(0.1).filter('lowpass', freq=0.2)
+        tr2.differentiate().decimate(2)
+        self.assertEqual(len(tr2.stats.processing), 6)
+        np.testing.assert_array_equal(tr.data, tr2.data)
+        # switched off again afterwards, also after an exception
+        try:
+            with fast_path():
+                tr.data = np.ones((2, 2))
+                raise ZeroDivisionError()
+        except ZeroDivisionError:
+            pass
+        self.assertRaises(ValueError, setattr, tr, 'data', np.ones((2, 2)))
+        tr.data = np.arange(10, dtype=np.float64)
+        tr.detrend()
+        self.assertEqual(len(tr.stats.processing), 1)
+
+    def test_processing_settings_in_threads(self):
+        """
+        Tests that fast_path() and processing_dtype() only affect the current
+        thread and are restored also if used interleaved from two threads.
+        """
+        import threading
+        events = [threading.Event() for _ in range(4)]
+        seen = {}
+
+        def worker(name, enter_after, entered, exit_after, exited):
+            if enter_after is not None:
+                events[enter_after].wait(5)
+            with fast_path(), processing_dtype(np.float32):
+                events[entered].set()
+                if exit_after is not None:
+                    events[exit_after].wait(5)
+                tr = Trace(data=np.arange(20, dtype=np.float64))
+                tr.detrend()
+                seen[name] = ('processing' in tr.stats, tr.data.dtype)
+            events[exited].set()
+
+        # A enters, B enters, A exits, B exits
+        threads = [
+            threading.Thread(target=worker, args=('A', None, 0, 1, 2)),
+            threading.Thread(target=worker, args=('B', 0, 1, 2, 3))]
+        for thread in threads:
+            thread.start()
+        # not affected by the other threads
+        events[1].wait(5)
+        tr = Trace(data=np.arange(20, dtype=np.float64))
+        tr.detrend()
+        self.assertEqual(len(tr.stats.processing), 1)
+        self.assertEqual(tr.data.dtype, np.float64)
+        for thread in threads:
+            thread.join()
+        self.assertEqual(seen, {'A': (False, np.float32),
+                                'B': (False, np.float32)})
+        tr.detrend()
+        self.assertEqual(len(tr.stats.processing), 2)
+        self.assertEqual(tr.data.dtype, np.float64)
+        self.assertRaises(ValueError, setattr, tr, 'data', np.ones((2, 2)))
+
+    def test_processing_dtype(self):
+        """
+        Tests keeping processed data in single precision with
+        processing_dtype() and documents the numerical differences to double
+        precision processing.
+        """
+        inv = read_inventory()
+        steps = [
+            ('detrend', {'type': 'linear'}),
+            ('detrend', {'type': 'polynomial', 'order': 3}),
+            ('taper', {'max_percentage': 0.05}),
+            ('filter', {'type': 'bandpass', 'freqmin': 1, 'freqmax': 10}),
+            ('filter', {'type': 'highpass', 'freq': 0.1, 'zerophase': True}),
+            ('resample', {'sampling_rate': 40}),
+            ('decimate', {'factor': 2}),
+            ('interpolate', {'sampling_rate': 50}),
+            ('differentiate', {}),
+            ('integrate', {}),
+            ('normalize', {}),
+            ('remove_response', {'inventory': inv,
+                                 'pre_filt': [0.1, 0.2, 20, 40]}),
+            ('remove_sensitivity', {'inventory': inv})]
+        for data in (read()[0].data, np.arange(3000, dtype=np.int32)):
+            tr = read()[0]
+            tr.data = data
+            tr_float32 = tr.copy()
+            for method, kwargs in steps:
+                getattr(tr, method)(**kwargs)
+                with processing_dtype(np.float32):
+                    getattr(tr_float32, method)(**kwargs)
+                self.assertEqual(tr.data.dtype, np.float64)
+                self.assertEqual(tr_float32.data.dtype, np.float32)
+                self.assertEqual(tr.stats, tr_float32.stats)
+                # only the rounding of the stored data differs, the
+                # differences are below 1e-7 of the maximum amplitude
+                max_amplitude = np.abs(tr.data).max()
+                np.testing.assert_allclose(
+                    tr_float32.data, tr.data, rtol=0,
+                    atol=1e-6 * max_amplitude)
+        # integer results are not converted
+        tr = Trace(data=np.arange(10, dtype=np.int32))
+        with processing_dtype(np.float32):
+            tr.decimate(2, no_filter=True)
+        self.assertEqual(tr.data.dtype, np.int32)
+        # nested usage, resetting and switched off again afterwards
+        tr = Trace(data=np.arange(10, dtype=np.float32))
+        with processing_dtype(np.float32):
+            with processing_dtype(None):
+                tr.filter('lowpass', freq=0.2)
+            self.assertEqual(tr.data.dtype, np.float64)
+            tr.filter('lowpass', freq=0.2)
+            self.assertEqual(tr.data.dtype, np.float32)
+        tr.filter('lowpass', freq=0.2)
+        self.assertEqual(tr.data.dtype, np.float64)
+        with processing_dtype(np.float64):
+            tr.data = np.arange(10, dtype=np.float32)
+            tr.taper(0.1)
+        self.assertEqual(tr.data.dtype, np.float64)
+        # only floating point types are allowed
+        with self.assertRaises(ValueError):
+            with processing_dtype(np.int32):
+                pass
+
     def test_meta(self):
         """
         Tests Trace.meta an alternative to Trace.stats
@@ -2157,6 +2318,36 @@ class TraceTestCase(unittest.TestCase):
         self.assertRaises(ValueError, tr.resample,
                           sampling_rate=0.5, window=window, no_filter=True)
 
+    def test_resample_polyphase(self):
+        """
+        Tests Trace.resample with polyphase filtering.
+        """
+        tr0 = read()[0]
+        # band limited data for the comparison with the Fourier method
+        tr0.filter('lowpass', freq=5.0, corners=8)
+        for sampling_rate in (40.0, 250.0, 20.0):
+            tr = tr0.copy()
+            tr.resample(sampling_rate, method='polyphase')
+            self.assertEqual(tr.stats.sampling_rate, sampling_rate)
+            self.assertEqual(tr.stats.starttime, tr0.stats.starttime)
+            self.assertEqual(tr.stats.npts, int(3000 * sampling_rate / 100))
+            self.assertIn("method='polyphase'", tr.stats.processing[-1])
+            # the Fourier method gives the same away from the edges
+            tr_fft = tr0.copy().resample(sampling_rate, window=None)
+            self.assertEqual(tr_fft.stats.npts, tr.stats.npts)
+            edge = int(sampling_rate)
+            np.testing.assert_allclose(
+                tr.data[edge:-edge], tr_fft.data[edge:-edge],
+                atol=2e-3 * np.abs(tr_fft.data).max())
+        st = read()
+        st.resample(40.0, method='polyphase', n_jobs=2)
+        self.assertEqual([tr.stats.npts for tr in st], [1200] * 3)
+        tr = tr0.copy()
+        self.assertRaises(ValueError, tr.resample, 40.0, method='sinc')
+        self.assertRaises(ValueError, tr.resample, 100.0 / np.pi,
+                          method='polyphase')
+        np.testing.assert_array_equal(tr.data, tr0.data)
+
     def test_slide(self):
         """
         Tests for sliding a window across a trace object.
@@ -2277,6 +2468,40 @@ class TraceTestCase(unittest.TestCase):
         for arg in patch.call_args_list:
             self.assertFalse(arg[1]["nearest_sample"])
 
+    def test_sliding_windows(self):
+        """
+        Tests the array of sliding windows against the windows of slide().
+        """
+        tr = Trace(data=np.linspace(0, 100, 101))
+        tr.stats.starttime = UTCDateTime(0.0)
+        tr.stats.sampling_rate = 5.0
+
+        for kwargs in [dict(window_length=5.0, step=5.0),
+                       dict(window_length=5.0, step=10.0),
+                       dict(window_length=5.0, step=6.4, offset=8.6),
+                       dict(window_length=2.0, step=1.0)]:
+            windows, times = tr.sliding_windows(**kwargs)
+            slices = list(tr.slide(**kwargs))
+            self.assertEqual(windows.shape,
+                             (len(slices), slices[0].stats.npts))
+            self.assertEqual(len(times), len(slices))
+            for window, t, window_tr in zip(windows, times, slices):
+                np.testing.assert_array_equal(window, window_tr.data)
+                self.assertEqual(UTCDateTime(t), window_tr.stats.starttime)
+            # No copy of the data is made and it cannot be modified.
+            self.assertTrue(np.may_share_memory(windows, tr.data))
+            self.assertFalse(windows.flags.writeable)
+
+        # No full window fits.
+        windows, times = tr.sliding_windows(window_length=100.0, step=1.0)
+        self.assertEqual(windows.shape, (0, 501))
+        self.assertEqual(len(times), 0)
+
+        self.assertRaises(ValueError, tr.sliding_windows, 5.0, 0.0)
+        self.assertRaises(ValueError, tr.sliding_windows, 5.0, 1.0, -1.0)
+        tr.data = np.ma.masked_array(tr.data, mask=[True] + [False] * 100)
+        self.assertRaises(NotImplementedError, tr.sliding_windows, 5.0, 1.0)
+
     def test_remove_response_plot(self):
         """
         Tests the plotting option of remove_response().
@@ -2694,6 +2919,52 @@ class TraceTestCase(unittest.TestCase):
         self.assertFalse(tr_opt_out.data.flags['C_CONTIGUOUS'])
         self.assertFalse(tr_opt_out.data.flags['F_CONTIGUOUS'])
 
+    def test_lazy_data(self):
+        """
+        Tests that deferred data is only loaded when accessing Trace.data and
+        that trimming and slicing works without loading it.
+        """
+        class LazyData(object):
+            def __init__(self, data):
+                self._data = data
+                self.dtype = data.dtype
+                self.loaded = False
+
+            def __len__(self):
+                return len(self._data)
+
+            def slice(self, start, stop):
+                return LazyData(self._data[start:stop])
+
+            def load(self):
+                self.loaded = True
+                return self._data.copy()
+
+        data = np.arange(100, dtype=np.int32)
+        tr = Trace(header={'starttime': UTCDateTime(0)})
+        tr._set_lazy_data(LazyData(data))
+        self.assertEqual(tr.stats.npts, 100)
+        self.assertEqual(len(tr), 100)
+        self.assertTrue(tr)
+        self.assertIn('100 samples', str(tr))
+        tr.trim(UTCDateTime(10), UTCDateTime(19.4))
+        sliced = tr.slice(UTCDateTime(12), UTCDateTime(13))
+        self.assertEqual(len(tr), 10)
+        self.assertEqual(tr.stats.starttime, UTCDateTime(10))
+        self.assertEqual(sliced.stats.npts, 2)
+        lazy_data = tr._lazy_data
+        self.assertFalse(lazy_data.loaded)
+        np.testing.assert_array_equal(tr.data, data[10:20])
+        self.assertTrue(lazy_data.loaded)
+        self.assertIsNone(tr._lazy_data)
+        np.testing.assert_array_equal(sliced.data, data[12:14])
+        # Assigning data discards the deferred data.
+        tr = Trace()
+        tr._set_lazy_data(LazyData(data))
+        tr.data = np.ones(3)
+        self.assertIsNone(tr._lazy_data)
+        self.assertEqual(tr.stats.npts, 3)
+
 
 def suite():
     return unittest.makeSuite(TraceTestCase, 'test')
@@ -10,6 +10,8 @@ import unittest
 import numpy as np
 
 from obspy import UTCDateTime
+from obspy.core import utcdatetime as utcdatetime_module
+from obspy.core.utcdatetime import UTCDateTimeArray
 
 
 class UTCDateTimeTestCase(unittest.TestCase):
@@ -1123,6 +1125,162 @@ class UTCDateTimeTestCase(unittest.TestCase):
         self.assertFalse(a == e)
         self.assertFalse(e == a)
 
+    def test_fixed_width_iso8601_fast_path(self):
+        """
+        Tests that the fast path for fixed width ISO8601 strings and the
+        cache of parsed strings give the same results as the full parser.
+        """
+        strings = ["2010-01-01T12:13:14.123456Z", "2010-01-01T12:13:14.5",
+                   "1969-12-31T23:59:59.999999", "2012-02-29T00:00:00",
+                   "2010-01-01", "2010-01-01Z", "1850-03-04T05:06:07.08Z",
+                   "2999-12-31T23:59:59.000001"]
+        for string in strings:
+            for iso8601 in (False, True):
+                expected = UTCDateTime(0)
+                if 'T' in string or iso8601:
+                    expected._from_iso8601_string(string)
+                else:
+                    expected = UTCDateTime(*map(int, string.rstrip('Z')
+                                                .split('-')))
+                utcdatetime_module._STRING_CACHE.clear()
+                got = UTCDateTime(string, iso8601=iso8601)
+                self.assertEqual(got._ns, expected._ns)
+                # second time from the cache
+                self.assertIn((string, iso8601),
+                              utcdatetime_module._STRING_CACHE)
+                got = UTCDateTime(" %s " % string, iso8601=iso8601)
+                self.assertEqual(got._ns, expected._ns)
+        # invalid values still raise
+        for string in ("2010-02-30T00:00:00", "2010-01-01T24:00:00",
+                       "2010-13-01T00:00:00", "2010-01-01T00:60:00"):
+            self.assertRaises(ValueError, UTCDateTime, string)
+            self.assertNotIn((string, False),
+                             utcdatetime_module._STRING_CACHE)
+        # more than seven digits are parsed by the full parser
+        self.assertEqual(UTCDateTime("2010-01-01T00:00:00.0000004"),
+                         UTCDateTime(2010, 1, 1))
+        # the cache is bounded
+        utcdatetime_module._STRING_CACHE.clear()
+        for i in range(utcdatetime_module.STRING_CACHE_SIZE + 10):
+            UTCDateTime(str(UTCDateTime(ns=i * 1000)))
+        self.assertLessEqual(len(utcdatetime_module._STRING_CACHE),
+                             utcdatetime_module.STRING_CACHE_SIZE)
+
+    def test_utcdatetime_array_init(self):
+        """
+        Tests creating UTCDateTimeArray objects and converting them back.
+        """
+        times = [UTCDateTime(2010, 1, 1, 12), UTCDateTime(1999, 12, 31),
+                 UTCDateTime(2017, 5, 3, 4, 5, 6, 125000)]
+        ns = [t._ns for t in times]
+        expected = UTCDateTimeArray(ns=ns)
+        for input_ in (times, [str(t) for t in times],
+                       [t.datetime for t in times],
+                       [t.timestamp for t in times],
+                       np.array([t.timestamp for t in times]),
+                       np.array(ns, dtype='datetime64[ns]'),
+                       expected):
+            got = UTCDateTimeArray(input_)
+            self.assertEqual(got.ns.dtype, np.int64)
+            np.testing.assert_array_equal(got.ns, ns)
+        self.assertIsNot(UTCDateTimeArray(expected).ns, expected.ns)
+        np.testing.assert_array_equal(
+            UTCDateTimeArray(np.array([1, 2])).ns, [10**9, 2 * 10**9])
+        self.assertEqual(len(UTCDateTimeArray()), 0)
+        self.assertRaises(ValueError, UTCDateTimeArray, [[1, 2]])
+        # conversions
+        self.assertEqual(expected.tolist(), times)
+        self.assertEqual(list(expected), times)
+        self.assertEqual(expected[-1], times[-1])
+        self.assertIsInstance(expected[1:], UTCDateTimeArray)
+        self.assertEqual(expected[1:].tolist(), times[1:])
+        np.testing.assert_array_equal(
+            expected.to_datetime64(),
+            np.array([t.datetime for t in times], dtype='datetime64[us]'))
+        np.testing.assert_array_equal(
+            expected.timestamp, [t.timestamp for t in times])
+        self.assertEqual(expected.to_strings().tolist(),
+                         [str(t) for t in times])
+        expected.precision = 3
+        self.assertEqual(expected.to_strings().tolist(),
+                         ['2010-01-01T12:00:00.000Z',
+                          '1999-12-31T00:00:00.000Z',
+                          '2017-05-03T04:05:06.125Z'])
+        expected[0] = "2011-01-01"
+        self.assertEqual(expected[0], UTCDateTime(2011, 1, 1))
+
+    def test_utcdatetime_array_operations(self):
+        """
+        Tests comparison, arithmetic and sorting of UTCDateTimeArray objects.
+        """
+        t = UTCDateTime(2010, 1, 1)
+        times = UTCDateTimeArray([t + 10, t - 10, t, t + 1e-8, t - 1e-6])
+        np.testing.assert_array_equal(
+            times == t, [False, False, True, True, False])
+        np.testing.assert_array_equal(
+            times != t, [True, True, False, False, True])
+        np.testing.assert_array_equal(
+            times < t, [False, True, False, False, True])
+        np.testing.assert_array_equal(
+            times <= t, [False, True, True, True, True])
+        np.testing.assert_array_equal(
+            times > t, [True, False, False, False, False])
+        np.testing.assert_array_equal(
+            times >= t, [True, False, True, True, False])
+        # same as the UTCDateTime comparisons
+        for op in ('__eq__', '__ne__', '__lt__', '__le__', '__gt__',
+                   '__ge__'):
+            np.testing.assert_array_equal(
+                getattr(times, op)(t),
+                [getattr(t_, op)(t) for t_ in times])
+            np.testing.assert_array_equal(
+                getattr(times, op)(times[::-1]),
+                [getattr(t1, op)(t2) for t1, t2 in zip(times, times[::-1])])
+        np.testing.assert_array_equal(times == "2010-01-01T00:00:10",
+                                      [True, False, False, False, False])
+        self.assertFalse(times == None)  # NOQA
+        # arithmetic
+        np.testing.assert_array_equal(
+            (times + 1.5).ns, times.ns + 1500000000)
+        np.testing.assert_array_equal(
+            (times - np.arange(5)).ns, times.ns - np.arange(5) * 10**9)
+        np.testing.assert_array_equal(
+            (times + datetime.timedelta(seconds=1)).ns, times.ns + 10**9)
+        np.testing.assert_array_equal(times - t, [10, -10, 0, 0, -1e-6])
+        np.testing.assert_array_equal(times - times, np.zeros(5))
+        self.assertRaises(TypeError, times.__add__, t)
+        # sorting
+        self.assertEqual(times.min(), t - 10)
+        self.assertEqual(times.max(), t + 10)
+        np.testing.assert_array_equal(times.argsort(), [1, 4, 2, 3, 0])
+        sorted_times = times.copy()
+        sorted_times.sort()
+        self.assertEqual(sorted_times.tolist(), sorted(times))
+        np.testing.assert_array_equal(times.ns, times[[0, 1, 2, 3, 4]].ns)
+        # selection with boolean arrays
+        self.assertEqual(times[times > t].tolist(), [t + 10])
+
+    def test_utcdatetime_array_components(self):
+        """
+        Tests the date and time components of UTCDateTimeArray objects.
+        """
+        times = [UTCDateTime(1969, 12, 31, 23, 59, 59, 999999),
+                 UTCDateTime(2008, 12, 29, 1, 2, 3, 4),
+                 UTCDateTime(2010, 1, 3, 23, 0, 0, 500000),
+                 UTCDateTime(2012, 2, 29, 12, 30, 15),
+                 UTCDateTime(2016, 12, 31, 6, 7, 8)]
+        array = UTCDateTimeArray(times)
+        for key in ('year', 'month', 'day', 'julday', 'hour', 'minute',
+                    'second', 'microsecond', 'weekday'):
+            np.testing.assert_array_equal(
+                getattr(array, key), [getattr(t, key) for t in times])
+        for got, expected in zip(array.isocalendar(),
+                                 zip(*[t.isocalendar() for t in times])):
+            np.testing.assert_array_equal(got, expected)
+        np.testing.assert_allclose(
+            array._get_hours_after_midnight(),
+            [t._get_hours_after_midnight() for t in times], rtol=1e-12)
+
 
 def suite():
     return unittest.makeSuite(UTCDateTimeTestCase, 'test')
@@ -5,11 +5,15 @@ from future.builtins import *  # NOQA
 
 import os
 import shutil
+import subprocess
+import sys
 import unittest
 
 from obspy.core.compatibility import mock
 from obspy.core.util.base import (NamedTemporaryFile, get_dependency_version,
-                                  download_to_file)
+                                  download_to_file, make_format_plugin_table,
+                                  _LazyEntryPoints, _get_entry_points,
+                                  ENTRY_POINTS)
 from obspy.core.util.testing import ImageComparison, ImageComparisonException
 
 from requests import HTTPError
@@ -109,6 +113,54 @@ class UtilBaseTestCase(unittest.TestCase):
                                  "%s HTTP Error: %s for url: %s" %
                                  (code, reason, url))
 
+    def test_lazy_entry_points(self):
+        """
+        Tests that entry points of a plug-in type are only scanned on first
+        access and then reused.
+        """
+        with mock.patch('obspy.core.util.base._get_entry_points',
+                        wraps=_get_entry_points) as p:
+            eps = _LazyEntryPoints({
+                'detrend': (p, ('obspy.plugin.detrend',)),
+                'taper': (p, ('obspy.plugin.taper',))})
+            self.assertEqual(p.call_count, 0)
+            self.assertEqual(sorted(eps), ['detrend', 'taper'])
+            self.assertEqual(len(eps), 2)
+            self.assertIn('simple', eps['detrend'])
+            self.assertIs(eps['detrend'], eps['detrend'])
+            self.assertEqual(p.call_count, 1)
+            self.assertNotIn('taper', eps._cache)
+        self.assertRaises(KeyError, eps.__getitem__, 'xxx')
+        # same content as scanning directly
+        self.assertEqual(ENTRY_POINTS['taper'],
+                         _get_entry_points('obspy.plugin.taper'))
+        self.assertEqual(list(ENTRY_POINTS['waveform'])[:3],
+                         ['MSEED', 'OBSPYBIN', 'SAC'])
+
+    def test_make_format_plugin_table_does_not_load_plugins(self):
+        """
+        Creating the plug-in tables for the docstrings should not import
+        the plug-in modules.
+        """
+        with mock.patch('obspy.core.util.base.buffered_load_entry_point') \
+                as p:
+            table = make_format_plugin_table('waveform', 'read')
+        self.assertEqual(p.call_count, 0)
+        self.assertIn(':func:`obspy.io.mseed.core._read_mseed`', table)
+
+    def test_import_obspy_is_lazy(self):
+        """
+        ``import obspy`` should not import the optional heavy dependencies
+        that are only needed for plotting, network access or the plug-ins.
+        """
+        modules = ['requests', 'matplotlib', 'scipy', 'obspy.io.mseed',
+                   'obspy.imaging']
+        code = ("import sys; import obspy; "
+                "print(' '.join(m for m in %r if m in sys.modules))" %
+                modules)
+        output = subprocess.check_output([sys.executable, '-c', code])
+        self.assertEqual(output.decode().strip(), '')
+
 
 def suite():
     return unittest.makeSuite(UtilBaseTestCase, 'test')
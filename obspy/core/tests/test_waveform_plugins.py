@@ -2,6 +2,7 @@
 from __future__ import (absolute_import, division, print_function,
                         unicode_literals)
 from future.builtins import *  # NOQA
+from future.utils import native_str
 
 import io
 import os
@@ -9,6 +10,7 @@ import threading
 import time
 import unittest
 import warnings
+import zipfile
 from copy import deepcopy
 
 import numpy as np
@@ -18,8 +20,12 @@ from obspy.core.compatibility import mock
 from obspy.io.mseed.core import _write_mseed
 from obspy.core.utcdatetime import UTCDateTime
 from obspy.core.util.base import (NamedTemporaryFile, _get_entry_points,
-                                  DEFAULT_MODULES, WAVEFORM_ACCEPT_BYTEORDER)
-from obspy.core.util.misc import buffered_load_entry_point, _ENTRY_POINT_CACHE
+                                  DEFAULT_MODULES, WAVEFORM_ACCEPT_BYTEORDER,
+                                  _detect_format, _read_from_plugin)
+from obspy.core.util.decorator import _SequentialReader
+from obspy.core.util.misc import (buffered_load_entry_point,
+                                  _ENTRY_POINT_CACHE,
+                                  TemporaryWorkingDirectory)
 
 
 def _get_default_eps(group, subgroup=None):
@@ -402,6 +408,96 @@ class WaveformPluginsTestCase(unittest.TestCase):
         st2 = read(os.path.join(ascii_path, 'slist.ascii'))
         self.assertEqual(st1, st2)
 
+    def test_read_compressed_without_temporary_files(self):
+        """
+        Tests that compressed files are passed to plug-ins supporting
+        file-like objects without writing temporary files.
+        """
+        import bz2
+        import gzip
+        import tarfile
+        st = read()
+        with TemporaryWorkingDirectory():
+            st.write('test.mseed', format='MSEED')
+            expected = read('test.mseed')
+            with open('test.mseed', 'rb') as fh:
+                data = fh.read()
+            with gzip.open('test.mseed.gz', 'wb') as fh:
+                fh.write(data)
+            with open('test.mseed.bz2', 'wb') as fh:
+                fh.write(bz2.compress(data))
+            with zipfile.ZipFile('test.zip', 'w') as zip:
+                zip.write('test.mseed')
+            with tarfile.open('test.tar.gz', 'w:gz') as tar:
+                tar.add('test.mseed')
+            for filename in ('test.mseed.gz', 'test.mseed.bz2', 'test.zip',
+                             'test.tar.gz'):
+                with mock.patch(
+                        'obspy.core.util.decorator.NamedTemporaryFile') as p:
+                    got = read(filename)
+                self.assertEqual(p.call_count, 0, msg=filename)
+                self.assertEqual(got, expected, msg=filename)
+            # gzip files are decompressed while they are read
+            with mock.patch('obspy.core.stream._read_from_plugin',
+                            wraps=_read_from_plugin) as p:
+                read('test.mseed.gz')
+            self.assertEqual(p.call_count, 1)
+            self.assertIsInstance(p.call_args[0][1], _SequentialReader)
+
+    def test_read_gzip_with_format(self):
+        """
+        Tests reading gzip compressed MiniSEED, SEG-Y and SU files with
+        explicitly given format, all traces and samples have to be read.
+        The SEG-Y and SU readers need the file size, so the data is passed
+        to them in memory instead.
+        """
+        import gzip
+        st = read()
+        st += read()
+        for tr in st:
+            tr.data = tr.data.astype(np.float32)
+        with TemporaryWorkingDirectory():
+            for format in ('MSEED', 'SEGY', 'SU'):
+                filename = 'test.' + format.lower()
+                st.write(filename, format=format)
+                expected = read(filename, format=format)
+                self.assertEqual(len(expected), 6)
+                with open(filename, 'rb') as fh:
+                    data = fh.read()
+                with gzip.open(filename + '.gz', 'wb') as fh:
+                    fh.write(data)
+                with mock.patch('obspy.core.stream._read_from_plugin',
+                                wraps=_read_from_plugin) as p:
+                    got = read(filename + '.gz', format=format)
+                self.assertIsInstance(p.call_args_list[0][0][1],
+                                      _SequentialReader)
+                self.assertEqual(p.call_count,
+                                 1 if format == 'MSEED' else 2, msg=format)
+                self.assertEqual(len(got), len(expected), msg=format)
+                for tr, tr_expected in zip(got, expected):
+                    np.testing.assert_array_equal(tr.data, tr_expected.data)
+                    self.assertEqual(tr.stats.npts, tr_expected.stats.npts)
+
+    def test_read_compressed_reader_errors(self):
+        """
+        Tests that only errors of readers not supporting the file-like object
+        lead to reading a temporary file, other errors are raised.
+        """
+        with TemporaryWorkingDirectory():
+            read().write('test.mseed', format='MSEED')
+            with zipfile.ZipFile('test.zip', 'w') as zip:
+                zip.write('test.mseed')
+            for error in (AttributeError, ValueError):
+                with mock.patch('obspy.core.stream._read_from_plugin',
+                                side_effect=error) as p:
+                    self.assertRaises(error, read, 'test.zip')
+                self.assertEqual(p.call_count, 1)
+            with mock.patch('obspy.core.stream._read_from_plugin',
+                            side_effect=TypeError) as p:
+                self.assertRaises(TypeError, read, 'test.zip')
+            self.assertEqual(p.call_count, 2)
+            self.assertIsInstance(p.call_args[0][1], (str, native_str))
+
     def test_raise_on_unknown_format(self):
         """
         Test case for issue #338:
@@ -515,6 +611,86 @@ class WaveformPluginsTestCase(unittest.TestCase):
         st = read("/path/to/tarfile_impostor.mseed")
         self.assertEqual(st[0].id, "10.864.1B.004")
 
+    def test_format_detection_signatures(self):
+        """
+        Tests that formats with non-matching signature are skipped during
+        format detection and that the detected format does not depend on
+        previously read files.
+        """
+        filename = os.path.join(os.path.dirname(__file__), os.pardir,
+                                os.pardir, 'io', 'pdas', 'tests', 'data',
+                                'p1246001.108')
+
+        def checked_formats(filename):
+            with mock.patch(
+                    'obspy.core.util.base.buffered_load_entry_point',
+                    wraps=buffered_load_entry_point) as p:
+                st = read(filename)
+            return st, [call[0][1].split('.')[-1]
+                        for call in p.call_args_list
+                        if call[0][2] == 'isFormat']
+
+        st, formats = checked_formats(filename)
+        self.assertEqual(st[0].stats._format, 'PDAS')
+        self.assertIn('PDAS', formats)
+        self.assertIn('MSEED', formats)
+        for format in ('GSE1', 'Q', 'SH_ASC', 'SLIST', 'TSPAIR', 'SEG2',
+                       'WAV'):
+            self.assertNotIn(format, formats)
+        self.assertEqual(checked_formats(filename)[1], formats)
+        # formats are still checked in the preferred order after reading a
+        # file of another format with the same extension
+        with NamedTemporaryFile(suffix='.108') as tf:
+            read().write(tf.name, format='MSEED')
+            st, formats_mseed = checked_formats(tf.name)
+        self.assertEqual(st[0].stats._format, 'MSEED')
+        self.assertEqual(formats_mseed, ['MSEED'])
+        self.assertEqual(checked_formats(filename)[1], formats)
+
+    def test_read_pin_format(self):
+        """
+        Tests that the format is only detected for the first file of a glob
+        with pin_format=True.
+        """
+        with TemporaryWorkingDirectory():
+            for i, tr in enumerate(read()):
+                tr.write('test%d.mseed' % i, format='MSEED')
+            for pin_format, expected in ((False, 3), (True, 1)):
+                with mock.patch('obspy.core.util.base._detect_format',
+                                wraps=_detect_format) as p:
+                    st = read('test*.mseed', pin_format=pin_format)
+                self.assertEqual(len(st), 3)
+                self.assertEqual(p.call_count, expected)
+
+    def test_read_with_n_jobs(self):
+        """
+        Tests that reading files concurrently gives the same result as
+        reading them one after the other.
+        """
+        st = read()
+        with TemporaryWorkingDirectory():
+            for i in range(6):
+                for tr in st:
+                    tr.stats.station = 'S%d' % i
+                    tr.stats.starttime += 10
+                st.write('test%d.mseed' % i, format='MSEED')
+            # files with different formats
+            st[:1].write('test6.sac', format='SAC')
+            for kwargs in ({}, {'headonly': True},
+                           {'starttime': st[0].stats.starttime + 5,
+                            'endtime': st[0].stats.starttime + 10}):
+                expected = read('test*', **kwargs)
+                for executor in ('thread', 'process'):
+                    got = read('test*', n_jobs=3, executor=executor,
+                               **kwargs)
+                    self.assertEqual(got, expected)
+                    self.assertEqual([tr.stats._format for tr in got],
+                                     [tr.stats._format for tr in expected])
+            got = read('test*.mseed', n_jobs=-1, pin_format=True)
+            self.assertEqual(got, read('test*.mseed'))
+            self.assertRaises(ValueError, read, 'test*', n_jobs=2,
+                              executor='cluster')
+
 
 def suite():
     return unittest.makeSuite(WaveformPluginsTestCase, 'test')
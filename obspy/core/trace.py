@@ -15,14 +15,16 @@ from future.utils import native_str
 
 import inspect
 import math
+import threading
 import warnings
+from contextlib import contextmanager
 from copy import copy, deepcopy
 
 import numpy as np
 from decorator import decorator
 
 from obspy.core import compatibility
-from obspy.core.utcdatetime import UTCDateTime
+from obspy.core.utcdatetime import UTCDateTime, UTCDateTimeArray
 from obspy.core.util import AttribDict, create_empty_data_chunk
 from obspy.core.util.base import _get_function_from_entry_point
 from obspy.core.util.decorator import raise_if_masked, skip_if_no_data
@@ -130,7 +132,19 @@ class Stats(AttribDict):
         >>> trace.data = np.array([1, 2, 3, 4])
         >>> trace.stats.npts
         4
+
+    (5)
+        The default attributes are stored in fixed slots to keep the memory
+        footprint of the many headers small. All other attributes (e.g.
+        format specific headers like ``stats.mseed``) are kept in the
+        instance dictionary. The ``endtime`` is only calculated on access
+        and cached until ``starttime``, ``npts`` or ``sampling_rate``
+        change.
     """
+    # The default attributes are stored in slots, all other (e.g. format
+    # specific) attributes in the instance dictionary.
+    __slots__ = ('sampling_rate', 'delta', 'starttime', 'npts', 'calib',
+                 'network', 'station', 'location', 'channel', '_endtime')
     readonly = ['endtime']
     defaults = {
         'sampling_rate': 1.0,
@@ -144,17 +158,47 @@ class Stats(AttribDict):
         'location': '',
         'channel': '',
     }
+    _default_keys = ('network', 'station', 'location', 'channel',
+                     'starttime', 'endtime', 'sampling_rate', 'delta', 'npts',
+                     'calib')
+    _default_key_set = frozenset(_default_keys)
+    # keys which need to refresh derived values
+    _refresh_keys = frozenset(['delta', 'sampling_rate', 'starttime', 'npts'])
 
     def __init__(self, header={}):
         """
         """
-        super(Stats, self).__init__(header)
+        for key, value in self.defaults.items():
+            if key != 'endtime':
+                object.__setattr__(self, key, value)
+        object.__setattr__(self, '_endtime', None)
+        self.update(header)
+
+    @property
+    def endtime(self):
+        """
+        Date and time of the last data sample, derived from ``starttime``,
+        ``npts`` and ``sampling_rate`` and cached until one of them changes.
+        """
+        endtime = self._endtime
+        if endtime is None:
+            if self.npts == 0:
+                timediff = 0
+            else:
+                timediff = float(self.npts - 1) * self.delta
+            endtime = self.starttime + timediff
+            object.__setattr__(self, '_endtime', endtime)
+        return endtime
+
+    def __getitem__(self, name, default=None):
+        if name in self._default_key_set:
+            return object.__getattribute__(self, name)
+        return super(Stats, self).__getitem__(name, default)
 
     def __setitem__(self, key, value):
         """
         """
-        # keys which need to refresh derived values
-        if key in ['delta', 'sampling_rate', 'starttime', 'npts']:
+        if key in self._refresh_keys:
             # ensure correct data type
             if key == 'delta':
                 key = 'sampling_rate'
@@ -167,32 +211,79 @@ class Stats(AttribDict):
                 if not isinstance(value, int):
                     value = int(value)
             # set current key
-            super(Stats, self).__setitem__(key, value)
+            object.__setattr__(self, key, value)
             # set derived value: delta
-            try:
-                delta = 1.0 / float(self.sampling_rate)
-            except ZeroDivisionError:
-                delta = 0
-            self.__dict__['delta'] = delta
-            # set derived value: endtime
-            if self.npts == 0:
-                timediff = 0
-            else:
-                timediff = float(self.npts - 1) * delta
-            self.__dict__['endtime'] = self.starttime + timediff
+            if key == 'sampling_rate':
+                try:
+                    delta = 1.0 / value
+                except ZeroDivisionError:
+                    delta = 0
+                object.__setattr__(self, 'delta', delta)
+            # derived value endtime is recalculated on next access
+            object.__setattr__(self, '_endtime', None)
             return
         # prevent a calibration factor of 0
         if key == 'calib' and value == 0:
             msg = 'Calibration factor set to 0.0!'
             warnings.warn(msg, UserWarning)
+        if key in self._default_key_set and key not in self.readonly:
+            object.__setattr__(self, key, value)
         # all other keys
-        if isinstance(value, dict):
+        elif isinstance(value, dict):
             super(Stats, self).__setitem__(key, AttribDict(value))
         else:
             super(Stats, self).__setitem__(key, value)
 
     __setattr__ = __setitem__
 
+    def __delitem__(self, name):
+        # default attributes can not be removed, they fall back to the
+        # default value like in any other AttribDict
+        if name in self._default_key_set:
+            if name in self.readonly:
+                msg = 'Attribute "%s" in %s object is read only!'
+                raise AttributeError(msg % (name, self.__class__.__name__))
+            self.__setitem__(name, self.defaults[name])
+            return
+        super(Stats, self).__delitem__(name)
+
+    __delattr__ = __delitem__
+
+    def __iter__(self):
+        for key in self._default_keys:
+            yield key
+        for key in self.__dict__:
+            yield key
+
+    def __len__(self):
+        return len(self._default_keys) + len(self.__dict__)
+
+    def __repr__(self):
+        return "%s(%s)" % (self.__class__.__name__, dict(self))
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        for key in self._default_keys:
+            # derived values are recalculated
+            if key not in ('delta', 'endtime'):
+                state[key] = object.__getattribute__(self, key)
+        return state
+
+    def __setstate__(self, state):
+        state = dict(state)
+        # pickles of older versions contain the derived values
+        state.pop('delta', None)
+        state.pop('endtime', None)
+        self.__init__(state)
+
+    def __deepcopy__(self, *args, **kwargs):  # @UnusedVariable
+        stats = self.__class__.__new__(self.__class__)
+        for key in self.__slots__:
+            object.__setattr__(stats, key,
+                               deepcopy(object.__getattribute__(self, key)))
+        stats.__dict__.update(deepcopy(self.__dict__))
+        return stats
+
     def __str__(self):
         """
         Return better readable string representation of Stats object.
@@ -206,11 +297,149 @@ class Stats(AttribDict):
         p.text(str(self))
 
 
+class _ProcessingSettings(threading.local):
+    """
+    Settings of :func:`fast_path` and :func:`processing_dtype`, every thread
+    has its own settings.
+    """
+    fast_path = False
+    dtype = None
+
+
+_PROCESSING_SETTINGS = _ProcessingSettings()
+
+
+@contextmanager
+def _processing_settings(**settings):
+    """
+    Context manager that changes the processing settings of the current
+    thread and restores them afterwards.
+    """
+    previous = dict((key, getattr(_PROCESSING_SETTINGS, key))
+                    for key in settings)
+    for key, value in settings.items():
+        setattr(_PROCESSING_SETTINGS, key, value)
+    try:
+        yield
+    finally:
+        for key, value in previous.items():
+            setattr(_PROCESSING_SETTINGS, key, value)
+
+
+def _get_processing_settings():
+    """
+    Returns the processing settings of the current thread as a dictionary,
+    e.g. to apply them in worker threads or processes with
+    :func:`_processing_settings`.
+    """
+    return {'fast_path': _PROCESSING_SETTINGS.fast_path,
+            'dtype': _PROCESSING_SETTINGS.dtype}
+
+
+@contextmanager
+def fast_path():
+    """
+    Context manager that skips bookkeeping overhead of Trace methods.
+
+    Inside the ``with`` block processing methods of
+    :class:`~obspy.core.trace.Trace` do not add entries to
+    ``stats.processing`` and assigning ``Trace.data`` skips the checks that
+    the new data is a one-dimensional NumPy array. This is meant for tight
+    loops over many short traces where formatting the processing
+    information costs as much as the actual numerical work.
+
+    The switch only affects the current thread and the worker threads and
+    processes of Stream methods called with ``n_jobs`` inside the ``with``
+    block. Nested usage is possible.
+
+    >>> from obspy import read
+    >>> tr = read()[0]
+    >>> with fast_path():
+    ...     tr.detrend("demean")  # doctest: +ELLIPSIS
+    <...Trace object at 0x...>
+    >>> 'processing' in tr.stats
+    False
+    """
+    with _processing_settings(fast_path=True):
+        yield
+
+
+@contextmanager
+def processing_dtype(dtype=np.float32):
+    """
+    Context manager that sets the floating point type of processed data.
+
+    Most processing methods of :class:`~obspy.core.trace.Trace` and
+    :class:`~obspy.core.stream.Stream` return double precision data, also for
+    single precision input. Inside the ``with`` block floating point data
+    resulting from :meth:`~obspy.core.trace.Trace.filter`,
+    :meth:`~obspy.core.trace.Trace.detrend`,
+    :meth:`~obspy.core.trace.Trace.taper`,
+    :meth:`~obspy.core.trace.Trace.resample`,
+    :meth:`~obspy.core.trace.Trace.decimate`,
+    :meth:`~obspy.core.trace.Trace.interpolate`,
+    :meth:`~obspy.core.trace.Trace.differentiate`,
+    :meth:`~obspy.core.trace.Trace.integrate`,
+    :meth:`~obspy.core.trace.Trace.normalize`,
+    :meth:`~obspy.core.trace.Trace.simulate`,
+    :meth:`~obspy.core.trace.Trace.remove_response` and
+    :meth:`~obspy.core.trace.Trace.remove_sensitivity` is converted to the
+    given type, e.g. to keep data in single precision through a whole
+    processing chain with half the memory usage. Integer data is only
+    converted if a method returns floating point data.
+
+    Intermediate results are still calculated in the precision of the
+    underlying routines (e.g. IIR filters and FFTs in double precision), so
+    only one trace at a time needs the additional memory and the results
+    differ from double precision processing only by the rounding of the
+    stored data after each step.
+
+    The switch only affects the current thread and the worker threads and
+    processes of Stream methods called with ``n_jobs`` inside the ``with``
+    block. Nested usage is possible.
+
+    :type dtype: :class:`numpy.dtype`, optional
+    :param dtype: Floating point type of the processed data. ``None``
+        restores the default behavior.
+
+    >>> from obspy import read
+    >>> st = read()
+    >>> st[0].data.dtype
+    dtype('float64')
+    >>> with processing_dtype(np.float32):
+    ...     st = st.detrend("linear").taper(0.05).filter("lowpass", freq=2)
+    >>> st[0].data.dtype
+    dtype('float32')
+    """
+    if dtype is not None:
+        dtype = np.dtype(dtype)
+        if dtype.kind != 'f':
+            msg = "Processing dtype has to be a floating point type."
+            raise ValueError(msg)
+    with _processing_settings(dtype=dtype):
+        yield
+
+
 @decorator
-def _add_processing_info(func, *args, **kwargs):
+def _convert_to_processing_dtype(func, *args, **kwargs):
     """
-    This is a decorator that attaches information about a processing call as a
-    string to the Trace.stats.processing list.
+    This is a decorator that converts floating point data of the trace to the
+    type set with :func:`processing_dtype` after calling the decorated
+    method.
+    """
+    result = func(*args, **kwargs)
+    dtype = _PROCESSING_SETTINGS.dtype
+    if dtype is not None:
+        self = args[0]
+        if self.data.dtype.kind == 'f' and self.data.dtype != dtype:
+            self.data = np.require(self.data, dtype=dtype)
+    return result
+
+
+def _get_processing_info(func, args, kwargs):
+    """
+    Returns the string describing a call of a processing method that is
+    stored in Trace.stats.processing.
     """
     callargs = inspect.getcallargs(func, *args, **kwargs)
     callargs.pop("self")
@@ -227,7 +456,18 @@ def _add_processing_info(func, *args, **kwargs):
         ["%s=%s" % (k, repr(v)) if not isinstance(v, native_str) else
          "%s='%s'" % (k, v) for k, v in kwargs_.items()]
     arguments.sort()
-    info = info % "::".join(arguments)
+    return info % "::".join(arguments)
+
+
+@decorator
+def _add_processing_info(func, *args, **kwargs):
+    """
+    This is a decorator that attaches information about a processing call as a
+    string to the Trace.stats.processing list.
+    """
+    if _PROCESSING_SETTINGS.fast_path:
+        return func(*args, **kwargs)
+    info = _get_processing_info(func, args, kwargs)
     self = args[0]
     result = func(*args, **kwargs)
     # Attach after executing the function to avoid having it attached
@@ -262,6 +502,20 @@ class Trace(object):
         sure themselves that no C operations are performed on potentially
         incontiguous data.
 
+    .. note::
+
+        Waveform readers may create traces whose samples are only read and
+        decoded on first access of ``.data`` (e.g. ``read(..., lazy=True)``
+        for MiniSEED). Header based operations like
+        :meth:`~obspy.core.stream.Stream.select`,
+        :meth:`~obspy.core.trace.Trace.trim` (without padding) and
+        :meth:`~obspy.core.trace.Trace.slice` do not trigger loading the data
+        for such traces. The deferred data is provided by an object stored in
+        ``Trace._lazy_data`` that has a ``dtype`` attribute, supports
+        ``len()``, returns a new object for a range of samples with
+        ``slice(start, stop)`` and returns the actual data array with
+        ``load()``.
+
     .. rubric:: Supported Operations
 
     ``trace = traceA + traceB``
@@ -276,6 +530,7 @@ class Trace(object):
         See also: :meth:`Trace.__str__`.
     """
     _always_contiguous = True
+    _lazy_data = None
 
     def __init__(self, data=np.array([]), header=None):
         # make sure Trace gets initialized with suitable ndarray as self.data
@@ -351,7 +606,7 @@ class Trace(object):
         """
         No data means no trace.
         """
-        return bool(len(self.data))
+        return bool(len(self))
 
     def __str__(self, id_length=None):
         """
@@ -395,7 +650,7 @@ class Trace(object):
                     "%(starttime)s - %(endtime)s | " + \
                     "%(sampling_rate).1f Hz, %(npts)d samples"
         # check for masked array
-        if np.ma.count_masked(self.data):
+        if self._lazy_data is None and np.ma.count_masked(self.data):
             out += ' (masked)'
         return trace_id + out % (self.stats)
 
@@ -417,6 +672,8 @@ class Trace(object):
         >>> len(trace)
         4
         """
+        if self._lazy_data is not None:
+            return len(self._lazy_data)
         return len(self.data)
 
     count = __len__
@@ -427,12 +684,57 @@ class Trace(object):
         """
         # any change in Trace.data will dynamically set Trace.stats.npts
         if key == 'data':
-            _data_sanity_checks(value)
+            if not _PROCESSING_SETTINGS.fast_path:
+                _data_sanity_checks(value)
             if self._always_contiguous:
                 value = np.require(value, requirements=['C_CONTIGUOUS'])
             self.stats.npts = len(value)
+            # explicitly set data replaces any not yet loaded data
+            self.__dict__.pop('_lazy_data', None)
         return super(Trace, self).__setattr__(key, value)
 
+    def __getattr__(self, key):
+        """
+        Loads deferred data on first access of Trace.data.
+
+        Only called if regular attribute lookup fails.
+        """
+        if key == 'data' and self._lazy_data is not None:
+            self.data = self._lazy_data.load()
+            return self.__dict__['data']
+        raise AttributeError("'%s' object has no attribute '%s'" % (
+            self.__class__.__name__, key))
+
+    def _set_lazy_data(self, lazy_data):
+        """
+        Replace the data by an object deferring the loading of the data.
+
+        See the notes in :class:`~obspy.core.trace.Trace` for the interface
+        ``lazy_data`` has to provide.
+        """
+        self.__dict__.pop('data', None)
+        self.__dict__['_lazy_data'] = lazy_data
+        self.stats.npts = len(lazy_data)
+
+    def _slice_data(self, start, stop):
+        """
+        Replace the data by the samples in the given index range.
+
+        Works without loading deferred data.
+        """
+        if self._lazy_data is not None:
+            self._set_lazy_data(self._lazy_data.slice(start, stop))
+        else:
+            self.data = self.data[start:stop]
+
+    def _get_dtype(self):
+        """
+        Data type of the samples, works without loading deferred data.
+        """
+        if self._lazy_data is not None:
+            return self._lazy_data.dtype
+        return self.data.dtype
+
     def __getitem__(self, index):
         """
         __getitem__ method of Trace object.
@@ -964,7 +1266,7 @@ class Trace(object):
         >>> tr.stats.starttime
         UTCDateTime(1970, 1, 1, 0, 0, 8)
         """
-        org_dtype = self.data.dtype
+        org_dtype = self._get_dtype()
         if isinstance(starttime, float) or isinstance(starttime, int):
             starttime = UTCDateTime(self.stats.starttime) + starttime
         elif not isinstance(starttime, UTCDateTime):
@@ -1008,7 +1310,7 @@ class Trace(object):
             return self
         elif delta > 0:
             try:
-                self.data = self.data[delta:]
+                self._slice_data(delta, None)
             except IndexError:
                 # a huge numbers for delta raises an IndexError
                 # here we just create empty array with same dtype
@@ -1031,7 +1333,7 @@ class Trace(object):
         >>> tr.stats.endtime
         UTCDateTime(1970, 1, 1, 0, 0, 2)
         """
-        org_dtype = self.data.dtype
+        org_dtype = self._get_dtype()
         if isinstance(endtime, float) or isinstance(endtime, int):
             endtime = UTCDateTime(self.stats.endtime) - endtime
         elif not isinstance(endtime, UTCDateTime):
@@ -1069,10 +1371,10 @@ class Trace(object):
             return self
         # cut from right
         delta = abs(delta)
-        total = len(self.data) - delta
+        total = len(self) - delta
         if endtime == self.stats.starttime:
             total = 1
-        self.data = self.data[:total]
+        self._slice_data(None, total)
         return self
 
     @_add_processing_info
@@ -1251,6 +1553,69 @@ class Trace(object):
             yield self.slice(start, stop,
                              nearest_sample=nearest_sample)
 
+    @raise_if_masked
+    def sliding_windows(self, window_length, step, offset=0):
+        """
+        Returns all equal length sliding windows of the Trace as one array.
+
+        The windows are the same as the ones of :meth:`slide` without
+        partial windows, but instead of a Trace per window a single 2-D
+        array with one window per row is returned. It is a read-only view
+        of the data created with :func:`numpy.lib.stride_tricks.as_strided`
+        so no data is copied no matter how many windows overlap. This is
+        useful to process all windows at once, e.g. with
+        :func:`numpy.fft.rfft` along the last axis.
+
+        .. rubric:: Example
+
+        >>> import obspy
+        >>> tr = obspy.read()[0]
+        >>> windows, times = tr.sliding_windows(window_length=10.0, step=5.0)
+        >>> print(windows.shape)
+        (4, 1001)
+        >>> for t in times:
+        ...     print(obspy.UTCDateTime(t))
+        2009-08-24T00:20:03.000000Z
+        2009-08-24T00:20:08.000000Z
+        2009-08-24T00:20:13.000000Z
+        2009-08-24T00:20:18.000000Z
+
+        :param window_length: The length of each window in seconds. Rounded
+            to full samples.
+        :type window_length: float
+        :param step: The step between the start times of two successive
+            windows in seconds. Rounded to full samples and must be at least
+            one sample.
+        :type step: float
+        :param offset: The offset of the first window in seconds relative to
+            the start time of the trace. Rounded to full samples.
+        :type offset: float
+        :rtype: tuple(:class:`numpy.ndarray`, :class:`numpy.ndarray`)
+        :return: The windows as a read-only array of shape
+            ``(number of windows, samples per window)`` and the start times
+            of the windows as POSIX timestamps (compare
+            :meth:`times` with ``type="timestamp"``).
+        """
+        sr = self.stats.sampling_rate
+        npts = int(compatibility.round_away(window_length * sr)) + 1
+        step_npts = int(compatibility.round_away(step * sr))
+        first = int(compatibility.round_away(offset * sr))
+        if npts < 1 or step_npts < 1 or first < 0:
+            msg = ("Window length, step and offset must not be negative and "
+                   "the step must be at least one sample.")
+            raise ValueError(msg)
+        data = self.data[first:]
+        count = max(0, (len(data) - npts) // step_npts + 1)
+        windows = np.lib.stride_tricks.as_strided(
+            data, shape=(count, npts),
+            strides=(step_npts * data.strides[0], data.strides[0]))
+        # Overlapping windows share memory, writing to them would be
+        # confusing at best.
+        windows.flags.writeable = False
+        times = self.stats.starttime.timestamp + \
+            (first + np.arange(count) * step_npts) * self.stats.delta
+        return windows, times
+
     def verify(self):
         """
         Verify current trace object against available meta data.
@@ -1295,6 +1660,7 @@ class Trace(object):
         return self
 
     @_add_processing_info
+    @_convert_to_processing_dtype
     def simulate(self, paz_remove=None, paz_simulate=None,
                  remove_sensitivity=True, simulate_sensitivity=True, **kwargs):
         """
@@ -1431,6 +1797,7 @@ seismometer_correction_simulation.html#using-a-resp-file>`_.
 
     @_add_processing_info
     @raise_if_masked
+    @_convert_to_processing_dtype
     def filter(self, type, **options):
         """
         Filter the data of the current trace.
@@ -1592,11 +1959,12 @@ seismometer_correction_simulation.html#using-a-resp-file>`_.
 
     @skip_if_no_data
     @_add_processing_info
+    @_convert_to_processing_dtype
     def resample(self, sampling_rate, window='hanning', no_filter=True,
-                 strict_length=False):
+                 strict_length=False, method='fft'):
         """
-        Resample trace data using Fourier method. Spectra are linearly
-        interpolated if required.
+        Resample trace data using Fourier method or polyphase filtering.
+        Spectra are linearly interpolated if required.
 
         :type sampling_rate: float
         :param sampling_rate: The sampling rate of the resampled signal.
@@ -1610,6 +1978,9 @@ seismometer_correction_simulation.html#using-a-resp-file>`_.
         :type strict_length: bool, optional
         :param strict_length: Leave traces unchanged for which end time of
             trace would change. Defaults to ``False``.
+        :type method: str, optional
+        :param method: ``'fft'`` (default) resamples in the Fourier domain,
+            ``'polyphase'`` with a polyphase FIR filter, see below.
 
         .. note::
 
@@ -1629,8 +2000,17 @@ seismometer_correction_simulation.html#using-a-resp-file>`_.
             This also makes an entry with information on the applied processing
             in ``stats.processing`` of this trace.
 
-        Uses :func:`scipy.signal.resample`. Because a Fourier method is used,
-        the signal is assumed to be periodic.
+        With ``method='fft'`` the resampling is done like in
+        :func:`scipy.signal.resample`. Because a Fourier method is used, the
+        signal is assumed to be periodic. The FFT of the whole trace can be
+        slow for long traces, especially if the number of samples has large
+        prime factors.
+
+        With ``method='polyphase'``
+        :func:`~obspy.signal.interpolation.resample_polyphase` is used. It
+        needs a rational ratio of the sampling rates (e.g. 100 Hz to 40 Hz or
+        200 Hz to 250 Hz), its cost is proportional to the number of samples
+        and it includes an anti-aliasing filter. ``window`` is not used.
 
         .. rubric:: Example
 
@@ -1648,8 +2028,9 @@ seismometer_correction_simulation.html#using-a-resp-file>`_.
         >>> tr.data  # doctest: +NORMALIZE_WHITESPACE +ELLIPSIS
         array([ 0.5       ,  0.40432914,  0.3232233 ,  0.26903012,  0.25 ...
         """
-        from scipy.signal import get_window
-        from scipy.fftpack import rfft, irfft
+        if method not in ('fft', 'polyphase'):
+            msg = "Unknown resampling method '%s'." % method
+            raise ValueError(msg)
         factor = self.stats.sampling_rate / float(sampling_rate)
         # check if end time changes and this is not explicitly allowed
         if strict_length:
@@ -1667,6 +2048,15 @@ seismometer_correction_simulation.html#using-a-resp-file>`_.
             freq = self.stats.sampling_rate * 0.5 / float(factor)
             self.filter('lowpass_cheby_2', freq=freq, maxorder=12)
 
+        if method == 'polyphase':
+            from obspy.signal.interpolation import resample_polyphase
+            self.data = resample_polyphase(
+                self.data, self.stats.sampling_rate, sampling_rate)
+            self.stats.sampling_rate = sampling_rate
+            return self
+
+        from scipy.signal import get_window
+        from scipy.fftpack import rfft, irfft
         # resample in the frequency domain. Make sure the byteorder is native.
         x = rfft(self.data.newbyteorder("="))
         # Cast the value to be inserted to the same dtype as the array to avoid
@@ -1712,6 +2102,7 @@ seismometer_correction_simulation.html#using-a-resp-file>`_.
         return self
 
     @_add_processing_info
+    @_convert_to_processing_dtype
     def decimate(self, factor, no_filter=False, strict_length=False):
         """
         Downsample trace data by an integer factor.
@@ -1841,6 +2232,7 @@ seismometer_correction_simulation.html#using-a-resp-file>`_.
 
     @skip_if_no_data
     @_add_processing_info
+    @_convert_to_processing_dtype
     def differentiate(self, method='gradient', **options):
         """
         Differentiate the trace with respect to time.
@@ -1876,6 +2268,7 @@ seismometer_correction_simulation.html#using-a-resp-file>`_.
 
     @skip_if_no_data
     @_add_processing_info
+    @_convert_to_processing_dtype
     def integrate(self, method="cumtrapz", **options):
         """
         Integrate the trace with respect to time.
@@ -1910,6 +2303,7 @@ seismometer_correction_simulation.html#using-a-resp-file>`_.
     @skip_if_no_data
     @raise_if_masked
     @_add_processing_info
+    @_convert_to_processing_dtype
     def detrend(self, type='simple', **options):
         """
         Remove a trend from the trace.
@@ -1974,6 +2368,7 @@ seismometer_correction_simulation.html#using-a-resp-file>`_.
 
     @skip_if_no_data
     @_add_processing_info
+    @_convert_to_processing_dtype
     def taper(self, max_percentage, type='hann', max_length=None,
               side='both', **kwargs):
         """
@@ -2114,6 +2509,7 @@ seismometer_correction_simulation.html#using-a-resp-file>`_.
         return self
 
     @_add_processing_info
+    @_convert_to_processing_dtype
     def normalize(self, norm=None):
         """
         Normalize the trace to its absolute maximum.
@@ -2223,6 +2619,8 @@ seismometer_correction_simulation.html#using-a-resp-file>`_.
         Add the given informational string to the `processing` field in the
         trace's :class:`~obspy.core.trace.Stats` object.
         """
+        if _PROCESSING_SETTINGS.fast_path:
+            return
         proc = self.stats.setdefault('processing', [])
         proc.append(info)
 
@@ -2265,6 +2663,7 @@ seismometer_correction_simulation.html#using-a-resp-file>`_.
     @skip_if_no_data
     @raise_if_masked
     @_add_processing_info
+    @_convert_to_processing_dtype
     def interpolate(self, sampling_rate, method="weighted_average_slopes",
                     starttime=None, npts=None, time_shift=0.0,
                     *args, **kwargs):
@@ -2432,6 +2831,11 @@ seismometer_correction_simulation.html#using-a-resp-file>`_.
           * absolute time as
             :class:`~obspy.core.utcdatetime.UTCDateTime` objects
             (``type="utcdatetime"``)
+          * absolute time as
+            :class:`~obspy.core.utcdatetime.UTCDateTimeArray`, i.e. int64
+            nanoseconds, elements are
+            :class:`~obspy.core.utcdatetime.UTCDateTime` objects
+            (``type="utcdatetimearray"``)
           * absolute time as POSIX timestamps (
             :class:`UTCDateTime.timestamp <obspy.core.utcdatetime.UTCDateTime>`
             ``type="timestamp"``)
@@ -2458,6 +2862,14 @@ seismometer_correction_simulation.html#using-a-resp-file>`_.
                UTCDateTime(2009, 8, 24, 0, 20, 32, 980000),
                UTCDateTime(2009, 8, 24, 0, 20, 32, 990000)], dtype=object)
 
+        >>> tr.times("utcdatetimearray")  # doctest: +SKIP
+        UTCDateTimeArray(['2009-08-24T00:20:03.000000Z',
+                          '2009-08-24T00:20:03.010000Z',
+                          '2009-08-24T00:20:03.020000Z', ...,
+                          '2009-08-24T00:20:32.970000Z',
+                          '2009-08-24T00:20:32.980000Z',
+                          '2009-08-24T00:20:32.990000Z'])
+
         >>> tr.times("timestamp")
         array([  1.25107320e+09,   1.25107320e+09,   1.25107320e+09, ...,
                  1.25107323e+09,   1.25107323e+09,   1.25107323e+09])
@@ -2477,7 +2889,10 @@ seismometer_correction_simulation.html#using-a-resp-file>`_.
         :returns: An array of time samples in an :class:`~numpy.ndarray` if
             the trace doesn't have any gaps or a :class:`~numpy.ma.MaskedArray`
             otherwise (``dtype`` of array is either ``float`` or
-            :class:`~obspy.core.utcdatetime.UTCDateTime`).
+            :class:`~obspy.core.utcdatetime.UTCDateTime`). With
+            ``type="utcdatetimearray"`` a
+            :class:`~obspy.core.utcdatetime.UTCDateTimeArray` is returned if
+            the trace doesn't have any gaps.
         """
         type = type.lower()
         time_array = np.arange(self.stats.npts)
@@ -2487,9 +2902,12 @@ seismometer_correction_simulation.html#using-a-resp-file>`_.
                 time_array += (self.stats.starttime - reftime)
         elif type == "timestamp":
             time_array = time_array + self.stats.starttime.timestamp
-        elif type == "utcdatetime":
-            time_array = np.array(
-                [self.stats.starttime + t_ for t_ in time_array])
+        elif type in ("utcdatetime", "utcdatetimearray"):
+            time_array = UTCDateTimeArray(
+                ns=self.stats.starttime._ns +
+                np.round(time_array * 1e9).astype(np.int64))
+            if type == "utcdatetime":
+                time_array = np.array(time_array.tolist())
         elif type == "matplotlib":
             from matplotlib.dates import date2num
             time_array = date2num([(self.stats.starttime + t_).datetime
@@ -2499,6 +2917,8 @@ seismometer_correction_simulation.html#using-a-resp-file>`_.
             raise ValueError(msg)
         # Check if the data is a ma.maskedarray
         if isinstance(self.data, np.ma.masked_array):
+            if isinstance(time_array, UTCDateTimeArray):
+                time_array = np.array(time_array.tolist())
             time_array = np.ma.array(time_array, mask=self.data.mask)
         return time_array
 
@@ -2582,9 +3002,11 @@ seismometer_correction_simulation.html#using-a-resp-file>`_.
         self.stats.response = self._get_response(inventories)
 
     @_add_processing_info
+    @_convert_to_processing_dtype
     def remove_response(self, inventory=None, output="VEL", water_level=60,
                         pre_filt=None, zero_mean=True, taper=True,
-                        taper_fraction=0.05, plot=False, fig=None, **kwargs):
+                        taper_fraction=0.05, plot=False, fig=None,
+                        fir_length=None, **kwargs):
         """
         Deconvolve instrument response.
 
@@ -2705,7 +3127,21 @@ seismometer_correction_simulation.html#using-a-resp-file>`_.
             raw/corrected data in time domain. If a `str` is provided then the
             plot is saved to file (filename must have a valid image suffix
             recognizable by matplotlib e.g. '.png').
-        """
+        :type fir_length: float, optional
+        :param fir_length: If given, the inverted instrument response
+            (including `pre_filt` and `water_level`) is converted to an
+            equivalent two-sided FIR filter of this length in seconds, which
+            is convolved with the data block by block with
+            :func:`~obspy.signal.util.convolve_overlap_save` instead of
+            transforming the whole trace. Memory usage then only depends on
+            the filter length, which is useful for very long traces. The
+            filter length has to be long enough for the impulse response of
+            the deconvolution to decay, e.g. several periods of the lowest
+            `pre_filt` corner frequency. Can not be combined with `plot`.
+        """
+        if plot and fir_length is not None:
+            msg = "Option 'plot' can not be used together with 'fir_length'."
+            raise ValueError(msg)
         limit_numpy_fft_cache()
 
         from obspy.core.inventory import PolynomialResponseStage
@@ -2808,11 +3244,24 @@ seismometer_correction_simulation.html#using-a-resp-file>`_.
             ax6.yaxis.set_ticks_position("right")
             ax6.yaxis.set_label_position("right")
 
-        # smart calculation of nfft dodging large primes
-        from obspy.signal.util import _npts2nfft
-        nfft = _npts2nfft(npts)
-        # Transform data to Frequency domain
-        data = np.fft.rfft(data, n=nfft)
+        from obspy.signal.util import (_convolve_overlap_save, _npts2nfft,
+                                       next_pow_2)
+        if fir_length is None:
+            # smart calculation of nfft dodging large primes
+            nfft = _npts2nfft(npts)
+            # Transform data to Frequency domain
+            data = np.fft.rfft(data, n=nfft)
+        else:
+            # the spectrum of a unit impulse is processed instead of the
+            # data, resulting in the spectrum of the equivalent FIR filter
+            half = max(int(round(fir_length * self.stats.sampling_rate / 2.0)),
+                       1)
+            ntaps = 2 * half + 1
+            # sample the response densely enough to keep the wrap around of
+            # the impulse response outside of the filter length small
+            nfft = next_pow_2(4 * ntaps)
+            waveform = data
+            data = np.ones(nfft // 2 + 1, dtype=np.complex128)
         # calculate and apply frequency response,
         # optionally prefilter in frequency domain and/or apply water level
         freq_response, freqs = \
@@ -2855,8 +3304,16 @@ seismometer_correction_simulation.html#using-a-resp-file>`_.
             ax3.loglog(freqs, np.abs(data), color=color1, zorder=9)
             ax3b.loglog(freqs, np.abs(freq_response), color=color2, zorder=10)
 
-        # transform data back into the time domain
-        data = np.fft.irfft(data)[0:npts]
+        if fir_length is None:
+            # transform data back into the time domain
+            data = np.fft.irfft(data)[0:npts]
+        else:
+            # two-sided impulse response, tapered at both ends
+            impulse_response = np.fft.irfft(data, nfft)
+            fir = np.concatenate((impulse_response[-half:],
+                                  impulse_response[:half + 1]))
+            fir *= cosine_taper(ntaps, 0.1)
+            data = _convolve_overlap_save(waveform, fir, half, half + npts)
 
         if plot:
             # Oftentimes raises NumPy warnings which we don't want to see.
@@ -2876,6 +3333,7 @@ seismometer_correction_simulation.html#using-a-resp-file>`_.
         return self
 
     @_add_processing_info
+    @_convert_to_processing_dtype
     def remove_sensitivity(self, inventory=None):
         """
         Remove instrument sensitivity.
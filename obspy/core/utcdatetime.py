@@ -15,10 +15,22 @@ from future.utils import native_str
 
 import datetime
 import math
+import re
 import time
 
+import numpy as np
+
 
 TIMESTAMP0 = datetime.datetime(1970, 1, 1, 0, 0)
+ORDINAL_1970 = TIMESTAMP0.toordinal()
+NS_PER_DAY = 86400 * 10**9
+# YYYY-MM-DD[THH:MM:SS[.ffffff]][Z], parsed without strptime
+_ISO8601_FIXED_WIDTH = re.compile(
+    r"^([0-9]{4})-([0-9]{2})-([0-9]{2})"
+    r"(?:T([0-9]{2}):([0-9]{2}):([0-9]{2})(?:\.([0-9]{1,6}))?)?Z?$")
+# number of recently parsed strings remembered by UTCDateTime
+STRING_CACHE_SIZE = 10000
+_STRING_CACHE = {}
 
 
 class UTCDateTime(object):
@@ -252,6 +264,22 @@ class UTCDateTime(object):
                     dt_ = dt_.replace(microsecond=timestamp_microseconds)
                     self._from_datetime(dt_)
                 return
+            if isinstance(value, (bytes, str)):
+                if not isinstance(value, (str, native_str)):
+                    value = value.decode()
+                # got a string instance
+                value = value.strip()
+                key = (value, iso8601)
+                try:
+                    self._ns = _STRING_CACHE[key]
+                    return
+                except KeyError:
+                    pass
+                self._from_string(value, iso8601)
+                if len(_STRING_CACHE) >= STRING_CACHE_SIZE:
+                    _STRING_CACHE.clear()
+                _STRING_CACHE[key] = self._ns
+                return
             # check types
             try:
                 # got a timestamp
@@ -268,69 +296,6 @@ class UTCDateTime(object):
                 dt = datetime.datetime(value.year, value.month, value.day)
                 self._from_datetime(dt)
                 return
-            elif isinstance(value, (bytes, str)):
-                if not isinstance(value, (str, native_str)):
-                    value = value.decode()
-                # got a string instance
-                value = value.strip()
-                # check for ISO8601 date string
-                if value.count("T") == 1 or iso8601:
-                    try:
-                        self._from_iso8601_string(value)
-                        return
-                    except Exception:
-                        if iso8601:
-                            raise
-                # try to apply some standard patterns
-                value = value.replace('T', ' ')
-                value = value.replace('_', ' ')
-                value = value.replace('-', ' ')
-                value = value.replace(':', ' ')
-                value = value.replace(',', ' ')
-                value = value.replace('/', ' ')
-                value = value.replace('Z', ' ')
-                value = value.replace('W', ' ')
-                # check for ordinal date (julian date)
-                parts = value.split(' ')
-                # check for patterns
-                if len(parts) == 1 and len(value) == 7 and value.isdigit():
-                    # looks like an compact ordinal date string
-                    pattern = "%Y%j"
-                elif len(parts) > 1 and len(parts[1]) == 3 and \
-                        parts[1].isdigit():
-                    # looks like an ordinal date string
-                    value = ''.join(parts)
-                    if len(parts) > 2:
-                        pattern = "%Y%j%H%M%S"
-                    else:
-                        pattern = "%Y%j"
-                else:
-                    # some parts should have 2 digits
-                    for i in range(1, min(len(parts), 6)):
-                        if len(parts[i]) == 1:
-                            parts[i] = '0' + parts[i]
-                    value = ''.join(parts)
-                    # fill missing elements with zeros
-                    value += '0' * (14 - len(value))
-                    pattern = "%Y%m%d%H%M%S"
-                ms = 0
-                if '.' in value:
-                    parts = value.split('.')
-                    value = parts[0].strip()
-                    try:
-                        ms = float('.' + parts[1].strip())
-                    except Exception:
-                        pass
-                # all parts should be digits now - here we filter unknown
-                # patterns and pass it directly to Python's  datetime.datetime
-                if not ''.join(parts).isdigit():
-                    dt = datetime.datetime(*args, **kwargs)
-                    self._from_datetime(dt)
-                    return
-                dt = datetime.datetime.strptime(value, pattern)
-                dt += datetime.timedelta(seconds=ms)
-                self._from_datetime(dt)
-                return
         # check for ordinal/julian date kwargs
         if 'julday' in kwargs:
             if 'year' in kwargs:
@@ -359,6 +324,101 @@ class UTCDateTime(object):
         dt = datetime.datetime(*args, **kwargs)
         self._from_datetime(dt)
 
+    def _from_string(self, value, iso8601=False):
+        """
+        Parses a date time string.
+
+        :type value: str
+        :param value: Date time string without surrounding whitespace.
+        :type iso8601: bool
+        :param iso8601: Enforce ISO8601 detection.
+        """
+        # fast path for the most common fixed width ISO8601 strings
+        match = _ISO8601_FIXED_WIDTH.match(value)
+        if match is not None:
+            try:
+                self._from_fixed_width_iso8601_match(match)
+                return
+            except ValueError:
+                # e.g. day out of range, let the full parser handle it
+                pass
+        # check for ISO8601 date string
+        if value.count("T") == 1 or iso8601:
+            try:
+                self._from_iso8601_string(value)
+                return
+            except Exception:
+                if iso8601:
+                    raise
+        # try to apply some standard patterns
+        value = value.replace('T', ' ')
+        value = value.replace('_', ' ')
+        value = value.replace('-', ' ')
+        value = value.replace(':', ' ')
+        value = value.replace(',', ' ')
+        value = value.replace('/', ' ')
+        value = value.replace('Z', ' ')
+        value = value.replace('W', ' ')
+        # check for ordinal date (julian date)
+        parts = value.split(' ')
+        # check for patterns
+        if len(parts) == 1 and len(value) == 7 and value.isdigit():
+            # looks like an compact ordinal date string
+            pattern = "%Y%j"
+        elif len(parts) > 1 and len(parts[1]) == 3 and \
+                parts[1].isdigit():
+            # looks like an ordinal date string
+            value = ''.join(parts)
+            if len(parts) > 2:
+                pattern = "%Y%j%H%M%S"
+            else:
+                pattern = "%Y%j"
+        else:
+            # some parts should have 2 digits
+            for i in range(1, min(len(parts), 6)):
+                if len(parts[i]) == 1:
+                    parts[i] = '0' + parts[i]
+            value = ''.join(parts)
+            # fill missing elements with zeros
+            value += '0' * (14 - len(value))
+            pattern = "%Y%m%d%H%M%S"
+        ms = 0
+        if '.' in value:
+            parts = value.split('.')
+            value = parts[0].strip()
+            try:
+                ms = float('.' + parts[1].strip())
+            except Exception:
+                pass
+        # all parts should be digits now - here we filter unknown
+        # patterns and pass it directly to Python's  datetime.datetime
+        if not ''.join(parts).isdigit():
+            dt = datetime.datetime(value)
+            self._from_datetime(dt)
+            return
+        dt = datetime.datetime.strptime(value, pattern)
+        dt += datetime.timedelta(seconds=ms)
+        self._from_datetime(dt)
+
+    def _from_fixed_width_iso8601_match(self, match):
+        """
+        Sets the time from a match of a ``YYYY-MM-DD[THH:MM:SS[.ffffff]][Z]``
+        string.
+        """
+        year, month, day, hour, minute, second, fraction = match.groups()
+        days = datetime.date(int(year), int(month), int(day)).toordinal() - \
+            ORDINAL_1970
+        seconds = 0
+        if hour is not None:
+            hour, minute, second = int(hour), int(minute), int(second)
+            if hour > 23 or minute > 59 or second > 59:
+                raise ValueError("Time out of range")
+            seconds = hour * 3600 + minute * 60 + second
+        ns = (days * 86400 + seconds) * 10**9
+        if fraction:
+            ns += int(fraction.ljust(6, '0')) * 1000
+        self._ns = ns
+
     def _set(self, **kwargs):
         """
         Sets current timestamp using kwargs.
@@ -1552,6 +1612,326 @@ class UTCDateTime(object):
         return date2num(self.datetime)
 
 
+class UTCDateTimeArray(object):
+    """
+    An array of UTC-based datetimes stored as int64 nanoseconds.
+
+    The array counterpart of :class:`~obspy.core.utcdatetime.UTCDateTime`
+    for working with many points in time at once. Comparisons, arithmetic,
+    sorting and formatting are done with NumPy on the nanoseconds in
+    :attr:`ns`, which makes them orders of magnitude faster than doing the
+    same on a list of :class:`~obspy.core.utcdatetime.UTCDateTime` objects.
+    Single elements are returned as
+    :class:`~obspy.core.utcdatetime.UTCDateTime` objects.
+
+    :type times: sequence or :class:`numpy.ndarray`, optional
+    :param times: Points in time. Either a ``numpy.datetime64`` array, a
+        numeric array or sequence of POSIX timestamps in seconds, another
+        :class:`UTCDateTimeArray` or a sequence of anything a
+        :class:`~obspy.core.utcdatetime.UTCDateTime` can be initialized with.
+    :type precision: int, optional
+    :param precision: Precision used by the rich comparison operators, see
+        :class:`~obspy.core.utcdatetime.UTCDateTime`. Defaults to
+        ``UTCDateTime.DEFAULT_PRECISION``.
+    :type ns: array_like of int, optional
+    :param ns: Nanoseconds since 1970-01-01T00:00:00Z, overrides ``times``.
+
+    .. note::
+
+        Using 64 bit integer nanoseconds restricts the array to times between
+        the years 1678 and 2261, the same range as ``numpy.datetime64[ns]``.
+        Comparisons and arithmetic have to be written with the array on the
+        left hand side, e.g. ``times > t`` instead of ``t < times``.
+
+    .. rubric:: Example
+
+    >>> times = UTCDateTimeArray(["2010-01-01T12:00:00", "2009-05-01",
+    ...                           "2011-02-03T04:05:06.5"])
+    >>> times  # doctest: +NORMALIZE_WHITESPACE
+    UTCDateTimeArray(['2010-01-01T12:00:00.000000Z',
+                      '2009-05-01T00:00:00.000000Z',
+                      '2011-02-03T04:05:06.500000Z'])
+    >>> times[0]
+    UTCDateTime(2010, 1, 1, 12, 0)
+    >>> times > UTCDateTime(2010, 1, 1)
+    array([ True, False,  True], dtype=bool)
+    >>> times[times.argsort()][0]
+    UTCDateTime(2009, 5, 1, 0, 0)
+    >>> print(times.year)
+    [2010 2009 2011]
+    >>> (times - times[1])[0]
+    21211200.0
+    """
+    __hash__ = None
+
+    def __init__(self, times=(), precision=None, ns=None):
+        if precision is None:
+            precision = UTCDateTime.DEFAULT_PRECISION
+        self.precision = int(precision)
+        if ns is None:
+            ns = self._to_ns(times)
+        ns = np.array(ns, dtype=np.int64)
+        if ns.ndim != 1:
+            msg = "UTCDateTimeArray has to be one-dimensional."
+            raise ValueError(msg)
+        #: Nanoseconds since 1970-01-01T00:00:00Z as int64 NumPy array.
+        self.ns = ns
+
+    @staticmethod
+    def _to_ns(times):
+        """
+        Nanoseconds of the given sequence of points in time.
+        """
+        if isinstance(times, UTCDateTimeArray):
+            return times.ns
+        if not isinstance(times, np.ndarray):
+            times = np.asarray(times)
+        if times.dtype.kind == 'M':
+            return times.astype(native_str('M8[ns]')).view(np.int64)
+        if times.dtype.kind in 'iu':
+            return times.astype(np.int64) * 10**9
+        if times.dtype.kind == 'f':
+            # split off full seconds to not lose precision in the product
+            seconds = np.floor(times)
+            return (seconds.astype(np.int64) * 10**9 +
+                    np.round((times - seconds) * 1e9).astype(np.int64))
+        return [t._ns if isinstance(t, UTCDateTime) else UTCDateTime(t)._ns
+                for t in times]
+
+    @staticmethod
+    def _other_to_ns(other):
+        """
+        Nanoseconds of a single point in time or of a sequence of them.
+        """
+        if isinstance(other, UTCDateTime):
+            return other._ns
+        if isinstance(other, np.datetime64):
+            return int(other.astype(native_str('M8[ns]')).astype(np.int64))
+        if isinstance(other, (UTCDateTimeArray, list, tuple, np.ndarray)):
+            return UTCDateTimeArray._to_ns(other)
+        return UTCDateTime(other)._ns
+
+    def __len__(self):
+        return len(self.ns)
+
+    def __iter__(self):
+        for ns in self.ns.tolist():
+            yield UTCDateTime(ns=ns, precision=self.precision)
+
+    def __getitem__(self, index):
+        ns = self.ns[index]
+        if np.ndim(ns) == 0:
+            return UTCDateTime(ns=int(ns), precision=self.precision)
+        return UTCDateTimeArray(ns=ns, precision=self.precision)
+
+    def __setitem__(self, index, value):
+        self.ns[index] = self._other_to_ns(value)
+
+    def __repr__(self):
+        threshold = np.get_printoptions()['threshold']
+        edgeitems = np.get_printoptions()['edgeitems']
+        if len(self) > threshold:
+            strings = (list(self[:edgeitems].to_strings()) + ['...'] +
+                       list(self[-edgeitems:].to_strings()))
+        else:
+            strings = list(self.to_strings())
+        return "UTCDateTimeArray([%s])" % ", ".join(
+            "'%s'" % s_ if s_ != '...' else s_ for s_ in strings)
+
+    def _compare(self, other, operator):
+        try:
+            other = self._other_to_ns(other)
+        except (TypeError, ValueError):
+            return NotImplemented
+        # same rounding as for the UTCDateTime comparison operators
+        diff = np.round((self.ns - other) / 1e9, self.precision)
+        return operator(diff, 0)
+
+    def __eq__(self, other):
+        return self._compare(other, np.equal)
+
+    def __ne__(self, other):
+        return self._compare(other, np.not_equal)
+
+    def __lt__(self, other):
+        return self._compare(other, np.less)
+
+    def __le__(self, other):
+        return self._compare(other, np.less_equal)
+
+    def __gt__(self, other):
+        return self._compare(other, np.greater)
+
+    def __ge__(self, other):
+        return self._compare(other, np.greater_equal)
+
+    @staticmethod
+    def _seconds_to_ns(value):
+        if isinstance(value, datetime.timedelta):
+            value = (value.microseconds + (value.seconds + value.days *
+                     86400) * 10**6) / 1e6
+        value = np.asarray(value)
+        if value.dtype.kind == 'm':
+            return value.astype(native_str('m8[ns]')).astype(np.int64)
+        return np.round(value * 1e9).astype(np.int64)
+
+    def __add__(self, value):
+        """
+        Adds seconds (scalar or array) to all times.
+        """
+        if isinstance(value, (UTCDateTime, UTCDateTimeArray)):
+            msg = ("unsupported operand type(s) for +: 'UTCDateTimeArray' "
+                   "and '%s'") % value.__class__.__name__
+            raise TypeError(msg)
+        return UTCDateTimeArray(ns=self.ns + self._seconds_to_ns(value),
+                                precision=self.precision)
+
+    __radd__ = __add__
+
+    def __sub__(self, value):
+        """
+        Subtracts seconds (scalar or array) from all times or returns the
+        time differences in seconds to a UTCDateTime or another
+        UTCDateTimeArray.
+        """
+        if isinstance(value, (UTCDateTime, UTCDateTimeArray)):
+            return np.round((self.ns - self._other_to_ns(value)) / 1e9,
+                            self.precision)
+        return UTCDateTimeArray(ns=self.ns - self._seconds_to_ns(value),
+                                precision=self.precision)
+
+    def copy(self):
+        return UTCDateTimeArray(ns=self.ns, precision=self.precision)
+
+    def argsort(self, kind='quicksort'):
+        """
+        Indices that sort the times, see :meth:`numpy.ndarray.argsort`.
+        """
+        return self.ns.argsort(kind=kind)
+
+    def sort(self, kind='quicksort'):
+        """
+        Sort the times in place, see :meth:`numpy.ndarray.sort`.
+        """
+        self.ns.sort(kind=kind)
+
+    def min(self):
+        return UTCDateTime(ns=int(self.ns.min()), precision=self.precision)
+
+    def max(self):
+        return UTCDateTime(ns=int(self.ns.max()), precision=self.precision)
+
+    def tolist(self):
+        """
+        Returns the times as a list of UTCDateTime objects.
+        """
+        return list(self)
+
+    def to_datetime64(self):
+        """
+        Returns the times as ``numpy.datetime64[ns]`` array.
+        """
+        return self.ns.view(native_str('M8[ns]')).copy()
+
+    @property
+    def timestamp(self):
+        """
+        POSIX timestamps in seconds as float array.
+        """
+        return self.ns / 1e9
+
+    def to_strings(self):
+        """
+        Returns the times as ISO8601 strings like ``str(UTCDateTime)``.
+
+        The number of digits after the decimal point is given by
+        :attr:`precision` (at most nine).
+
+        >>> times = UTCDateTimeArray([0, 1.1234567])
+        >>> print(times.to_strings())
+        ['1970-01-01T00:00:00.000000Z' '1970-01-01T00:00:01.123457Z']
+        """
+        digits = min(max(self.precision, 0), 9)
+        # round to the last shown digit
+        ns = self.ns + (5 * 10**(8 - digits) if digits < 9 else 0)
+        strings = np.datetime_as_string(ns.view(native_str('M8[ns]')),
+                                        unit=native_str('ns'))
+        strings = strings.astype(native_str('U%d') % (20 + digits))
+        return np.char.add(strings, native_str('Z'))
+
+    def _get_days(self):
+        """
+        Days since 1970-01-01.
+        """
+        return self.ns // NS_PER_DAY
+
+    @property
+    def year(self):
+        days = self._get_days().view(native_str('M8[D]'))
+        return days.astype(native_str('M8[Y]')).astype(np.int64) + 1970
+
+    @property
+    def month(self):
+        days = self._get_days().view(native_str('M8[D]'))
+        return days.astype(native_str('M8[M]')).astype(np.int64) % 12 + 1
+
+    @property
+    def day(self):
+        days = self._get_days()
+        months = days.view(native_str('M8[D]')).astype(native_str('M8[M]'))
+        return days - months.astype(native_str('M8[D]')).astype(np.int64) + 1
+
+    @property
+    def julday(self):
+        days = self._get_days()
+        years = days.view(native_str('M8[D]')).astype(native_str('M8[Y]'))
+        return days - years.astype(native_str('M8[D]')).astype(np.int64) + 1
+
+    @property
+    def hour(self):
+        return self.ns % NS_PER_DAY // (3600 * 10**9)
+
+    @property
+    def minute(self):
+        return self.ns % (3600 * 10**9) // (60 * 10**9)
+
+    @property
+    def second(self):
+        return self.ns % (60 * 10**9) // 10**9
+
+    @property
+    def microsecond(self):
+        return self.ns % 10**9 // 1000
+
+    @property
+    def weekday(self):
+        """
+        Day of the week where Monday is 0 and Sunday is 6.
+        """
+        # 1970-01-01 was a Thursday
+        return (self._get_days() + 3) % 7
+
+    def isocalendar(self):
+        """
+        Returns the ISO year, ISO week number and ISO weekday as arrays, see
+        :meth:`datetime.date.isocalendar`.
+        """
+        days = self._get_days()
+        weekday = (days + 3) % 7
+        # the ISO year is the year of the Thursday of the week
+        thursday = days - weekday + 3
+        years = thursday.view(native_str('M8[D]')).astype(native_str('M8[Y]'))
+        year_start = years.astype(native_str('M8[D]')).astype(np.int64)
+        week = (thursday - year_start) // 7 + 1
+        return years.astype(np.int64) + 1970, week, weekday + 1
+
+    def _get_hours_after_midnight(self):
+        """
+        Floating point hours after midnight.
+        """
+        return self.ns % NS_PER_DAY / 3600e9
+
+
 if __name__ == '__main__':
     import doctest
     doctest.testmod(exclude_empty=True)
@@ -18,11 +18,10 @@ import io
 import os
 import sys
 import tempfile
-from collections import OrderedDict
+from collections import Mapping, OrderedDict
 
 import numpy as np
 import pkg_resources
-import requests
 from future.utils import native_str
 from pkg_resources import iter_entry_points
 
@@ -34,24 +33,40 @@ DEFAULT_MODULES = ['clients.filesystem', 'core', 'db', 'geodetics', 'imaging',
                    'io.ah', 'io.arclink', 'io.ascii', 'io.cmtsolution',
                    'io.cnv', 'io.css', 'io.win', 'io.gcf', 'io.gse2',
                    'io.json', 'io.kinemetrics', 'io.kml', 'io.mseed', 'io.ndk',
-                   'io.nied', 'io.nlloc', 'io.nordic', 'io.pdas', 'io.pde',
-                   'io.quakeml', 'io.reftek', 'io.sac', 'io.scardec',
-                   'io.seg2', 'io.segy', 'io.seisan', 'io.sh', 'io.shapefile',
-                   'io.seiscomp', 'io.stationtxt', 'io.stationxml', 'io.wav',
-                   'io.xseed', 'io.y', 'io.zmap', 'realtime', 'scripts',
-                   'signal', 'taup']
+                   'io.nied', 'io.nlloc', 'io.nordic', 'io.obspybin',
+                   'io.pdas', 'io.pde', 'io.quakeml', 'io.reftek', 'io.sac',
+                   'io.scardec', 'io.seg2', 'io.segy', 'io.seisan', 'io.sh',
+                   'io.shapefile', 'io.seiscomp', 'io.stationtxt',
+                   'io.stationxml', 'io.wav', 'io.xseed', 'io.y', 'io.zmap',
+                   'realtime', 'scripts', 'signal', 'taup']
 NETWORK_MODULES = ['clients.arclink', 'clients.earthworm', 'clients.fdsn',
                    'clients.iris', 'clients.neic', 'clients.nrl',
                    'clients.seedlink', 'clients.seishub', 'clients.syngine']
 ALL_MODULES = DEFAULT_MODULES + NETWORK_MODULES
 
 # default order of automatic format detection
-WAVEFORM_PREFERRED_ORDER = ['MSEED', 'SAC', 'GSE2', 'SEISAN', 'SACXY', 'GSE1',
-                            'Q', 'SH_ASC', 'SLIST', 'TSPAIR', 'Y', 'PICKLE',
-                            'SEGY', 'SU', 'SEG2', 'WAV', 'WIN', 'CSS',
-                            'NNSA_KB_CORE', 'AH', 'PDAS', 'KINEMETRICS_EVT',
-                            'GCF']
+WAVEFORM_PREFERRED_ORDER = ['MSEED', 'OBSPYBIN', 'SAC', 'GSE2', 'SEISAN',
+                            'SACXY', 'GSE1', 'Q', 'SH_ASC', 'SLIST', 'TSPAIR',
+                            'Y', 'PICKLE', 'SEGY', 'SU', 'SEG2', 'WAV', 'WIN',
+                            'CSS', 'NNSA_KB_CORE', 'AH', 'PDAS',
+                            'KINEMETRICS_EVT', 'GCF']
 EVENT_PREFERRED_ORDER = ['QUAKEML', 'NLLOC_HYP']
+# Byte strings of which a file of the given plug-in type and format has to
+# start with one. Used to skip the isFormat() check of a format during format
+# detection, so only add formats whose isFormat() check requires the prefix.
+FORMAT_SIGNATURES = {
+    'waveform': {
+        'GSE1': (b'WID1', b'XW01'),
+        'KNET': (b'Origin Time',),
+        'OBSPYBIN': (b'OBSPYBIN',),
+        'Q': (b'43981',),
+        'SEG2': (b'\x55\x3a', b'\x3a\x55'),
+        'SH_ASC': (b'DELTA:',),
+        'SLIST': (b'TIMESERIES',),
+        'TSPAIR': (b'TIMESERIES',),
+        'WAV': (b'RIFF',),
+    },
+}
 # waveform plugins accepting a byteorder keyword
 WAVEFORM_ACCEPT_BYTEORDER = ['MSEED', 'Q', 'SAC', 'SEGY', 'SU']
 
@@ -259,25 +274,62 @@ def _get_ordered_entry_points(group, subgroup=None, order_list=[]):
     return entry_points
 
 
-ENTRY_POINTS = {
-    'trigger': _get_entry_points('obspy.plugin.trigger'),
-    'filter': _get_entry_points('obspy.plugin.filter'),
-    'rotate': _get_entry_points('obspy.plugin.rotate'),
-    'detrend': _get_entry_points('obspy.plugin.detrend'),
-    'interpolate': _get_entry_points('obspy.plugin.interpolate'),
-    'integrate': _get_entry_points('obspy.plugin.integrate'),
-    'differentiate': _get_entry_points('obspy.plugin.differentiate'),
-    'waveform': _get_ordered_entry_points(
-        'obspy.plugin.waveform', 'readFormat', WAVEFORM_PREFERRED_ORDER),
-    'waveform_write': _get_ordered_entry_points(
-        'obspy.plugin.waveform', 'writeFormat', WAVEFORM_PREFERRED_ORDER),
-    'event': _get_entry_points('obspy.plugin.event', 'readFormat'),
-    'event_write': _get_entry_points('obspy.plugin.event', 'writeFormat'),
-    'taper': _get_entry_points('obspy.plugin.taper'),
-    'inventory': _get_entry_points('obspy.plugin.inventory', 'readFormat'),
-    'inventory_write': _get_entry_points(
-        'obspy.plugin.inventory', 'writeFormat'),
-}
+class _LazyEntryPoints(Mapping):
+    """
+    Dictionary of entry points per plug-in type that scans the installed
+    entry points of a plug-in type only on first access.
+
+    Scanning the entry points of all plug-in types at import time is a
+    noticeable part of the time needed for ``import obspy``.
+
+    >>> eps = _LazyEntryPoints({
+    ...     'detrend': (_get_entry_points, ('obspy.plugin.detrend',))})
+    >>> eps._cache
+    {}
+    >>> print(sorted(eps['detrend']))  # doctest: +ELLIPSIS
+    [...'linear', ...'simple'...]
+    >>> list(eps._cache)  # doctest: +ELLIPSIS
+    [...'detrend']
+    """
+    def __init__(self, loaders):
+        self._loaders = loaders
+        self._cache = {}
+
+    def __getitem__(self, key):
+        try:
+            return self._cache[key]
+        except KeyError:
+            func, args = self._loaders[key]
+            value = self._cache[key] = func(*args)
+            return value
+
+    def __iter__(self):
+        return iter(self._loaders)
+
+    def __len__(self):
+        return len(self._loaders)
+
+
+ENTRY_POINTS = _LazyEntryPoints({
+    'trigger': (_get_entry_points, ('obspy.plugin.trigger',)),
+    'filter': (_get_entry_points, ('obspy.plugin.filter',)),
+    'rotate': (_get_entry_points, ('obspy.plugin.rotate',)),
+    'detrend': (_get_entry_points, ('obspy.plugin.detrend',)),
+    'interpolate': (_get_entry_points, ('obspy.plugin.interpolate',)),
+    'integrate': (_get_entry_points, ('obspy.plugin.integrate',)),
+    'differentiate': (_get_entry_points, ('obspy.plugin.differentiate',)),
+    'waveform': (_get_ordered_entry_points, (
+        'obspy.plugin.waveform', 'readFormat', WAVEFORM_PREFERRED_ORDER)),
+    'waveform_write': (_get_ordered_entry_points, (
+        'obspy.plugin.waveform', 'writeFormat', WAVEFORM_PREFERRED_ORDER)),
+    'event': (_get_entry_points, ('obspy.plugin.event', 'readFormat')),
+    'event_write': (_get_entry_points, ('obspy.plugin.event', 'writeFormat')),
+    'taper': (_get_entry_points, ('obspy.plugin.taper',)),
+    'inventory': (_get_entry_points, (
+        'obspy.plugin.inventory', 'readFormat')),
+    'inventory_write': (_get_entry_points, (
+        'obspy.plugin.inventory', 'writeFormat')),
+})
 
 
 def _get_function_from_entry_point(group, type):
@@ -358,6 +410,64 @@ BASEMAP_VERSION = get_dependency_version('basemap')
 CARTOPY_VERSION = get_dependency_version('cartopy')
 
 
+def _get_file_signature(filename, size=16):
+    """
+    Returns the first bytes of a file or file-like object (or ``None`` if
+    they can not be read) without moving the file pointer.
+    """
+    try:
+        if isinstance(filename, (str, native_str)):
+            with open(filename, 'rb') as fh:
+                return fh.read(size)
+        position = filename.tell()
+        try:
+            signature = filename.read(size)
+        finally:
+            filename.seek(position, 0)
+    except Exception:
+        return None
+    if not isinstance(signature, bytes):
+        return None
+    return signature
+
+
+def _detect_format(plugin_type, filename):
+    """
+    Returns the entry point of the format of a file.
+
+    Formats are checked in the order of the entry points. Formats whose
+    signature in :data:`FORMAT_SIGNATURES` does not match the
+    first bytes of the file are skipped without calling their isFormat()
+    function.
+    """
+    eps = ENTRY_POINTS[plugin_type]
+    signatures = FORMAT_SIGNATURES.get(plugin_type, {})
+    signature = _get_file_signature(filename)
+    for name, format_ep in eps.items():
+        if signature is not None and name in signatures and \
+                not signature.startswith(signatures[name]):
+            continue
+        # search isFormat for given entry point
+        is_format = buffered_load_entry_point(
+            format_ep.dist.key,
+            'obspy.plugin.%s.%s' % (plugin_type, format_ep.name),
+            'isFormat')
+        # If it is a file-like object, store the position and restore it
+        # later to avoid that the isFormat() functions move the file
+        # pointer.
+        if hasattr(filename, "tell") and hasattr(filename, "seek"):
+            position = filename.tell()
+        else:
+            position = None
+        # check format
+        is_format = is_format(filename)
+        if position is not None:
+            filename.seek(0, 0)
+        if is_format:
+            return format_ep
+    raise TypeError('Unknown format for file %s' % filename)
+
+
 def _read_from_plugin(plugin_type, filename, format=None, **kwargs):
     """
     Reads a single file from a plug-in's readFormat function.
@@ -366,28 +476,8 @@ def _read_from_plugin(plugin_type, filename, format=None, **kwargs):
     # get format entry point
     format_ep = None
     if not format:
-        # auto detect format - go through all known formats in given sort order
-        for format_ep in eps.values():
-            # search isFormat for given entry point
-            is_format = buffered_load_entry_point(
-                format_ep.dist.key,
-                'obspy.plugin.%s.%s' % (plugin_type, format_ep.name),
-                'isFormat')
-            # If it is a file-like object, store the position and restore it
-            # later to avoid that the isFormat() functions move the file
-            # pointer.
-            if hasattr(filename, "tell") and hasattr(filename, "seek"):
-                position = filename.tell()
-            else:
-                position = None
-            # check format
-            is_format = is_format(filename)
-            if position is not None:
-                filename.seek(0, 0)
-            if is_format:
-                break
-        else:
-            raise TypeError('Unknown format for file %s' % filename)
+        # auto detect format
+        format_ep = _detect_format(plugin_type, filename)
     else:
         # format given via argument
         format = format.upper()
@@ -468,9 +558,12 @@ def make_format_plugin_table(group="waveform", method="read", numspaces=4,
     mod_list = []
     for name, ep in eps.items():
         module_short = ":mod:`%s`" % ".".join(ep.module_name.split(".")[:3])
-        ep_list = [ep.dist.key, "obspy.plugin.%s.%s" % (group, name), method]
-        func = buffered_load_entry_point(*ep_list)
-        func_str = ':func:`%s`' % ".".join((ep.module_name, func.__name__))
+        # only look up the name of the function, importing all plug-in
+        # modules here would considerably slow down ``import obspy``
+        func_ep = ep.dist.get_entry_info(
+            "obspy.plugin.%s.%s" % (group, name), method)
+        func_str = ':func:`%s`' % ".".join((ep.module_name,
+                                            func_ep.attrs[-1]))
         mod_list.append((name, module_short, func_str))
 
     mod_list = sorted(mod_list)
@@ -544,6 +637,8 @@ def download_to_file(url, filename_or_buffer, chunk_size=1024):
     :param chunk_size: The chunk size in bytes.
     :type chunk_size: int
     """
+    import requests
+
     # Workaround for old request versions.
     try:
         r = requests.get(url, stream=True)
@@ -14,8 +14,11 @@ from future.builtins import *  # NOQA
 
 import functools
 import inspect
+import io
+import itertools
 import os
 import re
+import shutil
 import socket
 import tarfile
 import threading
@@ -140,10 +143,158 @@ def skip_on_network_error(func, *args, **kwargs):
         raise
 
 
+def _load_lazy_data(stream):
+    """
+    Loads deferred data of all traces of a stream, e.g. before the file or
+    buffer the data is read from gets closed.
+    """
+    for trace in getattr(stream, "traces", []):
+        if trace._lazy_data is not None:
+            trace.data = trace._lazy_data.load()
+
+
+class _SequentialReader(io.BufferedIOBase):
+    """
+    File-like object that only allows to read a file object sequentially,
+    e.g. to decompress a gzip file on the fly.
+
+    Seeking relative to the start or the current position is passed on to
+    the wrapped file object, but the size of the data is unknown, i.e.
+    seeking to the end of the file and ``fileno()`` raise an
+    ``io.UnsupportedOperation``.
+    """
+    def __init__(self, fileobj):
+        self._fileobj = fileobj
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return False
+
+    def read(self, size=-1):
+        if size is None:
+            size = -1
+        return self._fileobj.read(size)
+
+    read1 = read
+
+    def readinto(self, b):
+        data = self.read(len(b))
+        b[:len(data)] = data
+        return len(data)
+
+    def readline(self, size=-1):
+        return self._fileobj.readline(size)
+
+    def tell(self):
+        return self._fileobj.tell()
+
+    def seek(self, offset, whence=0):
+        if whence == 2:
+            msg = "Seeking to the end of a sequential file is not supported."
+            raise io.UnsupportedOperation(msg)
+        return self._fileobj.seek(offset, whence)
+
+    def close(self):
+        self._fileobj.close()
+        super(_SequentialReader, self).close()
+
+
+def _read_uncompressed(func, fileobj, *args, **kwargs):
+    """
+    Calls ``func`` with a file-like object with the uncompressed data.
+
+    Readers that do not support file-like objects usually raise a
+    ``TypeError`` (also the format autodetection raises a ``TypeError`` if no
+    plug-in recognizes the file-like object), readers that need random
+    access to a sequential file raise an ``io.UnsupportedOperation``. In
+    this case the data of a sequential file is read into memory and passed
+    on again, otherwise it is written to a temporary file which is read
+    instead.
+    """
+    try:
+        stream = func(fileobj, *args, **kwargs)
+        _load_lazy_data(stream)
+    except (TypeError, io.UnsupportedOperation):
+        fileobj.seek(0, 0)
+        if not fileobj.seekable():
+            with io.BytesIO(fileobj.read()) as buf:
+                return _read_uncompressed(func, buf, *args, **kwargs)
+        with NamedTemporaryFile() as tempfile:
+            shutil.copyfileobj(fileobj, tempfile._fileobj)
+            stream = func(tempfile.name, *args, **kwargs)
+            # Deferred data has to be loaded before the temporary file
+            # gets removed.
+            _load_lazy_data(stream)
+    return stream
+
+
+def _iter_tar_members(filename):
+    """
+    Yields functions returning a file-like object of each non-empty regular
+    file in a tar archive. The archive is read as a stream, so only the
+    member that is currently read is kept in memory.
+    """
+    try:
+        # reading with transparent compression
+        with tarfile.open(filename, 'r|*') as tar:
+            for tarinfo in tar:
+                # only handle regular files
+                if not tarinfo.isfile():
+                    continue
+                data = tar.extractfile(tarinfo).read()
+                # Skip empty files - we don't need them no matter what
+                # and it guards against rare cases where waveforms files
+                # are also slightly valid tar-files.
+                if not data:
+                    continue
+                yield functools.partial(io.BytesIO, data)
+    except Exception:
+        return
+
+
+def _open_gzip(filename):
+    """
+    Returns a file-like object decompressing a gzip file while it is read.
+    """
+    import gzip
+    return _SequentialReader(gzip.open(filename, 'rb'))
+
+
+def _is_gzip(filename):
+    """
+    Checks if a file is gzip compressed and can be decompressed.
+    """
+    import gzip
+    try:
+        with open(filename, 'rb') as fp:
+            if fp.read(2) != b'\x1f\x8b':
+                return False
+        with gzip.open(filename, 'rb') as fp:
+            fp.read(1)
+    except Exception:
+        return False
+    return True
+
+
+def _read_zip_member(zip, name):
+    """
+    Returns a file-like object with the uncompressed data of a zip member.
+    """
+    return io.BytesIO(zip.read(name))
+
+
 @decorator
 def uncompress_file(func, filename, *args, **kwargs):
     """
     Decorator used for temporary uncompressing file if .gz or .bz2 archive.
+
+    The uncompressed data is passed to the decorated function as a file-like
+    object. Gzip compressed files are decompressed while they are read, the
+    data of archive members and bzip2 compressed files is passed in memory.
+    Only if the decorated function does not support file-like objects the
+    data is written to a temporary file.
     """
     if not kwargs.get('check_compression', True):
         return func(filename, *args, **kwargs)
@@ -152,29 +303,21 @@ def uncompress_file(func, filename, *args, **kwargs):
     elif not os.path.exists(filename):
         msg = "File not found '%s'" % (filename)
         raise IOError(msg)
-    # check if we got a compressed file or archive
+    # check if we got a compressed file or archive, obj_list contains
+    # functions returning a file-like object of each uncompressed file
     obj_list = []
     if tarfile.is_tarfile(filename):
-        try:
-            # reading with transparent compression
-            with tarfile.open(filename, 'r|*') as tar:
-                for tarinfo in tar:
-                    # only handle regular files
-                    if not tarinfo.isfile():
-                        continue
-                    data = tar.extractfile(tarinfo).read()
-                    # Skip empty files - we don't need them no matter what
-                    # and it guards against rare cases where waveforms files
-                    # are also slightly valid tar-files.
-                    if not data:
-                        continue
-                    obj_list.append(data)
-        except Exception:
-            pass
+        members = _iter_tar_members(filename)
+        # only read as an archive if there is at least one member
+        for get_fileobj in members:
+            obj_list = itertools.chain([get_fileobj], members)
+            break
     elif zipfile.is_zipfile(filename):
         try:
             zip = zipfile.ZipFile(filename)
-            obj_list = [zip.read(name) for name in zip.namelist()]
+            # members are only decompressed when they are read
+            obj_list = [functools.partial(_read_zip_member, zip, name)
+                        for name in zip.namelist()]
         except Exception:
             pass
     elif filename.endswith('.bz2'):
@@ -182,30 +325,26 @@ def uncompress_file(func, filename, *args, **kwargs):
         try:
             import bz2
             with open(filename, 'rb') as fp:
-                obj_list.append(bz2.decompress(fp.read()))
-        except Exception:
-            pass
-    elif filename.endswith('.gz'):
-        # gzip module
-        try:
-            import gzip
-            with gzip.open(filename, 'rb') as fp:
-                obj_list.append(fp.read())
+                data = bz2.decompress(fp.read())
+            obj_list.append(functools.partial(io.BytesIO, data))
         except Exception:
             pass
+    elif filename.endswith('.gz') and _is_gzip(filename):
+        # gzip module, decompressed on the fly
+        obj_list.append(functools.partial(_open_gzip, filename))
     # handle results
     if obj_list:
-        # write results to temporary files
+        # decompressed data can not be memory-mapped
+        kwargs.pop('mmap', None)
         result = None
-        for obj in obj_list:
-            with NamedTemporaryFile() as tempfile:
-                tempfile._fileobj.write(obj)
-                stream = func(tempfile.name, *args, **kwargs)
-                # just add other stream objects to first stream
-                if result is None:
-                    result = stream
-                else:
-                    result += stream
+        for get_fileobj in obj_list:
+            with get_fileobj() as fileobj:
+                stream = _read_uncompressed(func, fileobj, *args, **kwargs)
+            # just add other stream objects to first stream
+            if result is None:
+                result = stream
+            else:
+                result += stream
     else:
         # no compressions
         result = func(filename, *args, **kwargs)
@@ -69,9 +69,29 @@ attribute of each trace.
 Several key word arguments are available which can be used for example to
 only read certain records from a file or force the header byteorder:
 ``starttime``, ``endtime``, ``headonly``, ``sourcename``, ``reclen``,
-``details``, and ``header_byteorder``. They are passed to the
-:meth:`~obspy.io.mseed.core._read_mseed` method so refer to it for details to
-each parameter.
+``details``, ``header_byteorder``, ``lazy``, ``index``, and ``threads``.
+They are passed to the :meth:`~obspy.io.mseed.core._read_mseed` method so
+refer to it for details to each parameter.
+
+With ``lazy=True`` only the record headers are parsed and the data of each
+trace is decoded on first access. Trimming, slicing and selecting such traces
+works on the record level, which makes extracting short time windows or
+single channels from large files very fast.
+
+With ``index=True`` the record headers are additionally stored in an index
+file next to the data file (``<filename>.index.npz``). Subsequent reads use
+it to only read the records matching the ``starttime``, ``endtime`` and
+``sourcename`` selection from the file. The index is rebuilt whenever the size
+or the modification time of the data file changes.
+
+Inputs that are too large to be read at once or that are not files at all,
+like pipes or sockets, can be processed record by record in constant memory
+with :func:`~obspy.io.mseed.util.iter_records` and
+:func:`~obspy.io.mseed.util.iter_traces`.
+
+>>> from obspy.io.mseed.util import iter_traces
+>>> for tr in iter_traces("/path/to/test.mseed"):  # doctest: +SKIP
+...     rt_trace.append(tr)
 
 Writing
 -------
@@ -101,6 +121,18 @@ Many of these can also be set at each Trace`s ``stats.mseed`` attribute which
 allows for per Trace granularity. Values passed to the
 :func:`~obspy.core.stream.read` function have priority.
 
+Data that arrives in small pieces, e.g. from an acquisition system, can be
+written with a :class:`~obspy.io.mseed.core.MSEEDWriter`. It appends every
+complete record to the output as soon as there are enough samples and only
+writes partially filled records when it is flushed or closed. Existing files,
+e.g. the day files of an SDS archive, are appended to without reading them.
+
+>>> from obspy.io.mseed.core import MSEEDWriter
+>>> with MSEEDWriter("{network}.{station}.{location}.{channel}.{year}"
+...                  ".{doy:03d}", reclen=512) as writer:  # doctest: +SKIP
+...     for packet in packets:
+...         writer.write(packet)
+
 
 Encoding Support
 ----------------
@@ -140,6 +172,10 @@ some purposes. Refer to the documentation of each for details.
 +----------------------------------------------------------+--------------------------------------------------------------------------+
 | :func:`~obspy.io.mseed.util.set_flags_in_fixed_headers`  | Updates a given miniSEED file with some fixed header flags.              |
 +----------------------------------------------------------+--------------------------------------------------------------------------+
+| :func:`~obspy.io.mseed.util.iter_records`                | Yields the records of a file or stream one by one as Traces.             |
++----------------------------------------------------------+--------------------------------------------------------------------------+
+| :func:`~obspy.io.mseed.util.iter_traces`                 | Yields the data of a file or stream in chunks in constant memory.        |
++----------------------------------------------------------+--------------------------------------------------------------------------+
 """
 from __future__ import (absolute_import, division, print_function,
                         unicode_literals)
@@ -11,6 +11,8 @@ import ctypes as C
 import io
 import os
 import warnings
+from contextlib import contextmanager
+from multiprocessing.pool import ThreadPool
 from struct import pack
 
 import numpy as np
@@ -18,13 +20,18 @@ import numpy as np
 from obspy import Stream, Trace, UTCDateTime
 from obspy.core.util import NATIVE_BYTEORDER
 from . import (util, InternalMSEEDError, ObsPyMSEEDFilesizeTooSmallError,
-               ObsPyMSEEDFilesizeTooLargeError)
+               ObsPyMSEEDFilesizeTooLargeError, ObsPyMSEEDReadingError)
 from .headers import (DATATYPES, ENCODINGS, HPTERROR, HPTMODULUS, SAMPLETYPE,
                       SEED_CONTROL_HEADERS, UNSUPPORTED_ENCODINGS,
                       VALID_CONTROL_HEADERS, VALID_RECORD_LENGTHS, Selections,
                       SelectTime, Blkt100S, Blkt1001S, clibmseed)
 
 
+# Encodings used for writing if none is given.
+_DEFAULT_ENCODINGS = {np.int32: 11, np.float32: 4, np.float64: 5, np.int16: 1,
+                      np.dtype(native_str('|S1')).type: 0}
+
+
 def _is_mseed(filename):
     """
     Checks whether a file is Mini-SEED/full SEED or not.
@@ -57,9 +64,14 @@ def _is_mseed(filename):
                 file_size = os.fstat(filename.fileno()).st_size
             except Exception:
                 _p = filename.tell()
-                filename.seek(0, 2)
-                file_size = filename.tell()
-                filename.seek(_p, 0)
+                try:
+                    filename.seek(0, 2)
+                except io.UnsupportedOperation:
+                    # sequential file, e.g. decompressed on the fly
+                    file_size = None
+                else:
+                    file_size = filename.tell()
+                    filename.seek(_p, 0)
             return __is_mseed(filename, file_size)
         finally:
             # Reset pointer.
@@ -134,8 +146,10 @@ def __is_mseed(fp, file_size):  # NOQA
     fp.seek(record_length + 6, 0)
     # Loop over all records and return True if one record is a data
     # record
-    while fp.tell() < file_size:
+    while file_size is None or fp.tell() < file_size:
         flag = fp.read(1)
+        if not flag:
+            break
         if flag in [b'D', b'R', b'Q', b'M']:
             return True
         fp.seek(record_length - 1, 1)
@@ -144,7 +158,8 @@ def __is_mseed(fp, file_size):  # NOQA
 
 def _read_mseed(mseed_object, starttime=None, endtime=None, headonly=False,
                 sourcename=None, reclen=None, details=False,
-                header_byteorder=None, verbose=None, **kwargs):
+                header_byteorder=None, verbose=None, lazy=False, index=False,
+                threads=1, **kwargs):
     """
     Reads a Mini-SEED file and returns a Stream object.
 
@@ -190,6 +205,30 @@ def _read_mseed(mseed_object, starttime=None, endtime=None, headonly=False,
         little-endian, ``1`` or ``'>'`` for MBF or big-endian. ``'='`` is the
         native byte order. Used to enforce the header byte order. Useful in
         some rare cases where the automatic byte order detection fails.
+    :type lazy: bool, optional
+    :param lazy: If ``True``, only the record headers are parsed and the
+        data of each trace is read and decoded on first access of its
+        ``data`` attribute. Selecting, trimming and slicing such traces
+        happens on the record level without decoding any data so only the
+        records that are finally needed are ever decoded. If a file name is
+        given, the records are read from the file again when the data is
+        accessed, so the file must not be changed or removed in the
+        meantime. Defaults to ``False``.
+    :type index: bool or str, optional
+    :param index: If ``True``, the headers of all records in the file are
+        stored in an index file next to it (``<filename>.index.npz``) that is
+        used by subsequent reads instead of parsing the file again. Reads
+        with ``starttime``, ``endtime`` or ``sourcename`` then only read the
+        matching records from the file. The index is rebuilt automatically
+        if the size or modification time of the file changes. Pass a file
+        name to store the index somewhere else, e.g. for read-only archives.
+        Only has an effect when reading from a file name. Defaults to
+        ``False``.
+    :type threads: int, optional
+    :param threads: Number of threads used to decode the data. If larger than
+        ``1``, the records of each trace are split into pieces which are
+        decompressed in parallel. Does not apply to lazily read data and is
+        ignored if ``reclen`` is given. Defaults to ``1``.
 
     .. rubric:: Example
 
@@ -226,6 +265,18 @@ def _read_mseed(mseed_object, starttime=None, endtime=None, headonly=False,
 
     >>> print(len(st))
     101
+
+    Read with ``lazy=True`` to defer decoding the data until it is actually
+    needed. Only the records required for the final time window are decoded.
+
+    >>> st = read("/path/to/test.mseed", lazy=True)
+    >>> st.trim(st[0].stats.starttime, st[0].stats.starttime + 10)
+    ... # doctest: +ELLIPSIS
+    <...Stream object at 0x...>
+    >>> print(st[0].stats.npts)
+    401
+    >>> print(st[0].data[:5])
+    [2787 2776 2774 2780 2783]
     """
     # Parse the headonly and reclen flags.
     if headonly is True:
@@ -258,6 +309,11 @@ def _read_mseed(mseed_object, starttime=None, endtime=None, headonly=False,
     else:
         bo = None
 
+    # File-like objects that can only be read sequentially, e.g. decompressed
+    # on the fly, are read into memory as the records are located by seeking.
+    if hasattr(mseed_object, "seekable") and not mseed_object.seekable():
+        mseed_object = io.BytesIO(mseed_object.read())
+
     # Determine total size. Either its a file-like object.
     if hasattr(mseed_object, "tell") and hasattr(mseed_object, "seek"):
         cur_pos = mseed_object.tell()
@@ -272,7 +328,7 @@ def _read_mseed(mseed_object, starttime=None, endtime=None, headonly=False,
         msg = "The smallest possible mini-SEED record is made up of 128 " \
               "bytes. The passed buffer or file contains only %i." % length
         raise ObsPyMSEEDFilesizeTooSmallError(msg)
-    elif length > 2 ** 31:
+    elif length > 2 ** 31 and not lazy:
         msg = ("ObsPy can currently not directly read mini-SEED files that "
                "are larger than 2^31 bytes (2048 MiB). To still read it, "
                "please read the file in chunks as documented here: "
@@ -304,10 +360,31 @@ def _read_mseed(mseed_object, starttime=None, endtime=None, headonly=False,
     # Only keep information relevant for the whole file.
     info = {'filesize': info['filesize']}
 
+    index_filename = None
+    if index and isinstance(mseed_object, (str, native_str)):
+        index_filename = index if isinstance(index, (str, native_str)) \
+            else mseed_object + util.RECORD_INDEX_SUFFIX
+        # Take the file status before reading it so changes during reading
+        # invalidate the index.
+        stat = os.stat(mseed_object)
+        records = util._load_record_index(
+            index_filename, stat, header_byteorder=header_byteorder)
+        if records is not None:
+            return _read_mseed_records(
+                records, source=mseed_object, starttime=starttime,
+                endtime=endtime, sourcename=sourcename, details=details,
+                header_byteorder=header_byteorder, info=info, lazy=lazy,
+                headonly=headonly, threads=threads)
+
     # If it's a file name just read it.
     if isinstance(mseed_object, (str, native_str)):
-        # Read to NumPy array which is used as a buffer.
-        bfr_np = np.fromfile(mseed_object, dtype=np.int8)
+        if lazy and not headonly or index_filename is not None:
+            # Only the headers are needed - let the OS decide which parts of
+            # the file to actually load into memory.
+            bfr_np = np.memmap(mseed_object, dtype=np.int8, mode='r')
+        else:
+            # Read to NumPy array which is used as a buffer.
+            bfr_np = np.fromfile(mseed_object, dtype=np.int8)
     elif hasattr(mseed_object, 'read'):
         bfr_np = np.fromstring(mseed_object.read(), dtype=np.int8)
 
@@ -333,7 +410,26 @@ def _read_mseed(mseed_object, starttime=None, endtime=None, headonly=False,
             continue
         break
     bfr_np = bfr_np[offset:]
-    buflen = len(bfr_np)
+
+    if threads > 1 and reclen == -1 and not headonly or \
+            lazy and not headonly or index_filename is not None:
+        if isinstance(mseed_object, (str, native_str)) and \
+                (lazy or index_filename is not None):
+            source = mseed_object
+        else:
+            source = bfr_np
+            offset = 0
+        records = util._get_record_table(
+            bfr_np, offset=offset, header_byteorder=header_byteorder)
+        if index_filename is not None:
+            util._save_record_index(
+                index_filename, records, stat,
+                header_byteorder=header_byteorder)
+        return _read_mseed_records(
+            records, source=source, starttime=starttime, endtime=endtime,
+            sourcename=sourcename, details=details,
+            header_byteorder=header_byteorder, info=info, lazy=lazy,
+            headonly=headonly, threads=threads)
 
     # If no selection is given pass None to the C function.
     if starttime is None and endtime is None and sourcename is None:
@@ -371,6 +467,40 @@ def _read_mseed(mseed_object, starttime=None, endtime=None, headonly=False,
                 encode('ascii', 'ignore')
         else:
             selections.srcname = b'*'
+    traces = []
+    for header, data in _read_mseed_buffer(
+            bfr_np, selections=selections, unpack_data=unpack_data,
+            reclen=reclen, verbose=verbose, details=details,
+            header_byteorder=header_byteorder, offset=offset):
+        trace = Trace(header=header, data=data)
+        # Append global information.
+        for key, value in info.items():
+            setattr(trace.stats.mseed, key, value)
+        traces.append(trace)
+    del selections
+    return Stream(traces=traces)
+
+
+def _read_mseed_buffer(bfr_np, selections=None, unpack_data=1, reclen=-1,
+                       verbose=None, details=False, header_byteorder=-1,
+                       offset=0, lib=clibmseed):
+    """
+    Reads all data records in a buffer with libmseed.
+
+    Returns a list of ``(header, data)`` tuples, one for each continuous
+    segment of data.
+
+    :type bfr_np: :class:`numpy.ndarray` of dtype int8
+    :param bfr_np: Buffer starting with a data record.
+    :param offset: Offset of the buffer in the file, only used to produce
+        better error messages.
+    :param lib: The libmseed library to use. Pass ``clibmseed.lib`` to call
+        it directly without setting up its logging, e.g. from multiple threads
+        within
+        :meth:`~obspy.io.mseed.headers._LibmseedWrapper.logging_to_python`.
+
+    See :func:`_read_mseed` for the other parameters.
+    """
     all_data = []
 
     # Use a callback function to allocate the memory and keep track of the
@@ -394,10 +524,11 @@ def _read_mseed(mseed_object, starttime=None, endtime=None, headonly=False,
     except Exception:
         verbose = 0
 
-    clibmseed.verbose = bool(verbose)
+    if lib is clibmseed:
+        clibmseed.verbose = bool(verbose)
     try:
-        lil = clibmseed.readMSEEDBuffer(
-            bfr_np, buflen, selections, C.c_int8(unpack_data),
+        lil = lib.readMSEEDBuffer(
+            bfr_np, len(bfr_np), selections, C.c_int8(unpack_data),
             reclen, C.c_int8(verbose), C.c_int8(details), header_byteorder,
             alloc_data)
     except InternalMSEEDError as e:
@@ -415,32 +546,32 @@ def _read_mseed(mseed_object, starttime=None, endtime=None, headonly=False,
             raise
     finally:
         # Make sure to reset the verbosity.
-        clibmseed.verbose = True
+        if lib is clibmseed:
+            clibmseed.verbose = True
 
-    del selections
-
-    traces = []
+    segments = []
     try:
         current_id = lil.contents
     # Return stream if not traces are found.
     except ValueError:
-        clibmseed.lil_free(lil)
+        lib.lil_free(lil)
         del lil
-        return Stream()
+        return segments
 
     while True:
         # Init header with the essential information.
-        header = {'network': current_id.network.strip(),
-                  'station': current_id.station.strip(),
-                  'location': current_id.location.strip(),
-                  'channel': current_id.channel.strip(),
-                  'mseed': {'dataquality': current_id.dataquality}}
+        id_header = {'network': current_id.network.strip(),
+                     'station': current_id.station.strip(),
+                     'location': current_id.location.strip(),
+                     'channel': current_id.channel.strip()}
         # Loop over segments.
         try:
             current_segment = current_id.firstSegment.contents
         except ValueError:
             break
         while True:
+            header = dict(id_header)
+            header['mseed'] = {'dataquality': current_id.dataquality}
             header['sampling_rate'] = current_segment.samprate
             header['starttime'] = \
                 util._convert_mstime_to_datetime(current_segment.starttime)
@@ -460,7 +591,7 @@ def _read_mseed(mseed_object, starttime=None, endtime=None, headonly=False,
                     current_segment.calibration_type \
                     if current_segment.calibration_type != -1 else False
 
-            if headonly is False:
+            if unpack_data:
                 # The data always will be in sequential order.
                 data = all_data.pop(0)
                 header['npts'] = len(data)
@@ -474,11 +605,7 @@ def _read_mseed(mseed_object, starttime=None, endtime=None, headonly=False,
                                    for k, v in header['mseed'].items())
             header = dict((k, v.decode()) if isinstance(v, bytes) else (k, v)
                           for k, v in header.items())
-            trace = Trace(header=header, data=data)
-            # Append global information.
-            for key, value in info.items():
-                setattr(trace.stats.mseed, key, value)
-            traces.append(trace)
+            segments.append((header, data))
             # A Null pointer access results in a ValueError
             try:
                 current_segment = current_segment.next.contents
@@ -489,11 +616,231 @@ def _read_mseed(mseed_object, starttime=None, endtime=None, headonly=False,
         except ValueError:
             break
 
-    clibmseed.lil_free(lil)  # NOQA
+    lib.lil_free(lil)  # NOQA
     del lil  # NOQA
+    return segments
+
+
+def _read_mseed_records(records, source, starttime=None, endtime=None,
+                        sourcename=None, details=False, header_byteorder=-1,
+                        info=None, lazy=True, headonly=False, threads=1):
+    """
+    Creates a Stream from a table of records.
+
+    The records are selected and grouped into traces the same way libmseed
+    does when reading a buffer. Only the records of the final traces are
+    read and decoded. See :func:`_read_mseed` for the parameters.
+
+    :type records: :class:`numpy.ndarray`
+    :param records: Record table as returned by
+        :func:`~obspy.io.mseed.util._get_record_table`.
+    :param source: File name or buffer the records will be read from. The
+        offsets of the records refer to it.
+    """
+    for value, name in ((starttime, "starttime"), (endtime, "endtime")):
+        if value is not None and not isinstance(value, UTCDateTime):
+            msg = '%s needs to be a UTCDateTime object' % name
+            raise ValueError(msg)
+    if sourcename is not None and \
+            not isinstance(sourcename, (str, native_str)):
+        msg = 'sourcename needs to be a string'
+        raise ValueError(msg)
+
+    records = records[util._select_records(
+        records, starttime=starttime, endtime=endtime,
+        sourcename=sourcename)]
+
+    traces = []
+    for indices in util._group_records(records, details=details):
+        recs = records[indices]
+        first = recs[0]
+        encoding = int(first["encoding"])
+        # libmseed does not determine the sample type of records without
+        # samples, an empty float array is returned for those.
+        if recs["samplecnt"].any():
+            dtype = np.dtype(DATATYPES[ENCODINGS[encoding][1].encode()])
+        else:
+            dtype = np.empty(0).dtype
+        header = {
+            'network': first["network"].decode(),
+            'station': first["station"].decode(),
+            'location': first["location"].decode(),
+            'channel': first["channel"].decode(),
+            'sampling_rate': float(first["samprate"]),
+            'starttime': util._convert_mstime_to_datetime(
+                int(first["starttime"])),
+            'mseed': {
+                'dataquality': first["dataquality"].decode(),
+                'number_of_records': len(recs),
+                'encoding': ENCODINGS[encoding][0],
+                'byteorder': "<" if first["byteorder"] == 0 else ">",
+                'record_length': int(first["reclen"])}}
+        if details:
+            timing_quality = int(first["timing_quality"])
+            header['mseed']['blkt1001'] = {
+                'timing_quality':
+                    timing_quality if timing_quality != 0xFF else False}
+            header['mseed']['calibration_type'] = \
+                int(first["calibration_type"]) \
+                if first["calibration_type"] != -1 else False
+        lazy_data = _LazyMSEEDData(
+            source=source,
+            records=recs[[native_str(_k)
+                          for _k in ("offset", "reclen", "samplecnt")]],
+            dtype=dtype,
+            header_byteorder=header_byteorder)
+        trace = Trace(header=header)
+        if headonly:
+            trace.stats.npts = len(lazy_data)
+        elif lazy or threads > 1:
+            trace._set_lazy_data(lazy_data)
+        else:
+            trace.data = lazy_data.load()
+        for key, value in (info or {}).items():
+            setattr(trace.stats.mseed, key, value)
+        traces.append(trace)
+    if threads > 1 and not lazy and not headonly:
+        _load_in_threads(traces, threads)
     return Stream(traces=traces)
 
 
+def _load_in_threads(traces, threads):
+    """
+    Loads the deferred data of the given traces using multiple threads.
+
+    The records of every trace are split into pieces that are decoded in
+    parallel. libmseed is called directly in the threads so the GIL is
+    released while decoding.
+    """
+    pieces = [(_i, piece) for _i, trace in enumerate(traces)
+              for piece in trace._lazy_data.split(threads)]
+
+    def load(piece):
+        return piece[1].load(lib=clibmseed.lib)
+
+    with clibmseed.logging_to_python("readMSEEDBuffer"):
+        pool = ThreadPool(min(threads, len(pieces)))
+        try:
+            results = pool.map(load, pieces)
+        finally:
+            pool.close()
+    data = [[] for _ in traces]
+    for (_i, _), result in zip(pieces, results):
+        data[_i].append(result)
+    for trace, _d in zip(traces, data):
+        trace.data = np.concatenate(_d) if len(_d) > 1 else _d[0]
+
+
+class _LazyMSEEDData(object):
+    """
+    Deferred data of a trace consisting of a list of MiniSEED records.
+
+    Only the locations of the records are kept. The records are read and
+    decoded when :meth:`load` is called. Slicing drops all records not
+    containing any requested samples without decoding anything.
+
+    Objects of this class are never modified after initialization, so they
+    can be shared between copies of a trace.
+
+    :param source: File name or int8 buffer containing the records.
+    :param records: Structured array with the ``offset``, ``reclen`` and
+        ``samplecnt`` of each record.
+    :param dtype: The dtype of the decoded data.
+    :param first: Number of samples to skip in the first record.
+    :param npts: Number of samples. Defaults to all samples after ``first``.
+    """
+    def __init__(self, source, records, dtype, first=0, npts=None,
+                 header_byteorder=-1):
+        self.source = source
+        self.records = records
+        self.dtype = dtype
+        self.first = first
+        if npts is None:
+            npts = int(records["samplecnt"].sum()) - first
+        self.npts = npts
+        self.header_byteorder = header_byteorder
+
+    def __len__(self):
+        return self.npts
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def slice(self, start, stop):
+        """
+        Returns the deferred data of the given range of samples.
+
+        ``start`` and ``stop`` follow the usual Python slicing semantics.
+        """
+        window = range(self.npts)[start:stop]
+        first = self.first + window.start
+        npts = len(window)
+        ends = np.cumsum(self.records["samplecnt"])
+        starts = ends - self.records["samplecnt"]
+        keep = (ends > first) & (starts < first + npts)
+        if keep.any():
+            first -= int(starts[keep][0])
+        else:
+            first = 0
+        return self.__class__(
+            source=self.source, records=self.records[keep], dtype=self.dtype,
+            first=first, npts=npts, header_byteorder=self.header_byteorder)
+
+    def split(self, parts):
+        """
+        Splits the deferred data at record boundaries.
+
+        Returns a list of at most ``parts`` objects that cover all samples
+        and have about the same number of records.
+        """
+        ends = np.cumsum(self.records["samplecnt"]) - self.first
+        bounds = ends[(ends > 0) & (ends < self.npts)]
+        if parts < 2 or not len(bounds):
+            return [self]
+        bounds = np.unique(bounds[(np.arange(1, parts) * len(bounds)) //
+                                  parts])
+        bounds = [0] + [int(_i) for _i in bounds] + [self.npts]
+        return [self.slice(start, stop)
+                for start, stop in zip(bounds[:-1], bounds[1:])]
+
+    def load(self, lib=clibmseed):
+        """
+        Reads and decodes the records and returns the data.
+
+        :param lib: The libmseed library to use, see
+            :func:`_read_mseed_buffer`.
+        """
+        if not self.npts:
+            return np.empty(0, dtype=self.dtype)
+        # Coalesce adjacent records to read them in one go.
+        offsets = self.records["offset"]
+        ends = offsets + self.records["reclen"]
+        breaks = np.nonzero(offsets[1:] != ends[:-1])[0] + 1
+        chunks = zip(offsets[np.concatenate([[0], breaks])],
+                     ends[np.concatenate([breaks - 1, [len(offsets) - 1]])])
+        if isinstance(self.source, (str, native_str)):
+            parts = []
+            with io.open(self.source, "rb") as fh:
+                for start, end in chunks:
+                    fh.seek(start, 0)
+                    parts.append(fh.read(end - start))
+            bfr_np = np.frombuffer(b"".join(parts), dtype=np.int8).copy()
+        else:
+            bfr_np = np.concatenate(
+                [self.source[start:end] for start, end in chunks])
+        data = [_d for _, _d in _read_mseed_buffer(
+            bfr_np, header_byteorder=self.header_byteorder, lib=lib)]
+        if not data or sum(len(_d) for _d in data) < self.first + self.npts:
+            msg = ("Could not decode all deferred data of %s, the records "
+                   "are missing or incomplete. Was the file changed after "
+                   "reading it lazily?") % (
+                self.source if isinstance(self.source, (str, native_str))
+                else "the buffer")
+            raise ObsPyMSEEDReadingError(msg)
+        data = np.concatenate(data) if len(data) > 1 else data[0]
+        return data[self.first:self.first + self.npts]
+
+
 def _write_mseed(stream, filename, encoding=None, reclen=None, byteorder=None,
                  sequence_number=None, flush=True, verbose=0, **_kwargs):
     """
@@ -822,121 +1169,388 @@ def _write_mseed(stream, filename, encoding=None, reclen=None, byteorder=None,
             msg = 'Skipping empty trace "%s".' % (trace)
             warnings.warn(msg)
             continue
-        # Create C struct MSTrace.
-        mst = MST(trace, data, dataquality=trace_attr['dataquality'])
-
-        # Initialize packedsamples pointer for the mst_pack function
-        packedsamples = C.c_int()
-
-        # Callback function for mst_pack to actually write the file
-        def record_handler(record, reclen, _stream):
-            f.write(record[0:reclen])
-        # Define Python callback function for use in C function
-        rec_handler = C.CFUNCTYPE(C.c_void_p, C.POINTER(C.c_char), C.c_int,
-                                  C.c_void_p)(record_handler)
-
-        # Fill up msr record structure, this is already contained in
-        # mstg, however if blk1001 is set we need it anyway
-        msr = clibmseed.msr_init(None)
-        msr.contents.network = trace.stats.network.encode('ascii', 'strict')
-        msr.contents.station = trace.stats.station.encode('ascii', 'strict')
-        msr.contents.location = trace.stats.location.encode('ascii', 'strict')
-        msr.contents.channel = trace.stats.channel.encode('ascii', 'strict')
-        msr.contents.dataquality = trace_attr['dataquality'].\
-            encode('ascii', 'strict')
-
-        # Set starting sequence number
-        msr.contents.sequence_number = trace_attr['sequence_number']
-
-        # Only use Blockette 1001 if necessary.
-        if use_blkt_1001:
-            # Timing quality has been set in trace_attr
-
-            size = C.sizeof(Blkt1001S)
-            # Only timing quality matters here, other blockette attributes will
-            # be filled by libmseed.msr_normalize_header
-            blkt_value = pack(native_str("BBBB"), trace_attr['timing_quality'],
-                              0, 0, 0)
-            blkt_ptr = C.create_string_buffer(blkt_value, len(blkt_value))
-
-            # Usually returns a pointer to the added blockette in the
-            # blockette link chain and a NULL pointer if it fails.
-            # NULL pointers have a false boolean value according to the
-            # ctypes manual.
-            ret_val = clibmseed.msr_addblockette(msr, blkt_ptr,
-                                                 size, 1001, 0)
-
-            if bool(ret_val) is False:
-                clibmseed.msr_free(C.pointer(msr))
-                del msr
-                raise Exception('Error in msr_addblockette')
-
-        # Only use Blockette 100 if necessary.
-        # Determine if a blockette 100 will be needed to represent the input
-        # sample rate or if the sample rate in the fixed section of the data
-        # header will suffice (see ms_genfactmult in libmseed/genutils.c)
-        use_blkt_100 = False
-
-        _factor = C.c_int16()
-        _multiplier = C.c_int16()
-        _retval = clibmseed.ms_genfactmult(
-            trace.stats.sampling_rate, C.pointer(_factor),
-            C.pointer(_multiplier))
-        # Use blockette 100 if ms_genfactmult() failed.
-        if _retval != 0:
-            use_blkt_100 = True
-        # Otherwise figure out if ms_genfactmult() found exact factors.
-        # Otherwise write blockette 100.
-        else:
-            ms_sr = clibmseed.ms_nomsamprate(_factor.value, _multiplier.value)
-
-            # It is also necessary if the libmseed calculated sampling rate
-            # would result in a loss of accuracy - the floating point
-            # comparision is on purpose here as it will always try to
-            # preserve all accuracy.
-            # Cast to float32 to not add blockette 100 for values
-            # that cannot be represented with 32bits.
-            if np.float32(ms_sr) != np.float32(trace.stats.sampling_rate):
-                use_blkt_100 = True
-
-        if use_blkt_100:
-            size = C.sizeof(Blkt100S)
-            blkt100 = C.c_char(b' ')
-            C.memset(C.pointer(blkt100), 0, size)
-            ret_val = clibmseed.msr_addblockette(
-                msr, C.pointer(blkt100), size, 100, 0)  # NOQA
-            # Usually returns a pointer to the added blockette in the
-            # blockette link chain and a NULL pointer if it fails.
-            # NULL pointers have a false boolean value according to the
-            # ctypes manual.
-            if bool(ret_val) is False:
-                clibmseed.msr_free(C.pointer(msr))  # NOQA
-                del msr  # NOQA
-                raise Exception('Error in msr_addblockette')
-
-        # Pack mstg into a MSEED file using the callback record_handler as
-        # write method.
-        errcode = clibmseed.mst_pack(
-            mst.mst, rec_handler, None, trace_attr['reclen'],
-            trace_attr['encoding'], trace_attr['byteorder'],
-            C.byref(packedsamples), flush, verbose, msr)  # NOQA
-
-        if errcode == 0:
+        record_count, _, _ = _pack_trace(
+            trace, data, f.write, trace_attr, use_blkt_1001=use_blkt_1001,
+            flush=flush, verbose=verbose)
+        if record_count == 0:
             msg = ("Did not write any data for trace '%s' even though it "
                    "contains data values.") % trace
             raise ValueError(msg)
-        if errcode == -1:
-            clibmseed.msr_free(C.pointer(msr))  # NOQA
-            del mst, msr  # NOQA
-            raise Exception('Error in mst_pack')
-        # Deallocate any allocated memory.
-        clibmseed.msr_free(C.pointer(msr))  # NOQA
-        del mst, msr  # NOQA
     # Close if its a file handler.
     if not hasattr(filename, 'write'):
         f.close()
 
 
+def _pack_trace(trace, data, write, trace_attr, use_blkt_1001=False,
+                flush=1, verbose=0):
+    """
+    Packs the data of a single trace into records with libmseed.
+
+    Returns the number of written records, the number of packed samples and
+    the sequence number of the next record. If ``flush`` is ``0`` only full
+    records are written and the remaining samples are not packed.
+
+    :param write: Function that is called with each packed record.
+    :param trace_attr: Dictionary with the ``dataquality``,
+        ``sequence_number``, ``timing_quality``, ``reclen``, ``encoding``
+        and ``byteorder`` used for writing.
+
+    See :func:`_write_mseed` for the other parameters.
+    """
+    # Create C struct MSTrace.
+    mst = MST(trace, data, dataquality=trace_attr['dataquality'])
+
+    # Initialize packedsamples pointer for the mst_pack function
+    packedsamples = C.c_int()
+
+    # Callback function for mst_pack to actually write the file
+    def record_handler(record, reclen, _stream):
+        write(record[0:reclen])
+    # Define Python callback function for use in C function
+    rec_handler = C.CFUNCTYPE(C.c_void_p, C.POINTER(C.c_char), C.c_int,
+                              C.c_void_p)(record_handler)
+
+    # Fill up msr record structure, this is already contained in
+    # mstg, however if blk1001 is set we need it anyway
+    msr = clibmseed.msr_init(None)
+    msr.contents.network = trace.stats.network.encode('ascii', 'strict')
+    msr.contents.station = trace.stats.station.encode('ascii', 'strict')
+    msr.contents.location = trace.stats.location.encode('ascii', 'strict')
+    msr.contents.channel = trace.stats.channel.encode('ascii', 'strict')
+    msr.contents.dataquality = trace_attr['dataquality'].\
+        encode('ascii', 'strict')
+
+    # Set starting sequence number
+    msr.contents.sequence_number = trace_attr['sequence_number']
+
+    # Only use Blockette 1001 if necessary.
+    if use_blkt_1001:
+        # Timing quality has been set in trace_attr
+
+        size = C.sizeof(Blkt1001S)
+        # Only timing quality matters here, other blockette attributes will
+        # be filled by libmseed.msr_normalize_header
+        blkt_value = pack(native_str("BBBB"), trace_attr['timing_quality'],
+                          0, 0, 0)
+        blkt_ptr = C.create_string_buffer(blkt_value, len(blkt_value))
+
+        # Usually returns a pointer to the added blockette in the
+        # blockette link chain and a NULL pointer if it fails.
+        # NULL pointers have a false boolean value according to the
+        # ctypes manual.
+        ret_val = clibmseed.msr_addblockette(msr, blkt_ptr,
+                                             size, 1001, 0)
+
+        if bool(ret_val) is False:
+            clibmseed.msr_free(C.pointer(msr))
+            del msr
+            raise Exception('Error in msr_addblockette')
+
+    # Only use Blockette 100 if necessary.
+    # Determine if a blockette 100 will be needed to represent the input
+    # sample rate or if the sample rate in the fixed section of the data
+    # header will suffice (see ms_genfactmult in libmseed/genutils.c)
+    use_blkt_100 = False
+
+    _factor = C.c_int16()
+    _multiplier = C.c_int16()
+    _retval = clibmseed.ms_genfactmult(
+        trace.stats.sampling_rate, C.pointer(_factor),
+        C.pointer(_multiplier))
+    # Use blockette 100 if ms_genfactmult() failed.
+    if _retval != 0:
+        use_blkt_100 = True
+    # Otherwise figure out if ms_genfactmult() found exact factors.
+    # Otherwise write blockette 100.
+    else:
+        ms_sr = clibmseed.ms_nomsamprate(_factor.value, _multiplier.value)
+
+        # It is also necessary if the libmseed calculated sampling rate
+        # would result in a loss of accuracy - the floating point
+        # comparision is on purpose here as it will always try to
+        # preserve all accuracy.
+        # Cast to float32 to not add blockette 100 for values
+        # that cannot be represented with 32bits.
+        if np.float32(ms_sr) != np.float32(trace.stats.sampling_rate):
+            use_blkt_100 = True
+
+    if use_blkt_100:
+        size = C.sizeof(Blkt100S)
+        blkt100 = C.c_char(b' ')
+        C.memset(C.pointer(blkt100), 0, size)
+        ret_val = clibmseed.msr_addblockette(
+            msr, C.pointer(blkt100), size, 100, 0)  # NOQA
+        # Usually returns a pointer to the added blockette in the
+        # blockette link chain and a NULL pointer if it fails.
+        # NULL pointers have a false boolean value according to the
+        # ctypes manual.
+        if bool(ret_val) is False:
+            clibmseed.msr_free(C.pointer(msr))  # NOQA
+            del msr  # NOQA
+            raise Exception('Error in msr_addblockette')
+
+    # Pack mstg into a MSEED file using the callback record_handler as
+    # write method.
+    errcode = clibmseed.mst_pack(
+        mst.mst, rec_handler, None, trace_attr['reclen'],
+        trace_attr['encoding'], trace_attr['byteorder'],
+        C.byref(packedsamples), flush, verbose, msr)  # NOQA
+
+    if errcode == -1:
+        clibmseed.msr_free(C.pointer(msr))  # NOQA
+        del mst, msr  # NOQA
+        raise Exception('Error in mst_pack')
+    sequence_number = msr.contents.sequence_number
+    # Deallocate any allocated memory.
+    clibmseed.msr_free(C.pointer(msr))  # NOQA
+    del mst, msr  # NOQA
+    return errcode, packedsamples.value, sequence_number
+
+
+class MSEEDWriter(object):
+    """
+    Incrementally writes MiniSEED records as data arrives.
+
+    The samples of every channel are collected until they fill a complete
+    record which is then appended to the output right away. Samples that do
+    not fill a complete record are kept until more data for the channel
+    arrives or the writer is flushed or closed. Existing files are appended
+    to and never read or rewritten.
+
+    :type filename: str or file
+    :param filename: Name of the output file, a file-like object or a file
+        name template. A template can contain the ``{network}``,
+        ``{station}``, ``{location}``, ``{channel}``, ``{dataquality}``,
+        ``{year}``, ``{doy}`` and ``{sds_type}`` (always ``"D"``)
+        placeholders. Data is then split into day files, e.g. for an SDS
+        archive use ``os.path.join(sds_root,
+        obspy.clients.filesystem.sds.SDS_FMTSTR)``. Missing directories are
+        created.
+    :type reclen: int, optional
+    :param reclen: Record length in bytes. Defaults to ``4096``.
+    :type encoding: int or str, optional
+    :param encoding: Data encoding. Defaults to the default encoding for the
+        dtype of the data of each channel, see :func:`_write_mseed`.
+    :type byteorder: int or str, optional
+    :param byteorder: Byte order, ``0`` or ``'<'`` for little-endian, ``1``
+        or ``'>'`` for big-endian. Defaults to big-endian.
+    :type sequence_number: int, optional
+    :param sequence_number: Sequence number of the first record of every
+        channel. Defaults to ``1``.
+
+    .. rubric:: Example
+
+    >>> from obspy import read
+    >>> from obspy.io.mseed.core import MSEEDWriter
+    >>> with MSEEDWriter("/path/{network}.{station}.{location}.{channel}"
+    ...                  ".{year}.{doy:03d}", reclen=512) as writer:
+    ...     for tr in read():
+    ...         writer.write(tr)  # doctest: +SKIP
+    """
+    def __init__(self, filename, reclen=None, encoding=None, byteorder=None,
+                 sequence_number=None):
+        if reclen is None:
+            reclen = 4096
+        elif reclen not in VALID_RECORD_LENGTHS:
+            msg = 'Invalid record length. The record length must be a ' + \
+                'value\nof 2 to the power of X where 8 <= X <= 20.'
+            raise ValueError(msg)
+        if byteorder is None:
+            byteorder = 1
+        if byteorder == '=':
+            byteorder = NATIVE_BYTEORDER
+        if byteorder in (0, '<'):
+            byteorder = 0
+        elif byteorder in (1, '>'):
+            byteorder = 1
+        else:
+            msg = "Invalid byte order. It must be either '<', '>', '=', " + \
+                  "0 or 1"
+            raise ValueError(msg)
+        if encoding is not None:
+            encoding = util._convert_and_check_encoding_for_writing(encoding)
+        if sequence_number is None:
+            sequence_number = 1
+        elif not 1 <= sequence_number <= 999999:
+            msg = "Invalid sequence number. It must be an integer ranging " + \
+                  "from 1 to 999999."
+            raise ValueError(msg)
+        self.filename = filename
+        self.reclen = reclen
+        self.encoding = encoding
+        self.byteorder = byteorder
+        self.sequence_number = sequence_number
+        self.is_template = not hasattr(filename, 'write') and \
+            '{' in filename
+        # Packing state of every channel, see _write_channel().
+        self._channels = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def write(self, data):
+        """
+        Appends the data of a Trace or of all Traces in a Stream.
+
+        Complete records are written immediately. Data that is not
+        continuous with the previous data of the same channel first flushes
+        the remaining samples of the channel.
+
+        :type data: :class:`~obspy.core.trace.Trace` or
+            :class:`~obspy.core.stream.Stream`
+        """
+        if isinstance(data, Trace):
+            data = [data]
+        for trace in data:
+            self._write_trace(trace)
+
+    def flush(self):
+        """
+        Writes the remaining samples of all channels into partially filled
+        records.
+        """
+        for key in sorted(self._channels):
+            self._flush_channel(key)
+
+    def close(self):
+        """
+        Flushes all channels. Does not close a passed file-like object.
+        """
+        self.flush()
+        self._channels = {}
+
+    def _write_trace(self, trace):
+        if not len(trace.data):
+            return
+        data = trace.data
+        try:
+            dataquality = trace.stats.mseed.dataquality.upper()
+        except AttributeError:
+            dataquality = 'D'
+        if dataquality not in ['D', 'R', 'Q', 'M']:
+            msg = 'Invalid dataquality %s. It must be either D, R, Q or M.' \
+                % dataquality
+            raise ValueError(msg)
+        key = (trace.stats.network, trace.stats.station,
+               trace.stats.location, trace.stats.channel, dataquality)
+        channel = self._channels.get(key)
+        if channel is not None:
+            # Only continue the pending data if the new data directly
+            # follows it.
+            delta = 1.0 / channel['sampling_rate']
+            expected = channel['origin'] + \
+                (channel['offset'] + len(channel['data'])) * delta
+            if channel['sampling_rate'] != trace.stats.sampling_rate or \
+                    channel['data'].dtype != data.dtype or \
+                    abs(trace.stats.starttime - expected) > 0.5 * delta:
+                self._flush_channel(key)
+                channel = None
+        if channel is None:
+            encoding = self.encoding
+            if encoding is None:
+                try:
+                    encoding = _DEFAULT_ENCODINGS[data.dtype.type]
+                except KeyError:
+                    msg = "Unsupported data type %s" % data.dtype
+                    raise ValueError(msg)
+            elif data.dtype.type != ENCODINGS[encoding][2]:
+                msg = "Wrong dtype %s for encoding %s." % (
+                    data.dtype, ENCODINGS[encoding][0])
+                raise ValueError(msg)
+            try:
+                timing_quality = int(
+                    trace.stats.mseed.blkt1001.timing_quality)
+            except AttributeError:
+                timing_quality = None
+            channel = self._channels.setdefault(key, {
+                'sequence_number': self.sequence_number})
+            channel.update({
+                'origin': trace.stats.starttime,
+                'offset': 0,
+                'sampling_rate': trace.stats.sampling_rate,
+                'data': data[:0],
+                'encoding': encoding,
+                'timing_quality': timing_quality,
+                'filename': None})
+        channel['data'] = np.concatenate([channel['data'], data])
+        self._write_channel(key, flush=False)
+
+    def _write_channel(self, key, flush):
+        """
+        Packs the pending samples of a channel. Without ``flush`` only
+        complete records are written.
+        """
+        channel = self._channels.get(key)
+        if channel is None:
+            return
+        delta = 1.0 / channel['sampling_rate']
+        while len(channel['data']):
+            starttime = channel['origin'] + channel['offset'] * delta
+            data = channel['data']
+            # Day files must not contain records of the next day.
+            day_end = len(data)
+            if self.is_template:
+                next_day = UTCDateTime(starttime.date) + 86400
+                day_end = min(day_end, int(np.ceil(
+                    (next_day - starttime) * channel['sampling_rate'])))
+            write_flush = flush or day_end < len(data)
+            trace = Trace(data=data[:day_end], header={
+                'network': key[0], 'station': key[1], 'location': key[2],
+                'channel': key[3], 'starttime': starttime,
+                'sampling_rate': channel['sampling_rate']})
+            trace_attr = {
+                'dataquality': key[4],
+                'sequence_number': channel['sequence_number'],
+                'timing_quality': channel['timing_quality'] or 0,
+                'reclen': self.reclen,
+                'encoding': channel['encoding'],
+                'byteorder': self.byteorder}
+            use_blkt_1001 = channel['timing_quality'] is not None or \
+                util._convert_datetime_to_mstime(starttime) % 100 != 0 or \
+                (delta * HPTMODULUS) % 100 != 0
+            packed_data = trace.data
+            if channel['encoding'] == 1:
+                # INT16 needs INT32 data type
+                packed_data = packed_data.astype(np.int32)
+            with self._open(key, starttime) as f:
+                _, packed, sequence_number = _pack_trace(
+                    trace, packed_data, f.write, trace_attr,
+                    use_blkt_1001=use_blkt_1001, flush=int(write_flush))
+            channel['sequence_number'] = sequence_number
+            channel['offset'] += packed
+            channel['data'] = data[packed:]
+            if not packed or not write_flush:
+                break
+        if not len(channel['data']):
+            # Start at the actual time of the next sample to not accumulate
+            # floating point errors.
+            channel['origin'] += channel['offset'] * delta
+            channel['offset'] = 0
+
+    def _flush_channel(self, key):
+        self._write_channel(key, flush=True)
+
+    @contextmanager
+    def _open(self, key, starttime):
+        if hasattr(self.filename, 'write'):
+            yield self.filename
+            return
+        filename = self.filename
+        if self.is_template:
+            filename = filename.format(
+                network=key[0], station=key[1], location=key[2],
+                channel=key[3], dataquality=key[4], year=starttime.year,
+                doy=starttime.julday, sds_type='D')
+            dirname = os.path.dirname(filename)
+            if dirname and not os.path.isdir(dirname):
+                os.makedirs(dirname)
+        with io.open(filename, 'ab') as f:
+            yield f
+
+
 class MST(object):
     """
     Class that transforms a ObsPy Trace object to a libmseed internal MSTrace
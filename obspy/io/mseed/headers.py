@@ -7,6 +7,7 @@ from __future__ import (absolute_import, division, print_function,
 from future.builtins import *  # NOQA
 from future.utils import native_str
 
+import contextlib
 import ctypes as C
 import warnings
 
@@ -66,6 +67,9 @@ DATATYPES = {b"a": C.c_char, b"i": C.c_int32, b"f": C.c_float,
              b"d": C.c_double}
 SAMPLESIZES = {'a': 1, 'i': 4, 'f': 4, 'd': 8}
 
+# Smallest possible record length, also the size of noise records.
+MINRECLEN = 128
+
 # Valid record lengths for Mini-SEED files.
 VALID_RECORD_LENGTHS = [256, 512, 1024, 2048, 4096, 8192, 16384, 32768, 65536,
                         131072, 262144, 524288, 1048576]
@@ -636,6 +640,27 @@ LinkedIDList._fields_ = [
 ]
 
 
+# Header information of a single record as filled by readMSEEDRecordTable().
+# Has the same memory layout as the RecordInfo C struct. Times are in
+# libmseed's high precision time ticks.
+RECORD_TABLE_DTYPE = np.dtype([
+    (native_str('offset'), np.int64),
+    (native_str('starttime'), np.int64),
+    (native_str('endtime'), np.int64),
+    (native_str('samprate'), np.float64),
+    (native_str('reclen'), np.int32),
+    (native_str('samplecnt'), np.int32),
+    (native_str('network'), native_str('S11')),
+    (native_str('station'), native_str('S11')),
+    (native_str('location'), native_str('S11')),
+    (native_str('channel'), native_str('S11')),
+    (native_str('dataquality'), native_str('S1')),
+    (native_str('encoding'), np.int8),
+    (native_str('byteorder'), np.int8),
+    (native_str('timing_quality'), np.uint8),
+    (native_str('calibration_type'), np.int8)], align=True)
+
+
 ##########################################################################
 # Define the argument and return types of all the used libmseed functions.
 ##########################################################################
@@ -740,6 +765,19 @@ __clibmseed.readMSEEDBuffer.argtypes = [
 __clibmseed.readMSEEDBuffer.restype = C.POINTER(LinkedIDList)
 
 
+__clibmseed.readMSEEDRecordTable.argtypes = [
+    np.ctypeslib.ndpointer(dtype=np.int8, ndim=1,
+                           flags=native_str('C_CONTIGUOUS')),
+    C.c_longlong,
+    C.c_int,
+    np.ctypeslib.ndpointer(dtype=RECORD_TABLE_DTYPE, ndim=1,
+                           flags=native_str('C_CONTIGUOUS')),
+    C.c_int,
+    C.POINTER(C.c_longlong)
+]
+__clibmseed.readMSEEDRecordTable.restype = C.c_int
+
+
 __clibmseed.setupLogging.argtpyes = [
     C.c_int8,
     C.CFUNCTYPE(C.c_void_p, C.c_char_p),
@@ -795,43 +833,60 @@ class _LibmseedWrapper(object):
         func = getattr(self.lib, item)
 
         def _wrapper(*args):
-            # Collect exceptions. They cannot be raised in the callback as
-            # they could never be caught then. They are collected and raised
-            # later on.
-            _errs = []
-            _warns = []
-
-            def log_error_or_warning(msg):
-                msg = msg.decode()
-                if msg.startswith("ERROR: "):
-                    msg = msg[7:].strip()
-                    _errs.append(msg)
-                if msg.startswith("INFO: "):
-                    msg = msg[6:].strip()
-                    _warns.append(msg)
-
-            diag_print = \
-                C.CFUNCTYPE(None, C.c_char_p)(log_error_or_warning)
-
-            def log_message(msg):
-                if self.verbose:
-                    print(msg[6:].strip())
-            log_print = C.CFUNCTYPE(None, C.c_char_p)(log_message)
-
-            # Hookup libmseed's logging facilities to it's Python callbacks.
-            self.lib.setupLogging(diag_print, log_print)
-
-            try:
+            with self.logging_to_python(item):
                 return func(*args)
-            finally:
-                for _w in _warns:
-                    warnings.warn(_w, InternalMSEEDWarning)
-                if _errs:
-                    msg = ("Encountered %i error(s) during a call to "
-                           "%s():\n%s" % (
-                            len(_errs), item, "\n".join(_errs)))
-                    raise InternalMSEEDError(msg)
         return _wrapper
 
+    @contextlib.contextmanager
+    def logging_to_python(self, name):
+        """
+        Context manager hooking up libmseed's logging to Python.
+
+        Warnings and errors emitted by libmseed within the context will be
+        raised as Python warnings and exceptions when leaving it. Functions
+        of the underlying library can be called directly within the context,
+        e.g. from multiple threads, as long as the context is not entered
+        again in the meantime.
+
+        :type name: str
+        :param name: Name of the called function, used in error messages.
+        """
+        # Collect exceptions. They cannot be raised in the callback as
+        # they could never be caught then. They are collected and raised
+        # later on.
+        _errs = []
+        _warns = []
+
+        def log_error_or_warning(msg):
+            msg = msg.decode()
+            if msg.startswith("ERROR: "):
+                msg = msg[7:].strip()
+                _errs.append(msg)
+            if msg.startswith("INFO: "):
+                msg = msg[6:].strip()
+                _warns.append(msg)
+
+        diag_print = \
+            C.CFUNCTYPE(None, C.c_char_p)(log_error_or_warning)
+
+        def log_message(msg):
+            if self.verbose:
+                print(msg[6:].strip())
+        log_print = C.CFUNCTYPE(None, C.c_char_p)(log_message)
+
+        # Hookup libmseed's logging facilities to it's Python callbacks.
+        self.lib.setupLogging(diag_print, log_print)
+
+        try:
+            yield
+        finally:
+            for _w in _warns:
+                warnings.warn(_w, InternalMSEEDWarning)
+            if _errs:
+                msg = ("Encountered %i error(s) during a call to "
+                       "%s():\n%s" % (
+                        len(_errs), name, "\n".join(_errs)))
+                raise InternalMSEEDError(msg)
+
 
 clibmseed = _LibmseedWrapper(lib=__clibmseed)
@@ -272,6 +272,177 @@ void setupLogging(void (*diag_print) (char*),
 }
 
 
+// Header information of a single record. Keep in sync with
+// obspy.io.mseed.util.RECORD_TABLE_DTYPE.
+typedef struct RecordInfo_s {
+    long long offset;             // Offset of the record in the buffer
+    hptime_t starttime;           // Time of the first sample
+    hptime_t endtime;             // Time of the last sample
+    double samprate;              // Sample rate
+    int32_t reclen;               // Record length
+    int32_t samplecnt;            // Number of samples in the record
+    char network[11];             // Network designation, NULL terminated
+    char station[11];             // Station designation, NULL terminated
+    char location[11];            // Location designation, NULL terminated
+    char channel[11];             // Channel designation, NULL terminated
+    char dataquality;             // Data quality indicator
+    int8_t encoding;              // Data encoding format
+    int8_t byteorder;             // Byte order of the record
+    uint8_t timing_qual;          // Timing quality of BLK 1001 or 0xFF
+    int8_t calibration_type;      // Calibration BLK type, see below
+}
+RecordInfo;
+
+
+// Function that parses the headers of the records in a char buffer without
+// unpacking any data and writes them to the given RecordInfo array.
+//
+// Starts at *offset and stops after maxrecords records have been parsed or
+// when the end of the buffer or an invalid record is reached. *offset will be
+// set to the offset of the next record. Returns the number of parsed records.
+// Records are treated the same as by readMSEEDBuffer() so the resulting
+// records are exactly the ones that would be read by it.
+int
+readMSEEDRecordTable (char *mseed, long long buflen, int header_byteorder,
+                      RecordInfo *records, int maxrecords, long long *offset)
+{
+    int retcode = 0;
+    int record_count = 0;
+    long long remaining;
+    BlktLink *cur_blkt = NULL;
+    MSRecord *msr = NULL;
+    RecordInfo *record = NULL;
+
+    if (header_byteorder >= 0) {
+        MS_UNPACKHEADERBYTEORDER(header_byteorder == 0 ? 0 : 1);
+    }
+    else {
+        MS_UNPACKHEADERBYTEORDER(-1);
+    }
+
+    msr = msr_init(NULL);
+    if ( msr == NULL ) {
+        ms_log (2, "readMSEEDRecordTable(): Error initializing msr\n");
+        return -1;
+    }
+
+    while (record_count < maxrecords && *offset < buflen) {
+        remaining = buflen - *offset;
+        if (remaining < MINRECLEN) {
+            ms_log(1, "readMSEEDBuffer(): Last record only has %i byte(s) which "
+                      "is not enough to constitute a full SEED record. Corrupt data? "
+                      "Record will be skipped.\n", (int)remaining);
+            *offset = buflen;
+            break;
+        }
+        // msr_parse() only takes an int - it only has to look at one
+        // record anyway.
+        if (remaining > MAXRECLEN) {
+            remaining = MAXRECLEN;
+        }
+
+        // Skip empty or noise records.
+        if (OBSPY_ISVALIDBLANK(mseed + *offset)) {
+            *offset += MINRECLEN;
+            continue;
+        }
+
+        retcode = msr_parse ((mseed + *offset), (int)remaining, &msr, -1, 0, 0);
+        // Handle error.
+        if (retcode < 0) {
+            log_error(retcode, (int)*offset);
+            *offset = buflen;
+            break;
+        }
+        // Data missing at the end.
+        else if (retcode > 0 && retcode >= (buflen - *offset)) {
+            log_error(MS_ENDOFFILE, (int)*offset);
+            *offset = buflen;
+            break;
+        }
+        // Lacking Blockette 1000.
+        else if ( retcode > 0 && retcode < (buflen - *offset)) {
+            // Check if the remaining bytes can exactly make up a record length.
+            int r_bytes = (int)(buflen - *offset);
+            float exp = log10((float)r_bytes) / log10(2.0);
+            if ((buflen - *offset <= MAXRECLEN) &&
+                (fmodf(exp, 1.0) < 0.0000001) && ((int)roundf_(exp) >= 7) && ((int)roundf_(exp) <= 256)) {
+
+                retcode = msr_parse((mseed + *offset), r_bytes, &msr, r_bytes, 0, 0);
+
+                if ( retcode != 0 ) {
+                    log_error(retcode, (int)*offset);
+                    *offset = buflen;
+                    break;
+                }
+            }
+            else {
+                *offset = buflen;
+                break;
+            }
+        }
+
+        if (*offset + msr->reclen > buflen) {
+            ms_log(1, "readMSEEDBuffer(): Last msr->reclen exceeds buflen, skipping.\n");
+            *offset = buflen;
+            break;
+        }
+
+        record = records + record_count;
+        record->offset = *offset;
+        record->starttime = msr->starttime;
+        record->endtime = msr_endtime(msr);
+        record->samprate = msr->samprate;
+        record->reclen = msr->reclen;
+        record->samplecnt = (int32_t)msr->samplecnt;
+        strncpy(record->network, msr->network, sizeof(record->network));
+        strncpy(record->station, msr->station, sizeof(record->station));
+        strncpy(record->location, msr->location, sizeof(record->location));
+        strncpy(record->channel, msr->channel, sizeof(record->channel));
+        record->dataquality = msr->dataquality;
+        record->encoding = msr->encoding;
+        record->byteorder = msr->byteorder;
+        /* extract information based on timing quality */
+        record->timing_qual = 0xFF;
+        if (msr->Blkt1001 != 0) {
+            record->timing_qual = msr->Blkt1001->timing_qual;
+        }
+        /* extract information on calibration BLKs */
+        record->calibration_type = -1;
+        cur_blkt = msr->blkts;
+        while (cur_blkt) {
+            switch (cur_blkt->blkt_type) {
+            case 300:
+                record->calibration_type = 1;
+                break;
+            case 310:
+                record->calibration_type = 2;
+                break;
+            case 320:
+                record->calibration_type = 3;
+                break;
+            case 390:
+                record->calibration_type = 4;
+                break;
+            case 395:
+                record->calibration_type = -2;
+                break;
+            default:
+                break;
+            }
+            cur_blkt = cur_blkt->next;
+        }
+        record_count += 1;
+
+        // Add the record length for the next iteration
+        *offset += msr->reclen;
+    }
+
+    msr_free(&msr);
+    return record_count;
+}
+
+
 // Function that reads from a MiniSEED binary file from a char buffer and
 // returns a LinkedIDList.
 LinkedIDList *
@@ -18,10 +18,13 @@ import numpy as np
 
 from obspy import Stream, Trace, UTCDateTime, read
 from obspy.core import AttribDict
+from obspy.core.compatibility import mock
 from obspy.core.util import CatchOutput, NamedTemporaryFile
+from obspy.core.util.misc import TemporaryWorkingDirectory
 from obspy.io.mseed import (util, InternalMSEEDWarning,
-                            InternalMSEEDError)
-from obspy.io.mseed.core import _is_mseed, _read_mseed, _write_mseed
+                            InternalMSEEDError, ObsPyMSEEDReadingError)
+from obspy.io.mseed.core import (MSEEDWriter, _is_mseed, _read_mseed,
+                                 _write_mseed)
 from obspy.io.mseed.headers import ENCODINGS, clibmseed
 from obspy.io.mseed.msstruct import _MSStruct
 
@@ -1546,6 +1549,230 @@ class MSEEDReadingAndWritingTestCase(unittest.TestCase):
             'number_of_records': 10,
             'record_length': 512})
 
+    def test_lazy_reading(self):
+        """
+        Reading with lazy=True must result in exactly the same traces as
+        reading everything directly.
+        """
+        filenames = sorted(glob.glob(os.path.join(self.path, "data", "*")))
+        filenames = [_i for _i in filenames
+                     if os.path.isfile(_i) and _is_mseed(_i)]
+        self.assertGreater(len(filenames), 10)
+        for filename in filenames:
+            for details in (False, True):
+                with warnings.catch_warnings(record=True):
+                    warnings.simplefilter("always")
+                    try:
+                        st = read(filename, details=details)
+                    except Exception:
+                        continue
+                    st_lazy = read(filename, details=details, lazy=True)
+                self.assertEqual(len(st), len(st_lazy), msg=filename)
+                for tr, tr_lazy in zip(st, st_lazy):
+                    self.assertIsNotNone(tr_lazy._lazy_data)
+                    self.assertEqual(tr.stats, tr_lazy.stats, msg=filename)
+                    np.testing.assert_array_equal(tr.data, tr_lazy.data,
+                                                  err_msg=filename)
+                    self.assertEqual(tr.data.dtype, tr_lazy.data.dtype)
+                    self.assertIsNone(tr_lazy._lazy_data)
+
+    def test_lazy_reading_changed_file(self):
+        """
+        Loading lazily read data raises if the records can not be decoded
+        anymore because the file was truncated after reading it.
+        """
+        filename = os.path.join(self.path, "data",
+                                "BW.BGLD.__.EHE.D.2008.001.first_10_records")
+        with io.open(filename, "rb") as fh:
+            data = fh.read()
+        with TemporaryWorkingDirectory():
+            for size in (0, len(data) // 2):
+                with io.open("test.mseed", "wb") as fh:
+                    fh.write(data)
+                st = read("test.mseed", lazy=True)
+                with io.open("test.mseed", "wb") as fh:
+                    fh.write(data[:size])
+                with warnings.catch_warnings():
+                    warnings.simplefilter("ignore")
+                    self.assertRaises(ObsPyMSEEDReadingError,
+                                      getattr, st[0], "data")
+
+    def test_lazy_reading_trim_and_select(self):
+        """
+        Trimming, slicing and selecting lazily read traces only decodes the
+        records that are actually needed.
+        """
+        filename = os.path.join(self.path, "data",
+                                "BW.BGLD.__.EHE.D.2008.001.first_10_records")
+        st = read(filename)
+        t1 = st[0].stats.starttime + 3.3
+        t2 = st[0].stats.starttime + 5.1
+
+        for source in (filename, "buffer"):
+            if source == "buffer":
+                with io.open(filename, "rb") as fh:
+                    source = io.BytesIO(fh.read())
+            st_lazy = read(source, lazy=True)
+            self.assertEqual(len(st_lazy[0]), st[0].stats.npts)
+            self.assertEqual(len(st_lazy[0]._lazy_data.records), 10)
+            st_lazy.trim(t1, t2)
+            # Only the records containing the time window remain.
+            self.assertEqual(len(st_lazy[0]._lazy_data.records), 2)
+            self.assertEqual(st_lazy[0].stats,
+                             st.slice(t1, t2)[0].stats)
+            np.testing.assert_array_equal(st_lazy[0].data,
+                                          st.slice(t1, t2)[0].data)
+
+        # Copies and slices share the deferred data.
+        st_lazy = read(filename, lazy=True)
+        tr = st_lazy[0].slice(t1, t2)
+        tr_copy = tr.copy()
+        self.assertIsNotNone(st_lazy[0]._lazy_data)
+        np.testing.assert_array_equal(tr_copy.data, tr.data)
+        np.testing.assert_array_equal(st_lazy[0].data, st[0].data)
+
+        # Selections are applied on the record level.
+        st_lazy = read(filename, lazy=True, starttime=t1, endtime=t2)
+        st_sel = read(filename, starttime=t1, endtime=t2)
+        self.assertEqual(st_lazy[0].stats, st_sel[0].stats)
+        np.testing.assert_array_equal(st_lazy[0].data, st_sel[0].data)
+        self.assertEqual(
+            len(_read_mseed(filename, lazy=True, sourcename="BW.*")), 1)
+        self.assertEqual(
+            len(_read_mseed(filename, lazy=True, sourcename="XX.*")), 0)
+
+    def test_record_index(self):
+        """
+        Tests reading with a persistent record index file.
+        """
+        filename = os.path.join(self.path, "data",
+                                "BW.BGLD.__.EHE.D.2008.001.first_10_records")
+        with io.open(filename, "rb") as fh:
+            data = fh.read()
+        st = read(filename)
+        t1 = st[0].stats.starttime + 3.3
+        t2 = st[0].stats.starttime + 5.1
+
+        with TemporaryWorkingDirectory():
+            with io.open("test.mseed", "wb") as fh:
+                fh.write(data)
+            self.assertEqual(read("test.mseed", index=True), st)
+            self.assertTrue(os.path.exists("test.mseed.index.npz"))
+            # The index is used instead of parsing the file again.
+            with mock.patch("obspy.io.mseed.util._get_record_table") as p:
+                st_index = read("test.mseed", index=True, starttime=t1,
+                                endtime=t2)
+                st_lazy = read("test.mseed", index=True, lazy=True)
+                st_head = read("test.mseed", index=True, headonly=True)
+            self.assertEqual(p.call_count, 0)
+            self.assertEqual(st_index,
+                             read(filename, starttime=t1, endtime=t2))
+            self.assertEqual(st_lazy, st)
+            self.assertEqual(st_head[0].stats, st[0].stats)
+            self.assertEqual(len(st_head[0].data), 0)
+
+            # Changing the file invalidates the index.
+            with io.open("test.mseed", "ab") as fh:
+                fh.write(data[:512])
+            st_appended = read("test.mseed", index=True)
+            self.assertEqual(len(st_appended), 2)
+            self.assertEqual(st_appended, read("test.mseed"))
+
+            # Corrupt index files are rebuilt and the index location can be
+            # chosen freely.
+            with io.open("test.mseed.index.npz", "wb") as fh:
+                fh.write(b"corrupt")
+            self.assertEqual(read("test.mseed", index=True), st_appended)
+            self.assertEqual(read("test.mseed", index="other.npz"),
+                             st_appended)
+            self.assertTrue(os.path.exists("other.npz"))
+
+    def test_reading_with_threads(self):
+        """
+        Decoding the data with multiple threads results in the same traces.
+        """
+        filenames = ["BW.BGLD.__.EHE.D.2008.001.first_10_records",
+                     "two_channels.mseed", "gaps.mseed", "test.mseed",
+                     "timingquality.mseed"]
+        for filename in filenames:
+            filename = os.path.join(self.path, "data", filename)
+            st = read(filename, details=True)
+            for threads in (2, 3, 16):
+                self.assertEqual(read(filename, details=True,
+                                      threads=threads), st)
+            with io.open(filename, "rb") as fh:
+                self.assertEqual(read(fh, details=True, threads=4), st)
+
+        filename = os.path.join(self.path, "data",
+                                "BW.BGLD.__.EHE.D.2008.001.first_10_records")
+        st = read(filename)
+        t1 = st[0].stats.starttime + 3.3
+        t2 = st[0].stats.starttime + 5.1
+        self.assertEqual(read(filename, starttime=t1, endtime=t2, threads=4),
+                         read(filename, starttime=t1, endtime=t2))
+
+    def test_incremental_writer(self):
+        """
+        Writing packets of data with MSEEDWriter results in the same data as
+        writing it at once. Only full records are written until the writer
+        is closed.
+        """
+        np.random.seed(815)
+        tr = Trace(data=np.random.randint(-1000, 1000, 50000).astype(np.int32),
+                   header={"network": "XX", "station": "TEST",
+                           "channel": "HHZ", "sampling_rate": 100.0,
+                           "starttime": UTCDateTime(2017, 12, 31, 23, 55)})
+        packets = []
+        for _i in range(0, len(tr), 317):
+            packet = tr.copy()
+            packet.data = tr.data[_i:_i + 317]
+            packet.stats.starttime += _i * tr.stats.delta
+            packets.append(packet)
+
+        with NamedTemporaryFile() as tf:
+            writer = MSEEDWriter(tf.name, reclen=512)
+            for packet in packets:
+                writer.write(packet)
+                self.assertEqual(os.path.getsize(tf.name) % 512, 0)
+            size = os.path.getsize(tf.name)
+            writer.close()
+            self.assertGreater(os.path.getsize(tf.name), size)
+            st = read(tf.name)
+            self.assertEqual(st[0].stats.mseed.record_length, 512)
+            st.merge()
+            self.assertEqual(len(st), 1)
+            self.assertEqual(st[0].stats.starttime, tr.stats.starttime)
+            np.testing.assert_array_equal(st[0].data, tr.data)
+
+            # Appending to an existing file does not touch its records.
+            with io.open(tf.name, "rb") as fh:
+                before = fh.read()
+            tr2 = tr.copy()
+            tr2.data = np.arange(100, dtype=np.int32)
+            tr2.stats.starttime = tr.stats.endtime + tr.stats.delta
+            with MSEEDWriter(tf.name, reclen=512) as writer:
+                writer.write(Stream(traces=[tr2]))
+            with io.open(tf.name, "rb") as fh:
+                self.assertEqual(fh.read()[:len(before)], before)
+            st = read(tf.name).merge()
+            np.testing.assert_array_equal(
+                st[0].data, np.concatenate([tr.data, tr2.data]))
+
+        # File name templates split the data into day files.
+        with TemporaryWorkingDirectory():
+            with MSEEDWriter(os.path.join(
+                    "{year}", "{network}.{station}.{location}.{channel}."
+                    "{year}.{doy:03d}")) as writer:
+                for packet in packets:
+                    writer.write(packet)
+            st1 = read(os.path.join("2017", "XX.TEST..HHZ.2017.365"))
+            st2 = read(os.path.join("2018", "XX.TEST..HHZ.2018.001"))
+            self.assertLess(st1[-1].stats.endtime, UTCDateTime(2018, 1, 1))
+            self.assertEqual(st2[0].stats.starttime, UTCDateTime(2018, 1, 1))
+            st = (st1 + st2).merge()
+            self.assertEqual(len(st), 1)
+            np.testing.assert_array_equal(st[0].data, tr.data)
+
 
 def suite():
     return unittest.makeSuite(MSEEDReadingAndWritingTestCase, 'test')
@@ -20,7 +20,8 @@ import numpy as np
 from obspy import UTCDateTime
 from obspy.core import Stream, Trace
 from obspy.core.util import NamedTemporaryFile
-from obspy.io.mseed import util
+from obspy.io.mseed import (InternalMSEEDWarning, ObsPyMSEEDReadingError,
+                            util)
 from obspy.io.mseed.core import _read_mseed
 from obspy.io.mseed.headers import (FIXED_HEADER_ACTIVITY_FLAGS,
                                     FIXED_HEADER_DATA_QUAL_FLAGS,
@@ -1162,6 +1163,70 @@ class MSEEDUtilTestCase(unittest.TestCase):
             "SK_MODS__HHZ_D: Warning: Number of blockettes in fixed header "
             "(2) does not match the number parsed (1)")
 
+    def test_iter_records_and_traces(self):
+        """
+        Tests iterating over the records and traces of files, also with
+        inputs that can only be read sequentially in small pieces.
+        """
+        class Pipe(object):
+            # Returns at most 100 bytes per read() call.
+            def __init__(self, data):
+                self.fh = io.BytesIO(data)
+
+            def read(self, size=-1):
+                return self.fh.read(min(size, 100))
+
+        def assert_same_data(st1, st2):
+            st1 = st1.copy().merge().sort()
+            st2 = st2.copy().merge().sort()
+            self.assertEqual(len(st1), len(st2))
+            for tr1, tr2 in zip(st1, st2):
+                self.assertEqual(tr1.id, tr2.id)
+                self.assertEqual(tr1.stats.starttime, tr2.stats.starttime)
+                np.testing.assert_array_equal(tr1.data, tr2.data)
+
+        for name in ['test.mseed', 'two_channels.mseed', 'fullseed.mseed',
+                     'various_noise_records.mseed',
+                     'BW.BGLD.__.EHE.D.2008.001.first_10_records']:
+            filename = os.path.join(self.path, 'data', name)
+            st = _read_mseed(filename)
+            with io.open(filename, 'rb') as fh:
+                data = fh.read()
+            for source in (filename, io.BytesIO(data), Pipe(data)):
+                records = Stream(traces=list(util.iter_records(source)))
+                self.assertEqual(
+                    sum(_tr.stats.npts for _tr in records),
+                    sum(_tr.stats.npts for _tr in st))
+                self.assertTrue(all(_tr.stats.mseed.number_of_records == 1
+                                    for _tr in records))
+                assert_same_data(records, st)
+            # Small chunks result in more traces that merge to the same
+            # data, large chunks are the same as reading the whole file.
+            for chunksize in (512, 2 ** 20):
+                traces = Stream(traces=list(
+                    util.iter_traces(Pipe(data), chunksize=chunksize)))
+                if chunksize > len(data):
+                    self.assertEqual(len(traces), len(st))
+                assert_same_data(traces, st)
+
+    def test_iter_records_truncated_input(self):
+        """
+        A truncated last record is skipped with a warning.
+        """
+        filename = os.path.join(self.path, 'data', 'test.mseed')
+        with io.open(filename, 'rb') as fh:
+            data = fh.read()
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            traces = list(util.iter_records(io.BytesIO(data[:-100])))
+        self.assertEqual(len(traces), 1)
+        w = [w_ for w_ in w if issubclass(w_.category, InternalMSEEDWarning)]
+        self.assertEqual(len(w), 1)
+        self.assertIn("Record will be skipped", str(w[0].message))
+
+        with self.assertRaises(ObsPyMSEEDReadingError):
+            list(util.iter_records(io.BytesIO(b"x" * 512)))
+
     def _check_values(self, file_bfr, trace_id, record_numbers, expected_bytes,
                       reclen):
         """
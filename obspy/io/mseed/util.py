@@ -9,21 +9,27 @@ from future.utils import native_str
 
 import collections
 import ctypes as C
+import fnmatch
+import io
 import os
 import sys
 import warnings
+import zipfile
 from datetime import datetime
 from struct import pack, unpack
 
 import numpy as np
 
-from obspy import UTCDateTime
+from obspy import Trace, UTCDateTime
 from obspy.core.util.decorator import ObsPyDeprecationWarning
+from . import InternalMSEEDWarning, ObsPyMSEEDReadingError
 from .headers import (ENCODINGS, ENDIAN, FIXED_HEADER_ACTIVITY_FLAGS,
                       FIXED_HEADER_DATA_QUAL_FLAGS,
                       FIXED_HEADER_IO_CLOCK_FLAGS, HPTMODULUS,
-                      SAMPLESIZES, UNSUPPORTED_ENCODINGS, MSRecord,
-                      MS_NOERROR, clibmseed)
+                      MINI_SEED_CONTROL_HEADERS, MINRECLEN, SAMPLESIZES,
+                      SEED_CONTROL_HEADERS, UNSUPPORTED_ENCODINGS,
+                      VALID_RECORD_LENGTHS, MSRecord, MS_NOERROR,
+                      RECORD_TABLE_DTYPE, clibmseed)
 
 
 def get_start_and_end_time(file_or_file_object):
@@ -827,6 +833,469 @@ def _convert_mstime_to_datetime(timestring):
     return UTCDateTime(ns=int(round(timestring * 10**3)))
 
 
+def _get_record_table(bfr_np, offset=0, header_byteorder=-1):
+    """
+    Parses the headers of all records in a buffer without unpacking the data.
+
+    The records are parsed exactly like libmseed does when reading the buffer
+    but the information of every record is returned as a row of a structured
+    array with the dtype
+    :const:`~obspy.io.mseed.headers.RECORD_TABLE_DTYPE`. This enables
+    selecting and grouping the records or reading them at a later point
+    without decoding any of the data.
+
+    :type bfr_np: :class:`numpy.ndarray` of dtype int8
+    :param bfr_np: Buffer containing the data records.
+    :type offset: int
+    :param offset: Offset added to all returned record offsets, e.g. the
+        position of the buffer within a file.
+    :type header_byteorder: int
+    :param header_byteorder: Enforce the byte order of the headers, ``0`` for
+        little and ``1`` for big endian. ``-1`` determines it automatically.
+    """
+    # Parse the records in chunks to not allocate memory for the largest
+    # possible number of records.
+    chunksize = 10000
+    tables = []
+    buflen = len(bfr_np)
+    position = C.c_longlong(0)
+    while position.value < buflen:
+        table = np.empty(chunksize, dtype=RECORD_TABLE_DTYPE)
+        count = clibmseed.readMSEEDRecordTable(
+            bfr_np, buflen, header_byteorder, table, chunksize,
+            C.byref(position))
+        tables.append(table[:count])
+    if not tables:
+        return np.empty(0, dtype=RECORD_TABLE_DTYPE)
+    records = np.concatenate(tables)
+    records["offset"] += offset
+    return records
+
+
+# Default suffix of the record index files written when reading with
+# ``index=True``.
+RECORD_INDEX_SUFFIX = ".index.npz"
+
+# The SEED identifiers are stored only once per index file, each record just
+# refers to them.
+_RECORD_INDEX_ID_FIELDS = [native_str(_k) for _k in (
+    "network", "station", "location", "channel", "dataquality")]
+
+
+def _load_record_index(index_filename, stat, header_byteorder=-1):
+    """
+    Loads a record table stored with :func:`_save_record_index`.
+
+    Returns ``None`` if the index does not exist, cannot be read or does not
+    belong to the current state of the file anymore.
+
+    :type index_filename: str
+    :param index_filename: File name of the index.
+    :param stat: Result of :func:`os.stat` for the indexed file.
+    :type header_byteorder: int
+    :param header_byteorder: The enforced header byte order the index must
+        have been created with.
+    """
+    if not os.path.exists(index_filename):
+        return None
+    try:
+        index = np.load(index_filename)
+    except (IOError, OSError, ValueError, zipfile.BadZipfile):
+        return None
+    try:
+        if int(index["size"]) != stat.st_size or \
+                float(index["mtime"]) != stat.st_mtime or \
+                int(index["header_byteorder"]) != header_byteorder:
+            return None
+        ids = index["ids"]
+        compact = index["records"]
+    except (KeyError, ValueError, zipfile.BadZipfile):
+        return None
+    finally:
+        index.close()
+    records = np.empty(len(compact), dtype=RECORD_TABLE_DTYPE)
+    try:
+        for key in compact.dtype.names:
+            if key != "id":
+                records[key] = compact[key]
+        for key in _RECORD_INDEX_ID_FIELDS:
+            records[key] = ids[key][compact["id"]]
+    except (ValueError, IndexError):
+        return None
+    return records
+
+
+def _save_record_index(index_filename, records, stat, header_byteorder=-1):
+    """
+    Stores a record table together with the size and modification time of
+    the indexed file. Only warns if the index cannot be written.
+
+    :type index_filename: str
+    :param index_filename: File name of the index.
+    :type records: :class:`numpy.ndarray`
+    :param records: Record table as returned by :func:`_get_record_table`.
+    :param stat: Result of :func:`os.stat` for the indexed file taken before
+        it was parsed.
+    :type header_byteorder: int
+    :param header_byteorder: The enforced header byte order used to parse the
+        records.
+    """
+    ids, inverse = np.unique(records[_RECORD_INDEX_ID_FIELDS],
+                             return_inverse=True)
+    fields = [_k for _k in RECORD_TABLE_DTYPE.names
+              if _k not in _RECORD_INDEX_ID_FIELDS]
+    compact = np.empty(len(records), dtype=np.dtype(
+        [(_k, RECORD_TABLE_DTYPE[_k]) for _k in fields] +
+        [(native_str("id"), np.int32)]))
+    for key in fields:
+        compact[key] = records[key]
+    compact["id"] = inverse
+    try:
+        with io.open(index_filename, "wb") as fh:
+            np.savez(fh, records=compact, ids=ids, size=stat.st_size,
+                     mtime=stat.st_mtime, header_byteorder=header_byteorder)
+    except (IOError, OSError) as e:
+        msg = "Could not write record index file '%s': %s" % (
+            index_filename, str(e))
+        warnings.warn(msg)
+
+
+def _select_records(records, starttime=None, endtime=None, sourcename=None):
+    """
+    Returns a boolean mask selecting the records matching the given time
+    window and SEED id in the same way libmseed's selections do.
+
+    :type records: :class:`numpy.ndarray`
+    :param records: Record table as returned by :func:`_get_record_table`.
+    :type starttime: :class:`~obspy.core.utcdatetime.UTCDateTime`
+    :type endtime: :class:`~obspy.core.utcdatetime.UTCDateTime`
+    :type sourcename: str
+    :param sourcename: SEED id, can contain wildcards.
+    """
+    mask = np.ones(len(records), dtype=np.bool_)
+    if starttime is not None:
+        mask &= records["endtime"] >= _convert_datetime_to_mstime(starttime)
+    if endtime is not None:
+        mask &= records["starttime"] <= _convert_datetime_to_mstime(endtime)
+    if sourcename is not None:
+        # Test every unique id only once.
+        ids = records["network"]
+        for key in ("station", "location", "channel"):
+            ids = np.char.add(np.char.add(ids, b"."), records[key])
+        for _id in np.unique(ids):
+            if not fnmatch.fnmatchcase(_id.decode(), sourcename):
+                mask &= ids != _id
+    return mask
+
+
+def _group_records(records, details=False):
+    """
+    Groups records into continuous segments.
+
+    Follows the same rules as libmseed when reading a buffer: Records are
+    grouped by SEED id and data quality in the order of their first
+    occurrence. A record is appended to the last segment of its id if it
+    directly continues it (within half a sample), has a tolerable sampling
+    rate and the same sample type. If ``details`` is ``True``, changes in
+    timing quality or calibration type will also start a new segment.
+
+    Returns a list of index arrays into ``records``, one for each segment.
+    """
+    if not len(records):
+        return []
+    ids = records[[native_str(_k) for _k in (
+        "network", "station", "location", "channel", "dataquality")]]
+    # Records usually come in long runs of the same id so only the first
+    # record of each run has to be looked at.
+    runs = np.concatenate([[0], np.nonzero(ids[1:] != ids[:-1])[0] + 1])
+    _, first, inverse = np.unique(ids[runs], return_index=True,
+                                  return_inverse=True)
+    inverse = np.repeat(inverse, np.diff(np.append(runs, len(records))))
+    # Sort by the first occurrence of the id and then by the position.
+    order = np.lexsort((np.arange(len(records)),
+                        np.argsort(np.argsort(first))[inverse]))
+    recs = records[order]
+    encodings, sampletype = np.unique(recs["encoding"], return_inverse=True)
+    sampletype = np.array([ENCODINGS.get(_e, (None, ""))[1]
+                           for _e in encodings])[sampletype]
+    samprate = recs["samprate"]
+    samplecnt = recs["samplecnt"]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        hpdelta = np.where(samprate[:-1],
+                           HPTMODULUS / samprate[:-1], 0).astype(np.int64)
+        tolerable = np.abs(1.0 - samprate[:-1] / samprate[1:]) < 0.0001
+    tolerance = (0.5 * hpdelta).astype(np.int64)
+    lastgap = recs["starttime"][1:] - recs["endtime"][:-1] - hpdelta
+    continues = (inverse[order][1:] == inverse[order][:-1]) & \
+        (samplecnt[1:] > 0) & (samplecnt[:-1] > 0) & \
+        (sampletype[1:] == sampletype[:-1]) & tolerable & \
+        (lastgap <= tolerance) & (lastgap >= -tolerance)
+    if details:
+        for key in ("timing_quality", "calibration_type"):
+            continues &= recs[key][1:] == recs[key][:-1]
+    # libmseed compares with the first record of a segment, only identical
+    # for constant sampling rates within a segment.
+    if np.any(continues & (samprate[1:] != samprate[:-1])):
+        return _group_records_sequentially(records, details=details)
+    return np.split(order, np.nonzero(~continues)[0] + 1)
+
+
+def _group_records_sequentially(records, details=False):
+    """
+    Slow but exact version of :func:`_group_records` that compares every
+    record to the state of the segment it might belong to.
+    """
+    ids = collections.OrderedDict()
+    segments = []
+    for _i, rec in enumerate(records):
+        key = (rec["network"], rec["station"], rec["location"],
+               rec["channel"], rec["dataquality"])
+        sampletype = ENCODINGS.get(rec["encoding"], (None, None))[1]
+        if details:
+            extra = (rec["timing_quality"], rec["calibration_type"])
+        else:
+            extra = None
+        seg = ids.get(key)
+        if seg is not None:
+            hpdelta = int(HPTMODULUS / seg["samprate"]) \
+                if seg["samprate"] else 0
+            tolerance = int(0.5 * hpdelta)
+            lastgap = rec["starttime"] - seg["endtime"] - hpdelta
+            if rec["samplecnt"] > 0 and seg["samplecnt"] > 0 and \
+                    seg["sampletype"] == sampletype and rec["samprate"] \
+                    and abs(1.0 - seg["samprate"] / rec["samprate"]) < 0.0001 \
+                    and -tolerance <= lastgap <= tolerance and \
+                    seg["extra"] == extra:
+                seg["indices"].append(_i)
+                seg["samplecnt"] += rec["samplecnt"]
+                seg["endtime"] = rec["endtime"]
+                continue
+        seg = {"indices": [_i], "samprate": rec["samprate"],
+               "samplecnt": rec["samplecnt"], "endtime": rec["endtime"],
+               "sampletype": sampletype, "extra": extra}
+        ids[key] = seg
+        segments.append((key, seg))
+    # Sort the segments by id and then by occurrence.
+    order = {key: _i for _i, key in enumerate(ids.keys())}
+    segments.sort(key=lambda x: order[x[0]])
+    return [np.array(seg["indices"], dtype=np.int64) for _, seg in segments]
+
+
+def iter_records(file_or_file_object, reclen=None, header_byteorder=None,
+                 details=False):
+    """
+    Yields the records of a MiniSEED file or stream one by one as Traces.
+
+    In contrast to :func:`~obspy.core.stream.read` the input is never read
+    as a whole. Only as many bytes as are needed for the current record are
+    read so this works with arbitrarily large files as well as with
+    non-seekable inputs like pipes or sockets (use ``socket.makefile("rb")``
+    to get a file-like object). Noise records and the control headers of
+    full SEED volumes are skipped.
+
+    :type file_or_file_object: str or file
+    :param file_or_file_object: MiniSEED file name or open file-like object
+        in binary mode. Only its ``read()`` method is used.
+    :type reclen: int, optional
+    :param reclen: Record length in bytes. Only needed for records without
+        blockette 1000, otherwise it is determined for every record.
+    :type header_byteorder: int or str, optional
+    :param header_byteorder: Enforce the header byte order, ``0`` or ``'<'``
+        for little-endian, ``1`` or ``'>'`` for big-endian.
+    :type details: bool, optional
+    :param details: Read the timing quality and calibration type, see
+        :func:`~obspy.io.mseed.core._read_mseed`.
+    :return: Generator of :class:`~obspy.core.trace.Trace` objects, one for
+        each data record.
+
+    .. rubric:: Example
+
+    >>> from obspy.core.util import get_example_file
+    >>> filename = get_example_file("test.mseed")
+    >>> for tr in iter_records(filename):
+    ...     print(tr)  # doctest: +ELLIPSIS
+    NL.HGN.00.BHZ | 2003-05-29T02:13:22.043400Z - ... | 40.0 Hz, 5980 samples
+    NL.HGN.00.BHZ | 2003-05-29T02:15:51.543400Z - ... | 40.0 Hz, 5967 samples
+    """
+    for record in _iter_record_buffers(file_or_file_object, reclen=reclen):
+        for trace in _decode_records(record, reclen=reclen,
+                                     header_byteorder=header_byteorder,
+                                     details=details):
+            yield trace
+
+
+def iter_traces(file_or_file_object, chunksize=2 ** 20, reclen=None,
+                header_byteorder=None, details=False):
+    """
+    Yields the data of a MiniSEED file or stream in chunks of Traces.
+
+    Works like :func:`iter_records` but collects records until at least
+    ``chunksize`` bytes are available and decodes them together. Continuous
+    records of the same channel within a chunk are merged into one Trace so
+    memory usage is bounded by the chunk size no matter how large the input
+    is. Traces are yielded per chunk and grouped by SEED id within each
+    chunk. Consecutive chunks are not merged, use
+    :meth:`~obspy.realtime.rttrace.RtTrace.append` or
+    :meth:`~obspy.core.stream.Stream.merge` for that.
+
+    :type chunksize: int, optional
+    :param chunksize: Minimal number of bytes to decode at once. Set it to
+        the record length to get the data of a live feed as soon as each
+        record arrives. Defaults to 1 MiB.
+
+    See :func:`iter_records` for the other parameters.
+
+    .. rubric:: Example
+
+    >>> from obspy.core.util import get_example_file
+    >>> filename = get_example_file("test.mseed")
+    >>> for tr in iter_traces(filename):
+    ...     print(tr)  # doctest: +ELLIPSIS
+    NL.HGN.00.BHZ | 2003-05-29T02:13:22.043400Z - ... | 40.0 Hz, 11947 samples
+    """
+    chunk = []
+    size = 0
+    for record in _iter_record_buffers(file_or_file_object, reclen=reclen):
+        chunk.append(record)
+        size += len(record)
+        if size < chunksize:
+            continue
+        for trace in _decode_records(b"".join(chunk), reclen=reclen,
+                                     header_byteorder=header_byteorder,
+                                     details=details):
+            yield trace
+        chunk = []
+        size = 0
+    if chunk:
+        for trace in _decode_records(b"".join(chunk), reclen=reclen,
+                                     header_byteorder=header_byteorder,
+                                     details=details):
+            yield trace
+
+
+# Characters allowed in the sequence number of a record header.
+_SEQUENCE_NUMBER_CHARS = frozenset(
+    [ord(_c) for _c in "0123456789 "] + [0])
+
+
+def _iter_record_buffers(file_or_file_object, reclen=None):
+    """
+    Yields the raw data records of a MiniSEED file or file-like object as
+    bytes.
+
+    Only reads as much from the input as is needed to complete the current
+    record. The record length is determined by libmseed's ``ms_detect()``
+    for every record unless ``reclen`` is given.
+    """
+    if isinstance(file_or_file_object, (str, native_str)):
+        with io.open(file_or_file_object, "rb") as fh:
+            for record in _iter_record_buffers(fh, reclen=reclen):
+                yield record
+        return
+
+    file_object = file_or_file_object
+    bfr = bytearray()
+    max_reclen = VALID_RECORD_LENGTHS[-1]
+    offset = 0
+    in_control_headers = False
+
+    def fill(size):
+        # Pipes and sockets might return less than requested.
+        while len(bfr) < size:
+            data = file_object.read(size - len(bfr))
+            if not data:
+                return False
+            bfr.extend(data)
+        return True
+
+    def drop(size):
+        del bfr[:size]
+        return offset + size
+
+    while True:
+        if not fill(MINRECLEN):
+            if bfr:
+                msg = ("Last record only has %i byte(s) which is not enough "
+                       "to constitute a full SEED record. Corrupt data? "
+                       "Record will be skipped." % len(bfr))
+                warnings.warn(msg, InternalMSEEDWarning)
+            return
+        valid_sequence = all(_c in _SEQUENCE_NUMBER_CHARS for _c in bfr[:6])
+        code = bfr[6]
+        # Empty or noise records.
+        if valid_sequence and bfr[6:48] == b" " * 42:
+            offset = drop(MINRECLEN)
+            continue
+        if valid_sequence and code in SEED_CONTROL_HEADERS:
+            in_control_headers = True
+            offset = drop(MINRECLEN)
+            continue
+        if not valid_sequence or code not in MINI_SEED_CONTROL_HEADERS:
+            # Skip the remainder of the control records of full SEED files.
+            if in_control_headers:
+                offset = drop(MINRECLEN)
+                continue
+            msg = "Not a valid (Mini-)SEED record at offset %i." % offset
+            raise ObsPyMSEEDReadingError(msg)
+        in_control_headers = False
+
+        record_length = reclen
+        size = MINRECLEN
+        while not record_length:
+            complete = fill(size)
+            length = min(size, len(bfr))
+            record_length = clibmseed.ms_detect(
+                np.frombuffer(bfr[:length], dtype=np.int8), length)
+            if record_length < 0:
+                msg = "Not a valid (Mini-)SEED record at offset %i." % offset
+                raise ObsPyMSEEDReadingError(msg)
+            elif record_length:
+                break
+            # No blockette 1000 and no following record in the buffer.
+            if not complete:
+                # The remaining bytes might make up exactly one record.
+                if not len(bfr) & (len(bfr) - 1):
+                    record_length = len(bfr)
+                    break
+                msg = ("Could not determine the length of the last record "
+                       "at offset %i. Record will be skipped." % offset)
+                warnings.warn(msg, InternalMSEEDWarning)
+                return
+            if size >= max_reclen:
+                msg = ("Could not determine the length of the record at "
+                       "offset %i." % offset)
+                raise ObsPyMSEEDReadingError(msg)
+            size *= 2
+
+        if not fill(record_length):
+            msg = ("Last record at offset %i has only %i of %i bytes. Record "
+                   "will be skipped." % (offset, len(bfr), record_length))
+            warnings.warn(msg, InternalMSEEDWarning)
+            return
+        record = bytes(bfr[:record_length])
+        offset = drop(record_length)
+        yield record
+
+
+def _decode_records(bfr, reclen=None, header_byteorder=None, details=False):
+    """
+    Decodes a buffer of complete records and yields a Trace for each
+    continuous segment.
+    """
+    # Avoid a circular import.
+    from .core import _read_mseed_buffer
+    if header_byteorder in [0, "0", "<"]:
+        header_byteorder = 0
+    elif header_byteorder in [1, "1", ">"]:
+        header_byteorder = 1
+    else:
+        header_byteorder = -1
+    for header, data in _read_mseed_buffer(
+            np.frombuffer(bfr, dtype=np.int8).copy(), reclen=reclen or -1,
+            details=details, header_byteorder=header_byteorder):
+        yield Trace(header=header, data=data)
+
+
 def _unpack_steim_1(data, npts, swapflag=0, verbose=0):
     """
     Unpack steim1 compressed data given as numpy array.
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""
+obspy.io.obspybin - Binary waveform container format for ObsPy
+===============================================================
+
+The obspy.io.obspybin package contains methods in order to read and write
+files in a simple binary format that stores all traces of a Stream without
+loss, including all header information (e.g. ``stats.processing`` and format
+specific header dictionaries like ``stats.mseed``). It is intended as a fast
+intermediate storage, e.g. between processing stages, and supports
+memory-mapped reading and reading only selected traces or time windows.
+
+:copyright:
+    The ObsPy Development Team (devs@obspy.org)
+:license:
+    GNU Lesser General Public License, Version 3
+    (https://www.gnu.org/copyleft/lesser.html)
+
+File Layout
+-----------
+
+All numbers are stored in little-endian byte order.
+
+============  =========  =====================================================
+Offset        Size       Content
+============  =========  =====================================================
+0             8          Magic bytes ``OBSPYBIN``
+8             4          Format version (unsigned integer), currently ``1``
+12            4          Length ``H`` of the header in bytes (unsigned
+                         integer)
+16            8          Offset ``D`` of the data section in bytes (unsigned
+                         integer), a multiple of 64
+24            ``H``      UTF-8 encoded JSON header
+``D``                    Data of all traces, each starting at a multiple of
+                         64 bytes
+============  =========  =====================================================
+
+The JSON header is an object with the key ``"traces"``, a list with one
+object per trace with the keys ``"network"``, ``"station"``,
+``"location"``, ``"channel"``, ``"starttime"`` (integer nanoseconds since
+1970-01-01T00:00:00), ``"sampling_rate"``, ``"calib"``, ``"npts"``,
+``"dtype"`` (NumPy type string, e.g. ``"<f8"``), ``"offset"`` (offset of the
+data relative to ``D``) and ``"stats"`` (all other header values). In
+``"stats"``, :class:`~obspy.core.utcdatetime.UTCDateTime`,
+:class:`~obspy.core.util.attribdict.AttribDict`, NumPy arrays, bytes and
+instrument responses (:class:`~obspy.core.inventory.response.Response`) are
+stored as objects with a single key ``"__utcdatetime__"`` (integer
+nanoseconds), ``"__attribdict__"``, ``"__ndarray__"`` (together with
+``"dtype"``), ``"__bytes__"`` (base64 encoded) or ``"__response__"``
+(StationXML ``Response`` element without namespace).
+
+Reading
+-------
+
+Files are read using the :func:`~obspy.core.stream.read` function.
+
+>>> from obspy import read
+>>> st = read()
+>>> st.write("example.bin", format="OBSPYBIN")  # doctest: +SKIP
+>>> st = read("example.bin", sourcename="*.EHZ",
+...           mmap=True)  # doctest: +SKIP
+
+See :func:`~obspy.io.obspybin.core._read_obspybin` for all options.
+"""
+from __future__ import (absolute_import, division, print_function,
+                        unicode_literals)
+from future.builtins import *  # NOQA @UnusedWildImport
+
+from .core import _is_obspybin, _read_obspybin, _write_obspybin  # NOQA
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod(exclude_empty=True)
@@ -0,0 +1,348 @@
+# -*- coding: utf-8 -*-
+"""
+OBSPYBIN bindings to ObsPy core module.
+
+:copyright:
+    The ObsPy Development Team (devs@obspy.org)
+:license:
+    GNU Lesser General Public License, Version 3
+    (https://www.gnu.org/copyleft/lesser.html)
+"""
+from __future__ import (absolute_import, division, print_function,
+                        unicode_literals)
+from future.builtins import *  # NOQA @UnusedWildImport
+from future.utils import native_str
+
+import base64
+import fnmatch
+import json
+import math
+import struct
+import warnings
+
+import numpy as np
+
+from obspy import Stream, Trace, UTCDateTime
+from obspy.core.inventory.response import Response
+from obspy.core.trace import Stats
+from obspy.core.util.attribdict import AttribDict
+
+
+MAGIC = b'OBSPYBIN'
+VERSION = 1
+# magic bytes, version, header length, data offset
+PRELUDE = struct.Struct(native_str('<8sIIQ'))
+# data of each trace starts at a multiple of this number of bytes
+ALIGNMENT = 64
+# header values that are not stored in the "stats" dictionary
+SKIPPED_KEYS = frozenset(Stats._default_keys + ('_format',))
+
+
+def _align(offset):
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def _encode_response(response):
+    """
+    Returns the StationXML ``Response`` element of a response as a string.
+    """
+    from lxml import etree
+    from obspy.io.stationxml.core import _write_response
+    parent = etree.Element('Channel')
+    _write_response(parent, response)
+    return etree.tostring(parent[0]).decode('utf-8')
+
+
+def _decode_response(text):
+    """
+    Inverse of :func:`_encode_response`.
+    """
+    from lxml import etree
+    from obspy.io.stationxml.core import _read_response
+    return _read_response(etree.fromstring(text.encode('utf-8')),
+                          lambda tag: tag)
+
+
+def _encode(value):
+    """
+    Converts a header value into an object that can be serialized to JSON.
+    """
+    if value is None or isinstance(value, (bool, float, str, native_str)):
+        return value
+    if isinstance(value, int):
+        return int(value)
+    if isinstance(value, UTCDateTime):
+        return {'__utcdatetime__': value._ns}
+    if isinstance(value, AttribDict):
+        return {'__attribdict__': _encode(dict(value))}
+    if isinstance(value, dict):
+        return dict((native_str(key), _encode(item))
+                    for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return [_encode(item) for item in value]
+    if isinstance(value, np.ndarray):
+        return {'__ndarray__': _encode(value.tolist()),
+                'dtype': value.dtype.str}
+    if isinstance(value, np.generic):
+        return _encode(value.item())
+    if isinstance(value, bytes):
+        return {'__bytes__': base64.b64encode(value).decode('ascii')}
+    if isinstance(value, Response):
+        return {'__response__': _encode_response(value)}
+    raise TypeError("Can not store object of type %s" % type(value))
+
+
+def _decode(value):
+    """
+    Inverse of :func:`_encode`.
+    """
+    if isinstance(value, list):
+        return [_decode(item) for item in value]
+    if not isinstance(value, dict):
+        return value
+    if '__utcdatetime__' in value:
+        return UTCDateTime(ns=value['__utcdatetime__'])
+    if '__attribdict__' in value:
+        return AttribDict(_decode(value['__attribdict__']))
+    if '__ndarray__' in value:
+        return np.array(value['__ndarray__'],
+                        dtype=native_str(value['dtype']))
+    if '__bytes__' in value:
+        return base64.b64decode(value['__bytes__'].encode('ascii'))
+    if '__response__' in value:
+        return _decode_response(value['__response__'])
+    return dict((key, _decode(item)) for key, item in value.items())
+
+
+def _is_obspybin(filename):
+    """
+    Checks whether a file is an OBSPYBIN file or not.
+
+    :type filename: str or file-like object
+    :param filename: Name of file or file-like object to be checked.
+    :rtype: bool
+    :return: ``True`` if an OBSPYBIN file.
+    """
+    try:
+        if hasattr(filename, 'read'):
+            position = filename.tell()
+            try:
+                magic = filename.read(len(MAGIC))
+            finally:
+                filename.seek(position, 0)
+        else:
+            with open(filename, 'rb') as fh:
+                magic = fh.read(len(MAGIC))
+    except Exception:
+        return False
+    return magic == MAGIC
+
+
+def _read_header(fh):
+    """
+    Reads the header of an OBSPYBIN file and returns the decoded JSON header
+    and the offset of the data section relative to the start of the file.
+    """
+    start = fh.tell()
+    magic, version, header_length, data_offset = PRELUDE.unpack(
+        fh.read(PRELUDE.size))
+    if magic != MAGIC:
+        raise ValueError("Not an OBSPYBIN file.")
+    if version > VERSION:
+        msg = "OBSPYBIN format version %d is not supported." % version
+        raise NotImplementedError(msg)
+    header = json.loads(fh.read(header_length).decode('utf-8'))
+    return header, start + data_offset
+
+
+def _get_sample_range(starttime, sampling_rate, npts, start=None, end=None):
+    """
+    Returns the indices of the first sample and the sample after the last
+    sample needed to trim a trace to the given time window.
+
+    The range contains at least all samples that
+    :meth:`~obspy.core.trace.Trace.trim` keeps with or without
+    ``nearest_sample``.
+    """
+    first, stop = 0, npts
+    if start is not None:
+        first = int(math.floor((start - starttime) * sampling_rate))
+        first = min(max(first, 0), npts)
+    if end is not None:
+        stop = int(math.ceil((end - starttime) * sampling_rate)) + 1
+        stop = min(max(stop, 0), npts)
+    return first, stop
+
+
+def _read_obspybin(filename, headonly=False, starttime=None, endtime=None,
+                   sourcename=None, mmap=False, **kwargs):
+    """
+    Reads an OBSPYBIN file and returns an ObsPy Stream object.
+
+    .. warning::
+        This function should NOT be called directly, it registers via the
+        ObsPy :func:`~obspy.core.stream.read` function, call this instead.
+
+    :type filename: str or file-like object
+    :param filename: OBSPYBIN file to be read.
+    :type headonly: bool, optional
+    :param headonly: If set to ``True``, read only the header.
+    :type starttime: :class:`~obspy.core.utcdatetime.UTCDateTime`, optional
+    :param starttime: Only read the samples of each trace needed for this
+        start time.
+    :type endtime: :class:`~obspy.core.utcdatetime.UTCDateTime`, optional
+    :param endtime: Only read the samples of each trace needed for this
+        end time.
+    :type sourcename: str, optional
+    :param sourcename: Only read traces with matching SEED ID (can contain
+        wildcards ``"?"`` and ``"*"``, e.g. ``"BW.UH2.*"`` or ``"*.??Z"``).
+        Defaults to ``None``.
+    :type mmap: bool, optional
+    :param mmap: If set to ``True``, the data of the traces are memory-mapped
+        instead of read into memory. Only data accessed are read from disk.
+        Changing the data does not change the file. Only possible if
+        ``filename`` is a file name.
+    :rtype: :class:`~obspy.core.stream.Stream`
+    :return: An ObsPy Stream object.
+
+    .. rubric:: Example
+
+    >>> from obspy import read
+    >>> from obspy.core.util import NamedTemporaryFile
+    >>> st = read()
+    >>> st[0].stats.processing = ['detrend']
+    >>> with NamedTemporaryFile() as tf:
+    ...     st.write(tf.name, format='OBSPYBIN')
+    ...     st2 = read(tf.name, sourcename='*.EHZ')
+    >>> print(st2)  # doctest: +ELLIPSIS
+    1 Trace(s) in Stream:
+    BW.RJOB..EHZ | 2009-08-24T00:20:03.000000Z - ... | 100.0 Hz, 3000 samples
+    >>> st2[0].stats.processing
+    ['detrend']
+    """
+    is_file_name = not hasattr(filename, 'read')
+    if mmap and not is_file_name:
+        raise ValueError("Memory-mapping requires a file name.")
+    fh = open(filename, 'rb') if is_file_name else filename
+    try:
+        header, data_offset = _read_header(fh)
+        traces = []
+        for info in header['traces']:
+            stats = Stats()
+            for key in ('network', 'station', 'location', 'channel',
+                        'sampling_rate', 'calib', 'npts'):
+                stats[key] = info[key]
+            stats.starttime = UTCDateTime(ns=info['starttime'])
+            for key, value in info['stats'].items():
+                stats[key] = _decode(value)
+            if sourcename is not None:
+                seed_id = "%(network)s.%(station)s.%(location)s.%(channel)s"
+                if not fnmatch.fnmatch(seed_id % stats, sourcename):
+                    continue
+            first, stop = _get_sample_range(
+                stats.starttime, stats.sampling_rate, stats.npts,
+                starttime, endtime)
+            if stop <= first and (starttime is not None or
+                                  endtime is not None):
+                # trace outside of the requested time window
+                continue
+            if first:
+                stats.starttime += first * stats.delta
+            stats.npts = max(stop - first, 0)
+            if headonly:
+                traces.append(Trace(header=stats))
+                continue
+            dtype = np.dtype(native_str(info['dtype']))
+            offset = data_offset + info['offset'] + first * dtype.itemsize
+            if not stats.npts:
+                data = np.array([], dtype=dtype)
+            elif mmap:
+                data = np.memmap(filename, dtype=dtype, mode='c',
+                                 offset=offset, shape=(stats.npts,))
+            else:
+                fh.seek(offset, 0)
+                buf = bytearray(fh.read(stats.npts * dtype.itemsize))
+                data = np.frombuffer(buf, dtype=dtype)
+            if not dtype.isnative:
+                data = data.astype(dtype.newbyteorder(native_str('=')))
+            tr = Trace(data=data, header=stats)
+            traces.append(tr)
+    finally:
+        if is_file_name:
+            fh.close()
+    return Stream(traces=traces)
+
+
+def _write_obspybin(stream, filename, **kwargs):  # @UnusedVariable
+    """
+    Writes an OBSPYBIN file.
+
+    .. warning::
+        This function should NOT be called directly, it registers via the
+        the :meth:`~obspy.core.stream.Stream.write` method of an
+        ObsPy :class:`~obspy.core.stream.Stream` object, call this instead.
+
+    Instrument responses are stored as StationXML. Header values that can
+    not be stored (e.g. arbitrary Python objects) are skipped with a
+    warning.
+
+    :type stream: :class:`~obspy.core.stream.Stream`
+    :param stream: The ObsPy Stream object to write.
+    :type filename: str or file-like object
+    :param filename: Name of file or file-like object to write.
+    """
+    infos = []
+    arrays = []
+    offset = 0
+    for tr in stream:
+        if isinstance(tr.data, np.ma.masked_array):
+            msg = ("Masked arrays are not supported by the OBSPYBIN "
+                   "format, use Stream.split() first.")
+            raise ValueError(msg)
+        data = np.asarray(tr.data)
+        if data.dtype.kind not in 'biufc':
+            msg = "Data type %s is not supported by the OBSPYBIN format."
+            raise ValueError(msg % data.dtype)
+        data = np.require(data, dtype=data.dtype.newbyteorder(
+            native_str('<')), requirements=['C_CONTIGUOUS'])
+        stats = {}
+        for key, value in tr.stats.items():
+            if key in SKIPPED_KEYS:
+                continue
+            try:
+                stats[native_str(key)] = _encode(value)
+            except TypeError as e:
+                msg = ("Header value '%s' of trace %s is not stored in "
+                       "OBSPYBIN format: %s") % (key, tr.id, e)
+                warnings.warn(msg)
+        infos.append({
+            'network': tr.stats.network, 'station': tr.stats.station,
+            'location': tr.stats.location, 'channel': tr.stats.channel,
+            'starttime': tr.stats.starttime._ns,
+            'sampling_rate': tr.stats.sampling_rate,
+            'calib': _encode(tr.stats.calib), 'npts': len(data),
+            'dtype': data.dtype.str, 'offset': offset, 'stats': stats})
+        arrays.append(data)
+        offset = _align(offset + data.nbytes)
+    header = json.dumps({'traces': infos},
+                        separators=(',', ':')).encode('utf-8')
+    data_offset = _align(PRELUDE.size + len(header))
+    is_file_name = not hasattr(filename, 'write')
+    fh = open(filename, 'wb') if is_file_name else filename
+    try:
+        fh.write(PRELUDE.pack(MAGIC, VERSION, len(header), data_offset))
+        fh.write(header)
+        position = PRELUDE.size + len(header)
+        for info, data in zip(infos, arrays):
+            start = data_offset + info['offset']
+            fh.write(b'\x00' * (start - position))
+            fh.write(data.tobytes())
+            position = start + data.nbytes
+    finally:
+        if is_file_name:
+            fh.close()
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod(exclude_empty=True)
@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+from __future__ import (absolute_import, division, print_function,
+                        unicode_literals)
+from future.builtins import *  # NOQA @UnusedWildImport
+
+import io
+import unittest
+import warnings
+
+import numpy as np
+
+from obspy import Stream, Trace, UTCDateTime, read
+from obspy.core.inventory.response import Response
+from obspy.core.util import AttribDict, NamedTemporaryFile
+from obspy.io.obspybin import _is_obspybin, _read_obspybin, _write_obspybin
+
+
+class OBSPYBINTestCase(unittest.TestCase):
+    """
+    Test suite for obspy.io.obspybin.
+    """
+    def setUp(self):
+        self.st = read()
+        self.st[0].stats.processing = ['ObsPy: detrend(type="linear")']
+        self.st[1].stats.mseed = AttribDict(
+            {'dataquality': 'D', 'record_length': 512,
+             'blkt1001': AttribDict({'timing_quality': np.uint8(90)})})
+        self.st[2].stats.custom = {
+            'time': UTCDateTime(2012, 1, 1, 0, 0, 0, 123456),
+            'array': np.arange(3, dtype=np.float32), 'bytes': b'\x00\xff',
+            'values': [1, 2.5, None, True, 'abc']}
+
+    def assert_streams_equal(self, st1, st2):
+        self.assertEqual(len(st1), len(st2))
+        for tr1, tr2 in zip(st1, st2):
+            stats1 = tr1.stats.copy()
+            stats2 = tr2.stats.copy()
+            stats2.pop('_format', None)
+            # arrays in header dictionaries can not be compared with "=="
+            custom1 = stats1.pop('custom', {})
+            custom2 = stats2.pop('custom', {})
+            self.assertEqual(stats1, stats2)
+            self.assertEqual(sorted(custom1), sorted(custom2))
+            for key in custom1:
+                np.testing.assert_equal(custom1[key], custom2[key])
+            self.assertEqual(tr1.data.dtype, tr2.data.dtype)
+            np.testing.assert_array_equal(tr1.data, tr2.data)
+
+    def test_read_write(self):
+        """
+        Tests that writing and reading gives the same data and header.
+        """
+        with NamedTemporaryFile() as tf:
+            self.st.write(tf.name, format='OBSPYBIN')
+            self.assertTrue(_is_obspybin(tf.name))
+            st = read(tf.name)
+            st2 = _read_obspybin(tf.name)
+        self.assert_streams_equal(self.st, st)
+        self.assert_streams_equal(self.st, st2)
+        self.assertEqual(st[0].stats._format, 'OBSPYBIN')
+        custom = st[2].stats.custom
+        self.assertIsInstance(custom['time'], UTCDateTime)
+        self.assertEqual(custom['array'].dtype, np.float32)
+        self.assertEqual(custom['bytes'], b'\x00\xff')
+        self.assertIsInstance(st[1].stats.mseed.blkt1001, AttribDict)
+        self.assertIsInstance(st[0].stats.response, Response)
+        self.assertEqual(st[0].stats.response, self.st[0].stats.response)
+
+    def test_data_types(self):
+        """
+        Tests all supported data types in both byte orders.
+        """
+        st = Stream()
+        for dtype in ('i1', 'u1', 'i2', 'i4', 'i8', 'f4', 'f8', 'c16'):
+            for byteorder in '<>':
+                data = np.arange(-5, 95).astype(byteorder + dtype)
+                st.append(Trace(data=data))
+        st.append(Trace(data=np.array([], dtype=np.float64)))
+        buf = io.BytesIO()
+        _write_obspybin(st, buf)
+        buf.seek(0)
+        self.assertTrue(_is_obspybin(buf))
+        self.assertEqual(buf.tell(), 0)
+        got = read(buf)
+        self.assertEqual(len(got), len(st))
+        for tr, tr_got in zip(st, got):
+            self.assertEqual(tr_got.data.dtype.byteorder in '=|', True)
+            self.assertEqual(tr_got.data.dtype.newbyteorder('<'),
+                             tr.data.dtype.newbyteorder('<'))
+            np.testing.assert_array_equal(tr.data, tr_got.data)
+        # data of all traces are aligned
+        buf.seek(0)
+        self.assertFalse(_is_obspybin(io.BytesIO(b'OBSPY')))
+        # masked arrays and object arrays can not be written
+        tr = Trace(data=np.ma.masked_array([1, 2, 3], mask=[0, 1, 0]))
+        self.assertRaises(ValueError, _write_obspybin, Stream([tr]),
+                          io.BytesIO())
+        tr = Trace(data=np.array(['a', 'b']))
+        self.assertRaises(ValueError, _write_obspybin, Stream([tr]),
+                          io.BytesIO())
+
+    def test_unsupported_header_values(self):
+        """
+        Header values that can not be stored are skipped with a warning.
+        """
+        st = self.st.copy()
+        st[0].stats.unsupported = object()
+        buf = io.BytesIO()
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('always')
+            st.write(buf, format='OBSPYBIN')
+        w = [w_ for w_ in w if 'not stored in OBSPYBIN' in str(w_.message)]
+        self.assertEqual(len(w), 1)
+        self.assertIn("'unsupported'", str(w[0].message))
+        buf.seek(0)
+        got = read(buf)
+        self.assertNotIn('unsupported', got[0].stats)
+        del st[0].stats.unsupported
+        self.assert_streams_equal(st, got)
+
+    def test_partial_reading(self):
+        """
+        Tests reading selected traces and time windows.
+        """
+        with NamedTemporaryFile() as tf:
+            self.st.write(tf.name, format='OBSPYBIN')
+            st = read(tf.name, sourcename='*.EH[NE]')
+            self.assertEqual([tr.id for tr in st],
+                             ['BW.RJOB..EHN', 'BW.RJOB..EHE'])
+            t = self.st[0].stats.starttime
+            for start, end in ((t + 1.234, t + 2.5), (t - 10, t + 0.1),
+                               (t + 29.9, t + 40), (t + 10.005, None),
+                               (None, t + 5.001)):
+                for nearest_sample in (True, False):
+                    # trimmed the same way as read() does
+                    expected = self.st.copy()
+                    if start is not None:
+                        expected._ltrim(start, nearest_sample=nearest_sample)
+                    if end is not None:
+                        expected._rtrim(end, nearest_sample=nearest_sample)
+                    got = read(tf.name, starttime=start, endtime=end,
+                               nearest_sample=nearest_sample)
+                    self.assert_streams_equal(expected, got)
+                    got = read(tf.name, starttime=start, endtime=end,
+                               nearest_sample=nearest_sample, mmap=True)
+                    self.assert_streams_equal(expected, got)
+            # time window outside of all traces
+            self.assertEqual(len(read(tf.name, starttime=t + 100)), 0)
+            # header only
+            st = read(tf.name, headonly=True)
+            self.assertEqual([tr.stats.npts for tr in st], [3000] * 3)
+            self.assertEqual([len(tr.data) for tr in st], [0] * 3)
+
+    def test_mmap(self):
+        """
+        Tests memory-mapped reading.
+        """
+        with NamedTemporaryFile() as tf:
+            self.st.write(tf.name, format='OBSPYBIN')
+            st = read(tf.name, mmap=True)
+            self.assert_streams_equal(self.st, st)
+            self.assertIsInstance(st[0].data, np.memmap)
+            # changing the data does not change the file
+            st[0].data[:] = 0
+            st.filter('lowpass', freq=1.0)
+            self.assert_streams_equal(self.st, read(tf.name))
+            del st
+            with open(tf.name, 'rb') as fh:
+                self.assertRaises(ValueError, _read_obspybin, fh, mmap=True)
+
+
+def suite():
+    return unittest.makeSuite(OBSPYBINTestCase, 'test')
+
+
+if __name__ == '__main__':
+    unittest.main(defaultTest='suite')
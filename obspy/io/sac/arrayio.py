@@ -78,7 +78,8 @@ def init_header_arrays(arrays=('float', 'int', 'str'), byteorder='='):
     return out
 
 
-def read_sac(source, headonly=False, byteorder=None, checksize=False):
+def read_sac(source, headonly=False, byteorder=None, checksize=False,
+             mmap=False):
     """
     Read a SAC binary file.
 
@@ -95,12 +96,16 @@ def read_sac(source, headonly=False, byteorder=None, checksize=False):
     :param checksize: If True, check that the theoretical file size from the
         header matches the size on disk.
     :type checksize: bool
+    :param mmap: If True, the data array is a copy-on-write memory-map of the
+        file instead of being read into memory. Requires a full path string.
+    :type mmap: bool
 
     :return: The float, integer, and string header arrays, and data array,
         in that order. Data array will be None if headonly is True.
     :rtype: tuple of :class:`numpy.ndarray`
 
-    :raises: :class:`ValueError` if unrecognized byte order.  :class:`IOError`
+    :raises: :class:`ValueError` if unrecognized byte order or if mmap is
+        True for a File-like object. :class:`IOError`
         if file not found, incorrect specified byteorder, theoretical file size
         doesn't match header, or header arrays are incorrect length.
 
@@ -114,6 +119,8 @@ def read_sac(source, headonly=False, byteorder=None, checksize=False):
         # source is already a file-like object
         f = source
         is_file_name = False
+        if mmap:
+            raise ValueError("Memory-mapping requires a file name.")
 
     is_byteorder_specified = byteorder is not None
     if not is_byteorder_specified:
@@ -181,6 +188,14 @@ def read_sac(source, headonly=False, byteorder=None, checksize=False):
     # --------------------------------------------------------------
     if headonly:
         data = None
+    elif mmap and npts > 0:
+        # data keep the byte order of the file
+        f.seek(0, os.SEEK_END)
+        if f.tell() < 632 + 4 * int(npts):
+            f.close()
+            raise SacIOError("Cannot read all data points")
+        data = np.memmap(source, dtype=native_str(endian_str + 'f4'),
+                         mode='c', offset=632, shape=(int(npts),))
     else:
         data = from_buffer(f.read(int(npts) * 4),
                            dtype=native_str(endian_str + 'f4'))
@@ -308,7 +308,7 @@ def _internal_write_sac_xy(trace, buf, **kwargs):  # @UnusedVariable
 
 
 def _read_sac(filename, headonly=False, debug_headers=False, fsize=True,
-              **kwargs):  # @UnusedVariable
+              mmap=False, **kwargs):  # @UnusedVariable
     """
     Reads an SAC file and returns an ObsPy Stream object.
 
@@ -331,6 +331,12 @@ def _read_sac(filename, headonly=False, debug_headers=False, fsize=True,
     :param fsize: Check if file size is consistent with theoretical size
         from header. Defaults to ``True``.
     :type fsize: bool
+    :param mmap: If set to ``True``, the data are memory-mapped instead of
+        read into memory. Only data accessed are read from disk and changing
+        the data does not change the file. The data keep the byte order of
+        the file. Only possible for binary SAC files given by file name.
+        Defaults to ``False``.
+    :type mmap: bool
     :rtype: :class:`~obspy.core.stream.Stream`
     :return: A ObsPy Stream object.
 
@@ -341,9 +347,15 @@ def _read_sac(filename, headonly=False, debug_headers=False, fsize=True,
     """
     # Only byte buffers for binary SAC.
     if is_bytes_buffer(filename):
+        if mmap:
+            raise ValueError("Memory-mapping requires a file name.")
         return _internal_read_sac(buf=filename, headonly=headonly,
                                   debug_headers=debug_headers, fsize=fsize,
                                   **kwargs)
+    elif mmap and isinstance(filename, (str, bytes)):
+        return _internal_read_sac(buf=filename, headonly=headonly,
+                                  debug_headers=debug_headers, fsize=fsize,
+                                  mmap=True, **kwargs)
     elif isinstance(filename, (str, bytes)):
         with open(filename, "rb") as fh:
             return _internal_read_sac(buf=fh, headonly=headonly,
@@ -354,7 +366,7 @@ def _read_sac(filename, headonly=False, debug_headers=False, fsize=True,
 
 
 def _internal_read_sac(buf, headonly=False, debug_headers=False, fsize=True,
-                       **kwargs):  # @UnusedVariable
+                       mmap=False, **kwargs):  # @UnusedVariable
     """
     Reads an SAC file and returns an ObsPy Stream object.
 
@@ -363,7 +375,8 @@ def _internal_read_sac(buf, headonly=False, debug_headers=False, fsize=True,
         ObsPy :func:`~obspy.core.stream.read` function, call this instead.
 
     :param buf: SAC file to be read.
-    :type buf: file or file-like object.
+    :type buf: file or file-like object, or file name if ``mmap`` is
+        ``True``.
     :param headonly: If set to True, read only the head. This is most useful
         for scanning available data in huge (temporary) data sets.
     :type headonly: bool
@@ -377,6 +390,9 @@ def _internal_read_sac(buf, headonly=False, debug_headers=False, fsize=True,
     :param fsize: Check if file size is consistent with theoretical size
         from header. Defaults to ``True``.
     :type fsize: bool
+    :param mmap: If set to ``True``, the data are memory-mapped instead of
+        read into memory. Defaults to ``False``.
+    :type mmap: bool
     :rtype: :class:`~obspy.core.stream.Stream`
     :return: A ObsPy Stream object.
     """
@@ -386,7 +402,7 @@ def _internal_read_sac(buf, headonly=False, debug_headers=False, fsize=True,
 
     # read SAC file
     sac = SACTrace.read(buf, headonly=headonly, ascii=False,
-                        checksize=fsize, encoding=encoding_str)
+                        checksize=fsize, encoding=encoding_str, mmap=mmap)
     # assign all header entries to a new dictionary compatible with an ObsPy
     tr = sac.to_obspy_trace(debug_headers=debug_headers, encoding=encoding_str)
 
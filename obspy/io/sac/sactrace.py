@@ -1031,7 +1031,8 @@ class SACTrace(object):
     # --------------------------- I/O METHODS ---------------------------------
     @classmethod
     def read(cls, source, headonly=False, ascii=False, byteorder=None,
-             checksize=False, debug_strings=False, encoding='ASCII'):
+             checksize=False, debug_strings=False, encoding='ASCII',
+             mmap=False):
         """
         Construct an instance from a binary or ASCII file on disk.
 
@@ -1059,6 +1060,10 @@ class SACTrace(object):
         :param encoding: Encoding string that passes the user specified
         encoding scheme.
         :type encoding: str
+        :param mmap: If True, the data array is a copy-on-write memory-map of
+            the file instead of being read into memory. Only valid for binary
+            files given as a full path string.
+        :type mmap: bool
 
         :raises: :class:`SacIOError` if checksize failed, byteorder was wrong,
             or header arrays are wrong size.
@@ -1089,7 +1094,7 @@ class SACTrace(object):
         else:
             hf, hi, hs, data = _io.read_sac(source, headonly=headonly,
                                             byteorder=byteorder,
-                                            checksize=checksize)
+                                            checksize=checksize, mmap=mmap)
         if not debug_strings:
             for i, val in enumerate(hs):
                 val = _ut._clean_str(val.decode(encoding, 'replace'),
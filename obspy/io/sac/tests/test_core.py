@@ -7,6 +7,7 @@ from __future__ import (absolute_import, division, print_function,
 from future.builtins import *  # NOQA
 
 import copy
+import gzip
 import io
 import os
 import unittest
@@ -930,6 +931,39 @@ class CoreTestCase(unittest.TestCase):
         tr0 = read(self.file_encode, encoding='cp1252')[0]
         self.assertEqual(tr0.stats.get('channel'), 'ÇÏÿÿÇÏÿÿ')
 
+    def test_read_mmap(self):
+        """
+        Test memory-mapped reading of little and big endian SAC files.
+        """
+        for filename in (self.file, self.filebe):
+            expected = read(filename)[0]
+            tr = read(filename, mmap=True)[0]
+            self.assertIsInstance(tr.data, np.memmap)
+            self.assertEqual(tr.stats, expected.stats)
+            np.testing.assert_array_equal(tr.data, expected.data)
+            # changing the data does not change the file
+            tr.data[:] = 0
+            np.testing.assert_array_equal(read(filename)[0].data,
+                                          expected.data)
+        # truncated file
+        with open(self.file, 'rb') as fh:
+            data = fh.read()
+        with NamedTemporaryFile() as tf:
+            tf.write(data[:-4])
+            tf.flush()
+            self.assertRaises(SacIOError, _read_sac, tf.name, fsize=False,
+                              mmap=True)
+        # compressed files are read into memory
+        with NamedTemporaryFile(suffix='.gz') as tf:
+            with gzip.open(tf.name, 'wb') as fh:
+                fh.write(data)
+            tr = read(tf.name, mmap=True)[0]
+            self.assertNotIsInstance(tr.data, np.memmap)
+            np.testing.assert_array_equal(tr.data, read(self.file)[0].data)
+        # file-like objects can not be memory-mapped
+        with open(self.file, 'rb') as fh:
+            self.assertRaises(ValueError, _read_sac, fh, mmap=True)
+
 
 def suite():
     return unittest.makeSuite(CoreTestCase, 'test')
@@ -128,7 +128,7 @@ def _is_segy(filename):
 
 def _read_segy(filename, headonly=False, byteorder=None,
                textual_header_encoding=None, unpack_trace_headers=False,
-               **kwargs):  # @UnusedVariable
+               mmap=False, **kwargs):  # @UnusedVariable
     """
     Reads a SEG Y file and returns an ObsPy Stream object.
 
@@ -157,6 +157,13 @@ def _read_segy(filename, headonly=False, byteorder=None,
         header values can still be accessed and will be calculated on the fly
         but tab completion will no longer work. Look in the headers.py for a
         list of all possible trace header values. Defaults to ``False``.
+    :type mmap: bool, optional
+    :param mmap: If set to ``True``, the data of the traces are memory-mapped
+        instead of read into memory. Only data accessed are read from disk and
+        changing the data does not change the file. The data keep the byte
+        order of the file. Only possible for data stored as 2 or 4 byte
+        integers or 4 byte IEEE floats (data encodings 2, 3 and 5), other
+        data are read into memory. Defaults to ``False``.
     :returns: A ObsPy :class:`~obspy.core.stream.Stream` object.
 
     .. rubric:: Example
@@ -173,7 +180,7 @@ def _read_segy(filename, headonly=False, byteorder=None,
     segy_object = _read_segyrev1(
         filename, endian=byteorder,
         textual_header_encoding=textual_header_encoding,
-        unpack_headers=unpack_trace_headers)
+        unpack_headers=unpack_trace_headers, mmap=mmap)
     # Create the stream object.
     stream = Stream()
     # SEGY has several file headers that apply to all traces. They will be
@@ -416,7 +423,8 @@ def _is_su(filename):
 
 
 def _read_su(filename, headonly=False, byteorder=None,
-             unpack_trace_headers=False, **kwargs):  # @UnusedVariable
+             unpack_trace_headers=False, mmap=False,
+             **kwargs):  # @UnusedVariable
     """
     Reads a Seismic Unix (SU) file and returns an ObsPy Stream object.
 
@@ -441,6 +449,11 @@ def _read_su(filename, headonly=False, byteorder=None,
         header values can still be accessed and will be calculated on the fly
         but tab completion will no longer work. Look in the headers.py for a
         list of all possible trace header values. Defaults to ``False``.
+    :type mmap: bool, optional
+    :param mmap: If set to ``True``, the data of the traces are memory-mapped
+        instead of read into memory. Only data accessed are read from disk and
+        changing the data does not change the file. The data keep the byte
+        order of the file. Defaults to ``False``.
     :returns: A ObsPy :class:`~obspy.core.stream.Stream` object.
 
     .. rubric:: Example
@@ -455,7 +468,7 @@ def _read_su(filename, headonly=False, byteorder=None,
     """
     # Read file to the internal segy representation.
     su_object = _read_su_file(filename, endian=byteorder,
-                              unpack_headers=unpack_trace_headers)
+                              unpack_headers=unpack_trace_headers, mmap=mmap)
 
     # Create the stream object.
     stream = Stream()
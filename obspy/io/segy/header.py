@@ -206,6 +206,13 @@ DATA_SAMPLE_FORMAT_CODE_DTYPE = {
     3: np.int16,
     5: np.float32}
 
+# Data sample formats stored as plain machine numbers that can be
+# memory-mapped, and the corresponding dtype (without byte order).
+DATA_SAMPLE_FORMAT_MMAP_DTYPE = {
+    2: 'i4',
+    3: 'i2',
+    5: 'f4'}
+
 # Map the endianness to bigger/smaller sign.
 ENDIAN = {
     'big': '>',
@@ -13,6 +13,7 @@ Routines to read and write SEG Y rev 1 encoded seismic data files.
 from __future__ import (absolute_import, division, print_function,
                         unicode_literals)
 from future.builtins import *  # NOQA
+from future.utils import native_str
 
 import io
 import os
@@ -25,6 +26,7 @@ from obspy import Trace, UTCDateTime
 from obspy.core import AttribDict
 
 from .header import (BINARY_FILE_HEADER_FORMAT,
+                     DATA_SAMPLE_FORMAT_MMAP_DTYPE,
                      DATA_SAMPLE_FORMAT_PACK_FUNCTIONS,
                      DATA_SAMPLE_FORMAT_SAMPLE_SIZE,
                      DATA_SAMPLE_FORMAT_UNPACK_FUNCTIONS, ENDIAN,
@@ -84,12 +86,25 @@ class SEGYInvalidTextualHeaderWarning(SEGYWarning):
     pass
 
 
+def _map_file(file):
+    """
+    Returns a copy-on-write memory-map of the whole file as bytes.
+
+    :param file: Open file object with a file name.
+    """
+    name = getattr(file, 'name', None)
+    if not isinstance(name, (str, native_str)):
+        raise ValueError("Memory-mapping requires a file with a file name.")
+    return np.memmap(name, dtype=np.uint8, mode='c')
+
+
 class SEGYFile(object):
     """
     Class that internally handles SEG Y files.
     """
     def __init__(self, file=None, endian=None, textual_header_encoding=None,
-                 unpack_headers=False, headonly=False, read_traces=True):
+                 unpack_headers=False, headonly=False, read_traces=True,
+                 mmap=False):
         """
         Class that internally handles SEG Y files.
 
@@ -116,6 +131,12 @@ class SEGYFile(object):
         :param read_traces: Data traces will only be read if this is set to
             ``True``. The data will be completely ignored if this is set to
             ``False``.
+        :type mmap: bool
+        :param mmap: If set to ``True``, the data of all traces with data
+            stored as plain 2 or 4 byte integers or 4 byte IEEE floats are
+            memory-mapped instead of read into memory. Changing the data
+            does not change the file. Requires an open file with a file name.
+            Defaults to False.
         """
         if file is None:
             self._create_empty_segy_file_object()
@@ -142,7 +163,7 @@ class SEGYFile(object):
         # Read the actual traces.
         if read_traces:
             [i for i in self._read_traces(
-                unpack_headers=unpack_headers, headonly=headonly)]
+                unpack_headers=unpack_headers, headonly=headonly, mmap=mmap)]
 
     def __str__(self):
         """
@@ -381,7 +402,7 @@ class SEGYFile(object):
         file.write(textual_header)
 
     def _read_traces(self, unpack_headers=False, headonly=False,
-                     yield_each_trace=False):
+                     yield_each_trace=False, mmap=False):
         """
         Reads the actual traces starting at the current file pointer position
         to the end of the file.
@@ -404,8 +425,15 @@ class SEGYFile(object):
             streaming interface to read SEG-Y files. Read traces will no
             longer be collected in ``self.traces`` list if this is set to
             ``True``.
+        :type mmap: bool
+        :param mmap: If set to ``True``, the data of all traces with data
+            stored as plain 2 or 4 byte integers or 4 byte IEEE floats are
+            memory-mapped instead of read into memory. Changing the data
+            does not change the file. Requires an open file with a file name.
+            Defaults to False.
         """
         self.traces = []
+        file_map = _map_file(self.file) if mmap else None
         # Determine the filesize once.
         if isinstance(self.file, io.BytesIO):
             pos = self.file.tell()
@@ -420,7 +448,8 @@ class SEGYFile(object):
             try:
                 trace = SEGYTrace(self.file, self.data_encoding, self.endian,
                                   unpack_headers=unpack_headers,
-                                  filesize=filesize, headonly=headonly)
+                                  filesize=filesize, headonly=headonly,
+                                  file_map=file_map)
                 if yield_each_trace:
                     yield trace
                 else:
@@ -533,7 +562,8 @@ class SEGYTrace(object):
     Convenience class that internally handles a single SEG Y trace.
     """
     def __init__(self, file=None, data_encoding=4, endian='>',
-                 unpack_headers=False, filesize=None, headonly=False):
+                 unpack_headers=False, filesize=None, headonly=False,
+                 file_map=None):
         """
         Convenience class that internally handles a single SEG Y trace.
 
@@ -573,6 +603,10 @@ class SEGYTrace(object):
             will be read and unpacked. Has a huge impact on memory usage. Data
             can be read and unpacked on-the-fly after reading the file.
             Defaults to False.
+        :type file_map: :class:`numpy.memmap`
+        :param file_map: Memory-map of the whole file as bytes. If given, the
+            data are a view of it instead of being read into memory if the
+            data encoding allows it.
         """
         self.endian = endian
         self.data_encoding = data_encoding
@@ -593,9 +627,11 @@ class SEGYTrace(object):
             else:
                 self.filesize = os.fstat(self.file.fileno())[6]
         # Otherwise read the file.
-        self._read_trace(unpack_headers=unpack_headers, headonly=headonly)
+        self._read_trace(unpack_headers=unpack_headers, headonly=headonly,
+                         file_map=file_map)
 
-    def _read_trace(self, unpack_headers=False, headonly=False):
+    def _read_trace(self, unpack_headers=False, headonly=False,
+                    file_map=None):
         """
         Reads the complete next header starting at the file pointer at
         self.file.
@@ -610,6 +646,10 @@ class SEGYTrace(object):
             will be read and unpacked. Has a huge impact on memory usage. Data
             can be read and unpacked on-the-fly after reading the file.
             Defaults to False.
+        :type file_map: :class:`numpy.memmap`
+        :param file_map: Memory-map of the whole file as bytes. If given, the
+            data are a view of it instead of being read into memory if the
+            data encoding allows it.
         """
         trace_header = self.file.read(240)
         # Check if it is smaller than 240 byte.
@@ -641,6 +681,15 @@ class SEGYTrace(object):
             self.unpack_data = OnTheFlyDataUnpacker(
                 DATA_SAMPLE_FORMAT_UNPACK_FUNCTIONS[self.data_encoding],
                 self.file.name, self.file.mode, pos, npts, endian=self.endian)
+        elif file_map is not None and \
+                self.data_encoding in DATA_SAMPLE_FORMAT_MMAP_DTYPE:
+            # view of the memory-mapped file, keeping the byte order of the
+            # file
+            dtype = self.endian + \
+                DATA_SAMPLE_FORMAT_MMAP_DTYPE[self.data_encoding]
+            self.data = file_map[pos:pos + data_needed].view(
+                native_str(dtype))
+            self.file.seek(data_needed, 1)
         else:
             # Unpack the data.
             self.data = DATA_SAMPLE_FORMAT_UNPACK_FUNCTIONS[
@@ -919,7 +968,7 @@ class SEGYTraceHeader(object):
 
 
 def _read_segy(file, endian=None, textual_header_encoding=None,
-               unpack_headers=False, headonly=False):
+               unpack_headers=False, headonly=False, mmap=False):
     """
     Reads a SEG Y file and returns a SEGYFile object.
 
@@ -942,6 +991,10 @@ def _read_segy(file, endian=None, textual_header_encoding=None,
     :param headonly: Determines whether or not the actual data records will be
         read and unpacked. Has a huge impact on memory usage. Data can be read
         and unpacked on-the-fly after reading the file. Defaults to False.
+    :type mmap: bool
+    :param mmap: If set to ``True``, the data are memory-mapped instead of
+        read into memory if the data encoding allows it. Requires a file name
+        or an open file with a file name. Defaults to False.
     """
     # Open the file if it is not a file like object.
     if not hasattr(file, 'read') or not hasattr(file, 'tell') or not \
@@ -950,16 +1003,16 @@ def _read_segy(file, endian=None, textual_header_encoding=None,
             return _internal_read_segy(
                 open_file, endian=endian,
                 textual_header_encoding=textual_header_encoding,
-                unpack_headers=unpack_headers, headonly=headonly)
+                unpack_headers=unpack_headers, headonly=headonly, mmap=mmap)
     # Otherwise just read it.
     return _internal_read_segy(file, endian=endian,
                                textual_header_encoding=textual_header_encoding,
                                unpack_headers=unpack_headers,
-                               headonly=headonly)
+                               headonly=headonly, mmap=mmap)
 
 
 def _internal_read_segy(file, endian=None, textual_header_encoding=None,
-                        unpack_headers=False, headonly=False):
+                        unpack_headers=False, headonly=False, mmap=False):
     """
     Reads on open file object and returns a SEGYFile object.
 
@@ -981,10 +1034,15 @@ def _internal_read_segy(file, endian=None, textual_header_encoding=None,
     :param headonly: Determines whether or not the actual data records will be
         read and unpacked. Has a huge impact on memory usage. Data can be read
         and unpacked on-the-fly after reading the file. Defaults to False.
+    :type mmap: bool
+    :param mmap: If set to ``True``, the data are memory-mapped instead of
+        read into memory if the data encoding allows it. Requires a file name
+        or an open file with a file name. Defaults to False.
     """
     return SEGYFile(file, endian=endian,
                     textual_header_encoding=textual_header_encoding,
-                    unpack_headers=unpack_headers, headonly=headonly)
+                    unpack_headers=unpack_headers, headonly=headonly,
+                    mmap=mmap)
 
 
 def iread_segy(file, endian=None, textual_header_encoding=None,
@@ -1156,7 +1214,7 @@ class SUFile(object):
     currently can only read IEEE 4 byte float encoded SU data files.
     """
     def __init__(self, file=None, endian=None, unpack_headers=False,
-                 headonly=False, read_traces=True):
+                 headonly=False, read_traces=True, mmap=False):
         """
         :param file: A file like object with the file pointer set at the
             beginning of the SEG Y file. If file is None, an empty SEGYFile
@@ -1178,6 +1236,11 @@ class SUFile(object):
         :param read_traces: Data traces will only be read if this is set to
             ``True``. The data will be completely ignored if this is set to
             ``False``.
+        :type mmap: bool
+        :param mmap: If set to ``True``, the data of all traces are
+            memory-mapped instead of read into memory. Changing the data does
+            not change the file. Requires an open file with a file name.
+            Defaults to False.
         """
         if file is None:
             self._create_empty_su_file_object()
@@ -1197,7 +1260,7 @@ class SUFile(object):
         if read_traces:
             # Read the actual traces.
             [i for i in self._read_traces(unpack_headers=unpack_headers,
-                                          headonly=headonly)]
+                                          headonly=headonly, mmap=mmap)]
 
     def _autodetect_endianness(self):
         """
@@ -1225,7 +1288,7 @@ class SUFile(object):
         p.text(str(self))
 
     def _read_traces(self, unpack_headers=False, headonly=False,
-                     yield_each_trace=False):
+                     yield_each_trace=False, mmap=False):
         """
         Reads the actual traces starting at the current file pointer position
         to the end of the file.
@@ -1245,8 +1308,12 @@ class SUFile(object):
             streaming interface to read SEG-Y files. Read traces will no
             longer be collected in ``self.traces`` list if this is set to
             ``True``.
+        :type mmap: bool
+        :param mmap: If set to ``True``, the data of all traces are
+            memory-mapped instead of read into memory. Defaults to False.
         """
         self.traces = []
+        file_map = _map_file(self.file) if mmap else None
         # Big loop to read all data traces.
         while True:
             # Read and as soon as the trace header is too small abort.
@@ -1254,7 +1321,7 @@ class SUFile(object):
                 # Always unpack with IEEE
                 trace = SEGYTrace(self.file, 5, self.endian,
                                   unpack_headers=unpack_headers,
-                                  headonly=headonly)
+                                  headonly=headonly, file_map=file_map)
                 if yield_each_trace:
                     yield trace
                 else:
@@ -1287,7 +1354,8 @@ class SUFile(object):
             trace.write(file, data_encoding=5, endian=endian)
 
 
-def _read_su(file, endian=None, unpack_headers=False, headonly=False):
+def _read_su(file, endian=None, unpack_headers=False, headonly=False,
+             mmap=False):
     """
     Reads a Seismic Unix (SU) file and returns a SUFile object.
 
@@ -1307,6 +1375,10 @@ def _read_su(file, endian=None, unpack_headers=False, headonly=False):
     :param headonly: Determines whether or not the actual data records will be
         unpacked. Useful if one is just interested in the headers. Defaults to
         False.
+    :type mmap: bool
+    :param mmap: If set to ``True``, the data are memory-mapped instead of
+        read into memory. Requires a file name or an open file with a file
+        name. Defaults to False.
     """
     # Open the file if it is not a file like object.
     if not hasattr(file, 'read') or not hasattr(file, 'tell') or not \
@@ -1314,13 +1386,15 @@ def _read_su(file, endian=None, unpack_headers=False, headonly=False):
         with open(file, 'rb') as open_file:
             return _internal_read_su(open_file, endian=endian,
                                      unpack_headers=unpack_headers,
-                                     headonly=headonly)
+                                     headonly=headonly, mmap=mmap)
     # Otherwise just read it.
     return _internal_read_su(file, endian=endian,
-                             unpack_headers=unpack_headers, headonly=headonly)
+                             unpack_headers=unpack_headers, headonly=headonly,
+                             mmap=mmap)
 
 
-def _internal_read_su(file, endian=None, unpack_headers=False, headonly=False):
+def _internal_read_su(file, endian=None, unpack_headers=False,
+                      headonly=False, mmap=False):
     """
     Reads on open file object and returns a SUFile object.
 
@@ -1339,9 +1413,13 @@ def _internal_read_su(file, endian=None, unpack_headers=False, headonly=False):
     :param headonly: Determines whether or not the actual data records will be
         unpacked. Useful if one is just interested in the headers. Defaults to
         False.
+    :type mmap: bool
+    :param mmap: If set to ``True``, the data are memory-mapped instead of
+        read into memory. Requires a file name or an open file with a file
+        name. Defaults to False.
     """
     return SUFile(file, endian=endian, unpack_headers=unpack_headers,
-                  headonly=headonly)
+                  headonly=headonly, mmap=mmap)
 
 
 def autodetect_endian_and_sanity_check_su(file):
@@ -673,6 +673,50 @@ class SEGYCoreTestCase(unittest.TestCase):
                     st2.stats.textual_file_header.decode().split()[0],
                     "12345")
 
+    def test_read_mmap(self):
+        """
+        Tests memory-mapped reading of SEG Y and SU files.
+        """
+        for file, attribs in self.files.items():
+            file = os.path.join(self.path, file)
+            expected = _read_segy(file)
+            st = _read_segy(file, mmap=True)
+            for tr, tr_expected in zip(st, expected):
+                np.testing.assert_array_equal(tr.data, tr_expected.data)
+                # IBM floats can not be memory-mapped
+                self.assertEqual(isinstance(tr.data, np.memmap),
+                                 attribs['data_sample_enc'] != 1)
+        # several traces and all data encodings that can be memory-mapped
+        st = read()
+        for data_encoding, dtype in ((2, np.int32), (3, np.int16),
+                                     (5, np.float32)):
+            for tr in st:
+                tr.data = np.require(tr.data, dtype=dtype)
+            for format in ('SEGY', 'SU'):
+                if format == 'SU' and data_encoding != 5:
+                    continue
+                with NamedTemporaryFile() as tf:
+                    with warnings.catch_warnings(record=True):
+                        st.write(tf.name, format=format,
+                                 data_encoding=data_encoding)
+                    got = read(tf.name, format=format, mmap=True)
+                    self.assertEqual(len(got), 3)
+                    for tr, tr_got in zip(st, got):
+                        self.assertIsInstance(tr_got.data, np.memmap)
+                        self.assertEqual(tr_got.data.dtype.newbyteorder('='),
+                                         tr.data.dtype)
+                        np.testing.assert_array_equal(tr.data, tr_got.data)
+                    # changing the data does not change the file
+                    got[0].data[:] = 0
+                    np.testing.assert_array_equal(
+                        read(tf.name, format=format)[0].data, st[0].data)
+        # file-like objects can not be memory-mapped
+        with io.BytesIO() as buf:
+            with warnings.catch_warnings(record=True):
+                st.write(buf, format='SEGY', data_encoding=5)
+            buf.seek(0, 0)
+            self.assertRaises(ValueError, _read_segy, buf, mmap=True)
+
 
 def suite():
     return unittest.makeSuite(SEGYCoreTestCase, 'test')
@@ -0,0 +1,532 @@
+# -*- coding: utf-8 -*-
+"""
+Module for processing long continuous data in chunks.
+
+:copyright:
+    The ObsPy Development Team (devs@obspy.org)
+:license:
+    GNU Lesser General Public License, Version 3
+    (https://www.gnu.org/copyleft/lesser.html)
+"""
+from __future__ import (absolute_import, division, print_function,
+                        unicode_literals)
+from future.builtins import *  # NOQA
+
+import warnings
+
+import numpy as np
+
+from obspy import Trace, read
+from obspy.signal.filter import (_bandpass_sos, _bandstop_sos,
+                                 _highpass_sos, _lowpass_cheby_2_sos,
+                                 _lowpass_sos, sosfilt)
+
+
+def _lowpass_cheby_2_design(freq, df, maxorder=12):
+    return _lowpass_cheby_2_sos(freq, df, maxorder)[0]
+
+
+# dictionary to map filter types to functions designing the second-order
+# sections of the filter
+FILTER_DESIGN_FUNCTIONS = {
+    'bandpass': _bandpass_sos,
+    'bandstop': _bandstop_sos,
+    'lowpass': _lowpass_sos,
+    'highpass': _highpass_sos,
+    'lowpass_cheby_2': _lowpass_cheby_2_design,
+}
+
+
+def _header(stats):
+    """
+    Returns the header values of a Stats object that can be shared between
+    traces, i.e. without the values derived from the data and without the
+    processing list.
+    """
+    return dict((key, value) for key, value in stats.items()
+                if key not in ('npts', 'endtime', 'delta', 'processing'))
+
+
+class _FilterStep(object):
+    """
+    Causal IIR filter carrying its state from chunk to chunk.
+    """
+    records_info = False
+
+    def __init__(self, type, **options):
+        type = type.lower()
+        if type not in FILTER_DESIGN_FUNCTIONS:
+            msg = "Filter type '%s' can not be used in a pipeline." % type
+            raise ValueError(msg)
+        if options.pop('zerophase', False):
+            msg = ("Zero-phase filtering needs the whole trace and can not "
+                   "be done in chunks.")
+            raise ValueError(msg)
+        self.design = FILTER_DESIGN_FUNCTIONS[type]
+        self.options = options
+        self.sos = None
+        self.zi = None
+
+    def process(self, tr):
+        if self.sos is None:
+            self.sos = self.design(df=tr.stats.sampling_rate, **self.options)
+            self.zi = np.zeros((self.sos.shape[0], 2))
+        tr.data, self.zi = sosfilt(self.sos, tr.data, zi=self.zi)
+        return tr
+
+    def flush(self):
+        return None
+
+
+class _DecimateStep(object):
+    """
+    Decimation like :meth:`~obspy.core.trace.Trace.decimate` that keeps the
+    state of the anti-alias filter and the decimation phase from chunk to
+    chunk.
+    """
+    records_info = False
+
+    def __init__(self, factor, no_filter=False):
+        if not no_filter and factor > 16:
+            msg = "Automatic filter design is unstable for decimation " + \
+                  "factors above 16. Manual decimation is necessary."
+            raise ArithmeticError(msg)
+        self.factor = factor
+        self.no_filter = no_filter
+        self.filter = None
+        # index of the first sample of the next chunk to keep
+        self.offset = 0
+
+    def process(self, tr):
+        if not self.no_filter:
+            if self.filter is None:
+                freq = tr.stats.sampling_rate * 0.5 / float(self.factor)
+                self.filter = _FilterStep('lowpass_cheby_2', freq=freq,
+                                          maxorder=12)
+            tr = self.filter.process(tr)
+        npts = len(tr.data)
+        offset = self.offset
+        self.offset = (offset - npts) % self.factor
+        if offset >= npts:
+            return None
+        starttime = tr.stats.starttime + offset * tr.stats.delta
+        tr.data = np.array(tr.data[offset::self.factor])
+        tr.stats.sampling_rate = tr.stats.sampling_rate / float(self.factor)
+        tr.stats.starttime = starttime
+        return tr
+
+    def flush(self):
+        return None
+
+
+class _RemoveResponseStep(object):
+    """
+    Instrument correction of overlapping windows.
+
+    Every window contains up to ``overlap`` seconds of data before and after
+    the samples put out, the taper only affects these margins.
+    """
+    records_info = False
+
+    def __init__(self, overlap, **options):
+        for key in ('taper_fraction', 'plot', 'fig'):
+            if key in options:
+                msg = "Option '%s' can not be used in a pipeline." % key
+                raise ValueError(msg)
+        self.overlap = overlap
+        self.options = options
+        self.npts_overlap = None
+        self.data = None
+        self.starttime = None
+        self.header = None
+        self.processing = None
+        # number of samples at the start of the buffer that were already put
+        # out and are only kept as left margin
+        self.nleft = 0
+
+    def process(self, tr):
+        if self.data is None:
+            self.npts_overlap = int(round(self.overlap *
+                                          tr.stats.sampling_rate))
+            self.data = tr.data
+            self.starttime = tr.stats.starttime
+        else:
+            self.data = np.concatenate([self.data, tr.data])
+        self.header = _header(tr.stats)
+        self.processing = list(tr.stats.get('processing', []))
+        end = len(self.data) - self.npts_overlap
+        if end <= self.nleft:
+            return None
+        return self._deconvolve(end)
+
+    def flush(self):
+        if self.data is None or len(self.data) <= self.nleft:
+            return None
+        return self._deconvolve(len(self.data))
+
+    def _deconvolve(self, end):
+        header = dict(self.header, starttime=self.starttime)
+        window = Trace(data=self.data, header=header)
+        delta = window.stats.delta
+        fraction = min(1.0, 2.0 * self.npts_overlap / len(self.data))
+        window.remove_response(taper_fraction=fraction, **self.options)
+        header['starttime'] = self.starttime + self.nleft * delta
+        tr = Trace(data=window.data[self.nleft:end], header=header)
+        tr.stats.processing = list(self.processing)
+        # keep the left margin of the next window
+        keep = max(end - self.npts_overlap, 0)
+        self.data = self.data[keep:]
+        self.starttime += keep * delta
+        self.nleft = end - keep
+        return tr
+
+
+class _RemoveSensitivityStep(object):
+    """
+    :meth:`~obspy.core.trace.Trace.remove_sensitivity` of every chunk.
+    """
+    # the Trace method records the processing information itself
+    records_info = True
+
+    def __init__(self, **options):
+        self.options = options
+
+    def process(self, tr):
+        tr.remove_sensitivity(**self.options)
+        return tr
+
+    def flush(self):
+        return None
+
+
+class _CallableStep(object):
+    """
+    Applies a function to every chunk.
+    """
+    records_info = False
+
+    def __init__(self, function, **options):
+        self.function = function
+        self.options = options
+
+    def process(self, tr):
+        result = self.function(tr, **self.options)
+        return tr if result is None else result
+
+    def flush(self):
+        return None
+
+
+# dictionary to map process names to the classes implementing them
+PIPELINE_STEPS = {
+    'filter': _FilterStep,
+    'decimate': _DecimateStep,
+    'remove_response': _RemoveResponseStep,
+    'remove_sensitivity': _RemoveSensitivityStep,
+}
+
+
+class Pipeline(object):
+    """
+    Processing of long continuous data in chunks.
+
+    Filtering, decimation and instrument correction of long time series
+    normally need the whole trace in memory, cutting the data into pieces
+    instead leads to artifacts at the edges of every piece. A Pipeline
+    processes the data chunk by chunk and carries everything that is needed
+    across chunk boundaries: the state of IIR filters, the phase of the
+    decimation and the data needed for the overlapping windows of the
+    instrument correction. Memory usage is thus bounded by the chunk size
+    while the results equal those of processing the whole trace.
+
+    Chunks are :class:`~obspy.core.trace.Trace` objects of any number of
+    channels, e.g. from :func:`chunks_from_client`, :func:`chunks_from_files`
+    or :func:`~obspy.io.mseed.util.iter_traces`. Each channel (SEED id) is
+    processed separately, the chunks of each channel have to be in
+    chronological order. Samples overlapping with the previous chunk of a
+    channel are discarded, e.g. the duplicated sample at the boundary of two
+    requests from a client. At a gap the processing of the channel starts
+    anew with a warning.
+
+    The chunk traces are modified in place.
+
+    .. rubric:: Example
+
+    >>> from obspy import read
+    >>> tr = read()[0]
+    >>> chunks = tr.copy() / 3  # list of three consecutive traces
+    >>> pipeline = Pipeline()
+    >>> pipeline.add_step('filter', type='highpass', freq=1.0)
+    1
+    >>> pipeline.add_step('decimate', factor=4)
+    2
+    >>> processed = list(pipeline.process(chunks))
+    >>> for tr_ in processed:
+    ...     print(tr_)  # doctest: +ELLIPSIS
+    BW.RJOB..EHZ | 2009-08-24T00:20:03.000000Z - ... | 25.0 Hz, 250 samples
+    BW.RJOB..EHZ | 2009-08-24T00:20:13.000000Z - ... | 25.0 Hz, 250 samples
+    BW.RJOB..EHZ | 2009-08-24T00:20:23.000000Z - ... | 25.0 Hz, 250 samples
+
+    The result equals processing the whole trace at once:
+
+    >>> tr.filter('highpass', freq=1.0).decimate(4)  # doctest: +ELLIPSIS
+    <...Trace object at 0x...>
+    >>> np.allclose(np.concatenate([tr_.data for tr_ in processed]), tr.data)
+    True
+    """
+    def __init__(self):
+        # list of (process, options) tuples
+        self.steps = []
+        # steps with the processing state of every SEED id
+        self._states = {}
+        # expected start time and sampling rate of the next chunk of every
+        # SEED id
+        self._next = {}
+
+    def add_step(self, process, **options):
+        """
+        Adds a processing step to the end of the pipeline.
+
+        :type process: str or callable
+        :param process: Name of the processing step or a function.
+            Supported names are:
+
+            ``'filter'``
+                Causal filtering with
+                :meth:`~obspy.core.trace.Trace.filter`, the filter ``type``
+                must be one of ``'bandpass'``, ``'bandstop'``,
+                ``'lowpass'``, ``'highpass'`` or ``'lowpass_cheby_2'``.
+                Zero-phase filters are not possible.
+            ``'decimate'``
+                Like :meth:`~obspy.core.trace.Trace.decimate` with
+                options ``factor`` and ``no_filter``.
+            ``'remove_response'``
+                Like :meth:`~obspy.core.trace.Trace.remove_response`
+                in overlapping windows. The option ``overlap`` (in seconds)
+                is required, each window contains ``overlap`` seconds of
+                data before and after the samples put out which are tapered
+                instead of the samples themselves. Choose it long enough to
+                cover the impulse response of the instrument correction
+                including the pre-filter, e.g. several periods of the lowest
+                frequency of ``pre_filt``. The output is delayed by
+                ``overlap`` seconds. Note that ``zero_mean`` removes the
+                mean of each window, better remove a trend by a highpass
+                filter beforehand.
+            ``'remove_sensitivity'``
+                :meth:`~obspy.core.trace.Trace.remove_sensitivity`.
+
+            A function is called with each chunk and the options, it can
+            return a new Trace or modify the chunk in place and return
+            ``None``. Such functions must not depend on previous chunks.
+        :param options: Options of the processing step.
+        :rtype: int
+        :return: Number of steps in the pipeline.
+        """
+        if callable(process):
+            _CallableStep(process, **options)
+        else:
+            process = process.lower()
+            if process not in PIPELINE_STEPS:
+                msg = "Unsupported pipeline step '%s'." % process
+                raise NotImplementedError(msg)
+            # raises for invalid options
+            PIPELINE_STEPS[process](**options)
+        self.steps.append((process, options))
+        return len(self.steps)
+
+    def _create_steps(self):
+        """
+        Returns new instances of all steps together with their processing
+        information.
+        """
+        steps = []
+        for process, options in self.steps:
+            if callable(process):
+                step = _CallableStep(process, **options)
+            else:
+                step = PIPELINE_STEPS[process](**options)
+            info = None
+            if not step.records_info and not callable(process):
+                info = "pipeline:%s:%s" % (process, options)
+            steps.append((step, info))
+        return steps
+
+    @staticmethod
+    def _run_steps(steps, tr):
+        for step, info in steps:
+            tr = step.process(tr)
+            if tr is None or not len(tr.data):
+                return None
+            if info is not None:
+                tr._internal_add_processing_info(info)
+        return tr
+
+    def _flush(self, seed_id):
+        """
+        Returns the remaining data of all steps of a SEED id and forgets its
+        processing state.
+        """
+        steps = self._states.pop(seed_id, [])
+        self._next.pop(seed_id, None)
+        traces = []
+        for i, (step, info) in enumerate(steps):
+            tr = step.flush()
+            if tr is None:
+                continue
+            if info is not None:
+                tr._internal_add_processing_info(info)
+            tr = self._run_steps(steps[i + 1:], tr)
+            if tr is not None:
+                traces.append(tr)
+        return traces
+
+    def _check_continuity(self, tr):
+        """
+        Returns the part of the chunk following the previous chunk of the
+        same SEED id, the remaining data of the previous chunks if the new
+        chunk does not continue them and whether there is anything to
+        process.
+        """
+        seed_id = tr.id
+        flushed = []
+        if seed_id in self._next:
+            next_start, sampling_rate = self._next[seed_id]
+            if sampling_rate != tr.stats.sampling_rate:
+                msg = ("Sampling rate of %s changed, restarting "
+                       "processing.") % seed_id
+                warnings.warn(msg)
+                flushed = self._flush(seed_id)
+            else:
+                shift = (tr.stats.starttime - next_start) * sampling_rate
+                if shift > 0.5:
+                    msg = ("Gap of %.3f s in %s at %s, restarting "
+                           "processing.") % (shift / sampling_rate, seed_id,
+                                             next_start)
+                    warnings.warn(msg)
+                    flushed = self._flush(seed_id)
+                elif shift < -0.5:
+                    # drop data already processed
+                    npts = int(round(-shift))
+                    if npts >= len(tr.data):
+                        return flushed, False
+                    tr.data = tr.data[npts:]
+                    tr.stats.starttime += npts * tr.stats.delta
+        if not len(tr.data):
+            return flushed, False
+        self._next[seed_id] = (tr.stats.endtime + tr.stats.delta,
+                               tr.stats.sampling_rate)
+        return flushed, True
+
+    def process(self, chunks):
+        """
+        Processes chunks of data.
+
+        :type chunks: iterable of :class:`~obspy.core.trace.Trace`
+        :param chunks: Input data, e.g. a generator or a list of traces or a
+            :class:`~obspy.core.stream.Stream`.
+        :return: Generator of processed :class:`~obspy.core.trace.Trace`
+            objects. A chunk does not necessarily give exactly one processed
+            Trace, e.g. the output of an instrument correction is delayed.
+            After the last chunk the remaining data of all steps are put
+            out.
+        """
+        for tr in chunks:
+            flushed, has_data = self._check_continuity(tr)
+            for tr_ in flushed:
+                yield tr_
+            if not has_data:
+                continue
+            if tr.id not in self._states:
+                self._states[tr.id] = self._create_steps()
+            tr = self._run_steps(self._states[tr.id], tr)
+            if tr is not None:
+                yield tr
+        for seed_id in sorted(self._states):
+            for tr in self._flush(seed_id):
+                yield tr
+
+    def run(self, chunks, filename, format='MSEED', **kwargs):
+        """
+        Processes chunks of data and writes the results to a file.
+
+        The processed traces are written one after another while the input
+        is processed so the format has to allow appending data, e.g.
+        MiniSEED.
+
+        :type chunks: iterable of :class:`~obspy.core.trace.Trace`
+        :param chunks: Input data, see :meth:`process`.
+        :type filename: str or file-like object
+        :param filename: Name of the output file or file-like object.
+        :type format: str, optional
+        :param format: Output format, see
+            :meth:`~obspy.core.stream.Stream.write`.
+        :param kwargs: Additional keyword arguments passed to the writer.
+        :rtype: int
+        :return: Number of traces written.
+        """
+        is_file_name = not hasattr(filename, 'write')
+        fh = open(filename, 'wb') if is_file_name else filename
+        count = 0
+        try:
+            for tr in self.process(chunks):
+                tr.write(fh, format=format, **kwargs)
+                count += 1
+        finally:
+            if is_file_name:
+                fh.close()
+        return count
+
+
+def chunks_from_client(client, network, station, location, channel,
+                       starttime, endtime, chunk_length=86400, **kwargs):
+    """
+    Yields the data of a client in chunks of limited length.
+
+    :type client: e.g. :class:`obspy.clients.filesystem.sds.Client`
+    :param client: Any client with a ``get_waveforms()`` method.
+    :param network: Network code, see ``get_waveforms()``.
+    :param station: Station code, see ``get_waveforms()``.
+    :param location: Location code, see ``get_waveforms()``.
+    :param channel: Channel code, see ``get_waveforms()``.
+    :type starttime: :class:`~obspy.core.utcdatetime.UTCDateTime`
+    :param starttime: Start of the requested time span.
+    :type endtime: :class:`~obspy.core.utcdatetime.UTCDateTime`
+    :param endtime: End of the requested time span.
+    :type chunk_length: float, optional
+    :param chunk_length: Length of the time span of each request in seconds.
+    :param kwargs: Additional keyword arguments passed to
+        ``get_waveforms()``.
+    :return: Generator of :class:`~obspy.core.trace.Trace` objects.
+    """
+    t = starttime
+    while t < endtime:
+        t2 = min(t + chunk_length, endtime)
+        st = client.get_waveforms(network, station, location, channel, t,
+                                  t2, **kwargs)
+        st.sort()
+        for tr in st:
+            yield tr
+        t = t2
+
+
+def chunks_from_files(filenames, **kwargs):
+    """
+    Yields the data of a list of files one file after another.
+
+    :type filenames: iterable of str
+    :param filenames: File names in chronological order, e.g. the daily
+        files of a channel.
+    :param kwargs: Additional keyword arguments passed to
+        :func:`~obspy.core.stream.read`.
+    :return: Generator of :class:`~obspy.core.trace.Trace` objects.
+    """
+    for filename in filenames:
+        st = read(filename, **kwargs)
+        st.sort()
+        for tr in st:
+            yield tr
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod(exclude_empty=True)
@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+"""
+The obspy.realtime.pipeline test suite.
+"""
+from __future__ import (absolute_import, division, print_function,
+                        unicode_literals)
+from future.builtins import *  # NOQA
+
+import io
+import unittest
+import warnings
+
+import numpy as np
+
+from obspy import Stream, read
+from obspy.realtime.pipeline import Pipeline, chunks_from_files
+from obspy.core.util import NamedTemporaryFile
+
+
+class PipelineTestCase(unittest.TestCase):
+
+    def setUp(self):
+        # 300 s of data with a response
+        self.tr = read()[0]
+        self.tr.data = np.tile(self.tr.data, 10)
+
+    def _chunks(self, tr=None, number=7):
+        return (tr or self.tr).copy() / number
+
+    def _process(self, pipeline, chunks):
+        st = Stream(list(pipeline.process(chunks)))
+        # output of consecutive chunks is contiguous
+        for tr1, tr2 in zip(st[:-1], st[1:]):
+            self.assertEqual(tr1.stats.endtime + tr1.stats.delta,
+                             tr2.stats.starttime)
+        return st
+
+    def test_filter(self):
+        """
+        Chunked filtering equals filtering the whole trace.
+        """
+        for type, options in (
+                ('bandpass', dict(freqmin=1.0, freqmax=10.0, corners=2)),
+                ('bandstop', dict(freqmin=5.0, freqmax=10.0)),
+                ('lowpass', dict(freq=2.0)),
+                ('highpass', dict(freq=1.0, corners=6)),
+                ('lowpass_cheby_2', dict(freq=20.0))):
+            pipeline = Pipeline()
+            pipeline.add_step('filter', type=type, **options)
+            st = self._process(pipeline, self._chunks())
+            self.assertEqual(len(st), 7)
+            expected = self.tr.copy().filter(type, **options)
+            self.assertEqual(st[0].stats.starttime, expected.stats.starttime)
+            np.testing.assert_allclose(
+                np.concatenate([tr.data for tr in st]), expected.data,
+                rtol=1e-10, atol=1e-10 * np.abs(expected.data).max())
+        self.assertTrue(
+            st[0].stats.processing[-1].startswith("pipeline:filter:"))
+        pipeline = Pipeline()
+        self.assertRaises(ValueError, pipeline.add_step, 'filter',
+                          type='lowpass', freq=1.0, zerophase=True)
+        self.assertRaises(ValueError, pipeline.add_step, 'filter',
+                          type='envelope')
+        self.assertRaises(NotImplementedError, pipeline.add_step, 'detrend')
+        self.assertEqual(pipeline.steps, [])
+
+    def test_decimate(self):
+        """
+        Chunked decimation equals decimating the whole trace, also if the
+        length of the chunks is no multiple of the decimation factor.
+        """
+        for factor, no_filter in ((4, False), (7, False), (3, True)):
+            for number in (1, 7, 13):
+                pipeline = Pipeline()
+                pipeline.add_step('decimate', factor=factor,
+                                  no_filter=no_filter)
+                st = self._process(pipeline, self._chunks(number=number))
+                expected = self.tr.copy().decimate(factor, no_filter=no_filter,
+                                                   strict_length=False)
+                self.assertEqual(st[0].stats.sampling_rate,
+                                 expected.stats.sampling_rate)
+                self.assertEqual(st[0].stats.starttime,
+                                 expected.stats.starttime)
+                np.testing.assert_allclose(
+                    np.concatenate([tr.data for tr in st]), expected.data,
+                    rtol=1e-10, atol=1e-10 * np.abs(expected.data).max())
+        # chunks shorter than the decimation factor
+        chunks = self._chunks(self.tr.slice(endtime=self.tr.stats.starttime +
+                                            0.99), number=25)
+        pipeline = Pipeline()
+        pipeline.add_step('decimate', factor=8, no_filter=True)
+        st = self._process(pipeline, chunks)
+        np.testing.assert_array_equal(
+            np.concatenate([tr.data for tr in st]), self.tr.data[:100:8])
+        self.assertRaises(ArithmeticError, pipeline.add_step, 'decimate',
+                          factor=17)
+
+    def test_remove_response(self):
+        """
+        Instrument correction in overlapping windows equals the correction
+        of the whole trace with a taper of the same length.
+        """
+        pre_filt = (0.5, 1.0, 40.0, 45.0)
+        pipeline = Pipeline()
+        pipeline.add_step('filter', type='highpass', freq=0.2)
+        pipeline.add_step('remove_response', overlap=4.0, pre_filt=pre_filt)
+        pipeline.add_step('decimate', factor=2)
+        st = self._process(pipeline, self._chunks())
+        expected = self.tr.copy().filter('highpass', freq=0.2)
+        expected.remove_response(pre_filt=pre_filt,
+                                 taper_fraction=2 * 400 / 30000.0)
+        expected.decimate(2)
+        self.assertEqual(st[0].stats.starttime, expected.stats.starttime)
+        data = np.concatenate([tr.data for tr in st])
+        self.assertEqual(len(data), len(expected.data))
+        # differences due to the different tapers are small
+        np.testing.assert_allclose(
+            data[200:-200], expected.data[200:-200],
+            atol=2e-3 * np.abs(expected.data).max())
+        self.assertEqual(len(st[0].stats.processing), 4)
+        self.assertRaises(ValueError, pipeline.add_step, 'remove_response',
+                          overlap=4.0, taper_fraction=0.1)
+        self.assertRaises(TypeError, pipeline.add_step, 'remove_response')
+
+    def test_gaps_and_overlaps(self):
+        """
+        Overlapping samples are dropped and gaps restart the processing.
+        """
+        pipeline = Pipeline()
+        pipeline.add_step('filter', type='lowpass', freq=5.0)
+        t = self.tr.stats.starttime
+        chunks = [self.tr.slice(t, t + 10), self.tr.slice(t + 10, t + 20),
+                  self.tr.slice(t + 15, t + 30)]
+        st = self._process(pipeline, chunks)
+        expected = self.tr.slice(t, t + 30).filter('lowpass', freq=5.0)
+        np.testing.assert_allclose(
+            np.concatenate([tr.data for tr in st]), expected.data)
+        # the chunk inside data already processed gives no output
+        chunks = [self.tr.slice(t, t + 10), self.tr.slice(t + 2, t + 8)]
+        self.assertEqual(len(list(pipeline.process(chunks))), 1)
+        # gap
+        chunks = [self.tr.slice(t, t + 10), self.tr.slice(t + 20, t + 30)]
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('always')
+            st = Stream(list(pipeline.process(chunks)))
+        self.assertEqual(len(w), 1)
+        self.assertIn('Gap of 9.990 s', str(w[0].message))
+        # processing starts anew after the gap
+        expected = self.tr.slice(t + 20, t + 30).filter('lowpass', freq=5.0)
+        np.testing.assert_allclose(st[1].data, expected.data)
+
+    def test_multiple_channels(self):
+        """
+        Interleaved chunks of several channels are processed separately.
+        """
+        st = read()
+        for tr in st:
+            tr.data = np.tile(tr.data, 3)
+        chunks = []
+        for parts in zip(*[tr / 4 for tr in st]):
+            chunks.extend(parts)
+        pipeline = Pipeline()
+        pipeline.add_step('filter', type='highpass', freq=2.0)
+        pipeline.add_step('remove_response', overlap=2.0)
+        got = list(pipeline.process(chunks))
+        self.assertEqual(len(got), 15)
+        for tr in st:
+            expected = tr.copy().filter('highpass', freq=2.0)
+            expected.remove_response(taper_fraction=2 * 200. / 9000)
+            data = np.concatenate([tr_.data for tr_ in got if
+                                   tr_.id == tr.id])
+            np.testing.assert_allclose(
+                data[200:-200], expected.data[200:-200],
+                atol=2e-3 * np.abs(expected.data).max())
+
+    def test_callable_and_remove_sensitivity(self):
+        """
+        Functions and stateless steps are applied to every chunk.
+        """
+        def scale(tr, factor):
+            tr.data = tr.data * factor
+
+        pipeline = Pipeline()
+        pipeline.add_step(scale, factor=2.0)
+        pipeline.add_step('remove_sensitivity')
+        st = self._process(pipeline, self._chunks())
+        expected = self.tr.copy()
+        expected.data = expected.data * 2.0
+        expected.remove_sensitivity()
+        np.testing.assert_allclose(
+            np.concatenate([tr.data for tr in st]), expected.data)
+        self.assertIn('remove_sensitivity', st[0].stats.processing[-1])
+
+    def test_run_and_chunks_from_files(self):
+        """
+        Writing the results to a file while processing files one by one.
+        """
+        pipeline = Pipeline()
+        pipeline.add_step('filter', type='bandpass', freqmin=1.0,
+                          freqmax=5.0)
+        expected = self.tr.copy().filter('bandpass', freqmin=1.0, freqmax=5.0)
+        with NamedTemporaryFile() as tf1, NamedTemporaryFile() as tf2:
+            chunks = self._chunks(number=2)
+            chunks[0].write(tf1.name, format='MSEED')
+            chunks[1].write(tf2.name, format='MSEED')
+            buf = io.BytesIO()
+            count = pipeline.run(chunks_from_files([tf1.name, tf2.name]),
+                                 buf, format='MSEED')
+        self.assertEqual(count, 2)
+        buf.seek(0)
+        st = read(buf)
+        st.merge()
+        self.assertEqual(len(st), 1)
+        np.testing.assert_allclose(st[0].data, expected.data)
+
+
+def suite():
+    return unittest.makeSuite(PipelineTestCase, 'test')
+
+
+if __name__ == '__main__':
+    unittest.main(defaultTest='suite')
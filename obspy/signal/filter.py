@@ -21,12 +21,13 @@ from __future__ import (absolute_import, division, print_function,
                         unicode_literals)
 from future.builtins import *  # NOQA
 
+import threading
 import warnings
+from collections import OrderedDict
 
 import numpy as np
 from scipy.fftpack import hilbert
-from scipy.signal import (cheb2ord, cheby2, convolve, get_window, iirfilter,
-                          remez)
+from scipy.signal import cheb2ord, cheby2, get_window, iirfilter, remez
 
 try:
     from scipy.signal import sosfilt
@@ -35,8 +36,59 @@ except ImportError:
     from ._sosfilt import _sosfilt as sosfilt
     from ._sosfilt import _zpk2sos as zpk2sos
 
+from obspy.signal.util import _convolve_overlap_save, convolve_overlap_save
 
-def bandpass(data, freqmin, freqmax, df, corners=4, zerophase=False):
+
+# maximal number of designed filters kept in the cache
+SOS_CACHE_SIZE = 128
+_SOS_CACHE = OrderedDict()
+_SOS_CACHE_LOCK = threading.Lock()
+
+
+def _get_cached_design(key, design, *args):
+    """
+    Returns the result of ``design(*args)`` from a least recently used cache
+    of at most ``SOS_CACHE_SIZE`` filter designs.
+
+    Arrays are returned as copies, so callers can not modify the cached
+    designs.
+    """
+    with _SOS_CACHE_LOCK:
+        try:
+            value = _SOS_CACHE.pop(key)
+        except KeyError:
+            value = None
+        else:
+            _SOS_CACHE[key] = value
+    if value is None:
+        value = design(*args)
+        with _SOS_CACHE_LOCK:
+            _SOS_CACHE[key] = value
+            while len(_SOS_CACHE) > SOS_CACHE_SIZE:
+                _SOS_CACHE.popitem(last=False)
+    if isinstance(value, tuple):
+        return tuple(v.copy() if isinstance(v, np.ndarray) else v
+                     for v in value)
+    return value.copy()
+
+
+def _iirfilter_sos(corners, wn, btype):
+    """
+    Designs a Butterworth filter as second-order sections, results are
+    cached.
+    """
+    key = ('butter', btype, corners, wn)
+    return _get_cached_design(key, _design_iirfilter_sos, corners, wn, btype)
+
+
+def _design_iirfilter_sos(corners, wn, btype):
+    z, p, k = iirfilter(corners, wn, btype=btype, ftype='butter',
+                        output='zpk')
+    return zpk2sos(z, p, k)
+
+
+def bandpass(data, freqmin, freqmax, df, corners=4, zerophase=False,
+             axis=-1):
     """
     Butterworth-Bandpass Filter.
 
@@ -46,7 +98,7 @@ def bandpass(data, freqmin, freqmax, df, corners=4, zerophase=False):
     and :func:`scipy.signal.sosfilt` (for applying the filter).
 
     :type data: numpy.ndarray
-    :param data: Data to filter.
+    :param data: Data to filter, can have more than one dimension.
     :param freqmin: Pass band low corner frequency.
     :param freqmax: Pass band high corner frequency.
     :param df: Sampling rate in Hz.
@@ -54,8 +106,22 @@ def bandpass(data, freqmin, freqmax, df, corners=4, zerophase=False):
     :param zerophase: If True, apply filter once forwards and once backwards.
         This results in twice the filter order but zero phase shift in
         the resulting filtered trace.
+    :type axis: int
+    :param axis: Axis of ``data`` along which to filter, all other axes are
+        filtered at once, e.g. the rows of a 2-D array with ``axis=-1``.
     :return: Filtered data.
     """
+    sos = _bandpass_sos(freqmin, freqmax, df, corners)
+    return _apply_sos(sos, data, zerophase, axis)
+
+
+def _bandpass_sos(freqmin, freqmax, df, corners=4):
+    """
+    Designs the second-order sections of :func:`bandpass`.
+
+    Falls back to :func:`highpass` (with a warning) if ``freqmax`` is at or
+    above Nyquist.
+    """
     fe = 0.5 * df
     low = freqmin / fe
     high = freqmax / fe
@@ -65,22 +131,15 @@ def bandpass(data, freqmin, freqmax, df, corners=4, zerophase=False):
                "above Nyquist ({}). Applying a high-pass instead.").format(
             freqmax, fe)
         warnings.warn(msg)
-        return highpass(data, freq=freqmin, df=df, corners=corners,
-                        zerophase=zerophase)
+        return _highpass_sos(freqmin, df, corners)
     if low > 1:
         msg = "Selected low corner frequency is above Nyquist."
         raise ValueError(msg)
-    z, p, k = iirfilter(corners, [low, high], btype='band',
-                        ftype='butter', output='zpk')
-    sos = zpk2sos(z, p, k)
-    if zerophase:
-        firstpass = sosfilt(sos, data)
-        return sosfilt(sos, firstpass[::-1])[::-1]
-    else:
-        return sosfilt(sos, data)
+    return _iirfilter_sos(corners, (low, high), 'band')
 
 
-def bandstop(data, freqmin, freqmax, df, corners=4, zerophase=False):
+def bandstop(data, freqmin, freqmax, df, corners=4, zerophase=False,
+             axis=-1):
     """
     Butterworth-Bandstop Filter.
 
@@ -90,7 +149,7 @@ def bandstop(data, freqmin, freqmax, df, corners=4, zerophase=False):
     and :func:`scipy.signal.sosfilt` (for applying the filter).
 
     :type data: numpy.ndarray
-    :param data: Data to filter.
+    :param data: Data to filter, can have more than one dimension.
     :param freqmin: Stop band low corner frequency.
     :param freqmax: Stop band high corner frequency.
     :param df: Sampling rate in Hz.
@@ -98,8 +157,19 @@ def bandstop(data, freqmin, freqmax, df, corners=4, zerophase=False):
     :param zerophase: If True, apply filter once forwards and once backwards.
         This results in twice the number of corners but zero phase shift in
         the resulting filtered trace.
+    :type axis: int
+    :param axis: Axis of ``data`` along which to filter, all other axes are
+        filtered at once, e.g. the rows of a 2-D array with ``axis=-1``.
     :return: Filtered data.
     """
+    sos = _bandstop_sos(freqmin, freqmax, df, corners)
+    return _apply_sos(sos, data, zerophase, axis)
+
+
+def _bandstop_sos(freqmin, freqmax, df, corners=4):
+    """
+    Designs the second-order sections of :func:`bandstop`.
+    """
     fe = 0.5 * df
     low = freqmin / fe
     high = freqmax / fe
@@ -112,17 +182,10 @@ def bandstop(data, freqmin, freqmax, df, corners=4, zerophase=False):
     if low > 1:
         msg = "Selected low corner frequency is above Nyquist."
         raise ValueError(msg)
-    z, p, k = iirfilter(corners, [low, high],
-                        btype='bandstop', ftype='butter', output='zpk')
-    sos = zpk2sos(z, p, k)
-    if zerophase:
-        firstpass = sosfilt(sos, data)
-        return sosfilt(sos, firstpass[::-1])[::-1]
-    else:
-        return sosfilt(sos, data)
+    return _iirfilter_sos(corners, (low, high), 'bandstop')
 
 
-def lowpass(data, freq, df, corners=4, zerophase=False):
+def lowpass(data, freq, df, corners=4, zerophase=False, axis=-1):
     """
     Butterworth-Lowpass Filter.
 
@@ -132,15 +195,26 @@ def lowpass(data, freq, df, corners=4, zerophase=False):
     and :func:`scipy.signal.sosfilt` (for applying the filter).
 
     :type data: numpy.ndarray
-    :param data: Data to filter.
+    :param data: Data to filter, can have more than one dimension.
     :param freq: Filter corner frequency.
     :param df: Sampling rate in Hz.
     :param corners: Filter corners / order.
     :param zerophase: If True, apply filter once forwards and once backwards.
         This results in twice the number of corners but zero phase shift in
         the resulting filtered trace.
+    :type axis: int
+    :param axis: Axis of ``data`` along which to filter, all other axes are
+        filtered at once, e.g. the rows of a 2-D array with ``axis=-1``.
     :return: Filtered data.
     """
+    sos = _lowpass_sos(freq, df, corners)
+    return _apply_sos(sos, data, zerophase, axis)
+
+
+def _lowpass_sos(freq, df, corners=4):
+    """
+    Designs the second-order sections of :func:`lowpass`.
+    """
     fe = 0.5 * df
     f = freq / fe
     # raise for some bad scenarios
@@ -149,17 +223,10 @@ def lowpass(data, freq, df, corners=4, zerophase=False):
         msg = "Selected corner frequency is above Nyquist. " + \
               "Setting Nyquist as high corner."
         warnings.warn(msg)
-    z, p, k = iirfilter(corners, f, btype='lowpass', ftype='butter',
-                        output='zpk')
-    sos = zpk2sos(z, p, k)
-    if zerophase:
-        firstpass = sosfilt(sos, data)
-        return sosfilt(sos, firstpass[::-1])[::-1]
-    else:
-        return sosfilt(sos, data)
+    return _iirfilter_sos(corners, f, 'lowpass')
 
 
-def highpass(data, freq, df, corners=4, zerophase=False):
+def highpass(data, freq, df, corners=4, zerophase=False, axis=-1):
     """
     Butterworth-Highpass Filter.
 
@@ -169,29 +236,49 @@ def highpass(data, freq, df, corners=4, zerophase=False):
     and :func:`scipy.signal.sosfilt` (for applying the filter).
 
     :type data: numpy.ndarray
-    :param data: Data to filter.
+    :param data: Data to filter, can have more than one dimension.
     :param freq: Filter corner frequency.
     :param df: Sampling rate in Hz.
     :param corners: Filter corners / order.
     :param zerophase: If True, apply filter once forwards and once backwards.
         This results in twice the number of corners but zero phase shift in
         the resulting filtered trace.
+    :type axis: int
+    :param axis: Axis of ``data`` along which to filter, all other axes are
+        filtered at once, e.g. the rows of a 2-D array with ``axis=-1``.
     :return: Filtered data.
     """
+    sos = _highpass_sos(freq, df, corners)
+    return _apply_sos(sos, data, zerophase, axis)
+
+
+def _highpass_sos(freq, df, corners=4):
+    """
+    Designs the second-order sections of :func:`highpass`.
+    """
     fe = 0.5 * df
     f = freq / fe
     # raise for some bad scenarios
     if f > 1:
         msg = "Selected corner frequency is above Nyquist."
         raise ValueError(msg)
-    z, p, k = iirfilter(corners, f, btype='highpass', ftype='butter',
-                        output='zpk')
-    sos = zpk2sos(z, p, k)
+    return _iirfilter_sos(corners, f, 'highpass')
+
+
+def _apply_sos(sos, data, zerophase=False, axis=-1):
+    """
+    Applies second-order sections to the data along an axis, optionally
+    forwards and backwards.
+    """
     if zerophase:
-        firstpass = sosfilt(sos, data)
-        return sosfilt(sos, firstpass[::-1])[::-1]
+        data = np.asarray(data)
+        reverse = [slice(None)] * data.ndim
+        reverse[axis] = slice(None, None, -1)
+        reverse = tuple(reverse)
+        firstpass = sosfilt(sos, data, axis=axis)
+        return sosfilt(sos, firstpass[reverse], axis=axis)[reverse]
     else:
-        return sosfilt(sos, data)
+        return sosfilt(sos, data, axis=axis)
 
 
 def envelope(data):
@@ -227,7 +314,8 @@ def remez_fir(data, freqmin, freqmax, df):
 
     Finite impulse response (FIR) filter whose transfer function minimizes
     the maximum error between the desired gain and the realized gain in the
-    specified bands using the Remez exchange algorithm.
+    specified bands using the Remez exchange algorithm. The data is convolved
+    with the filter by :func:`~obspy.signal.util.convolve_overlap_save`.
 
     .. versionadded:: 0.6.2
     """
@@ -282,7 +370,7 @@ def remez_fir(data, freqmin, freqmax, df):
     # bandpass between freqmin and freqmax
     filt = remez(50, np.array([0, flt, freqmin, freqmax, fut, df / 2 - 1]),
                  np.array([0, 1, 0]), Hz=df)
-    return convolve(filt, data)
+    return convolve_overlap_save(data, filt)
 
 
 def lowpass_fir(data, freq, df, winlen=2048):
@@ -301,6 +389,9 @@ def lowpass_fir(data, freq, df, winlen=2048):
         Default 2048
     :return: Filtered data.
 
+    The data is convolved with the filter by
+    :func:`~obspy.signal.util.convolve_overlap_save`.
+
     .. versionadded:: 0.6.2
     """
     # Source: Travis Oliphant
@@ -324,7 +415,10 @@ def lowpass_fir(data, freq, df, winlen=2048):
     beta = 11.7
     # beta implies Kaiser
     myh = np.fft.fftshift(h) * get_window(beta, winlen)
-    return convolve(abs(myh), data)[winlen / 2:-winlen / 2]
+    # full convolution without winlen // 2 samples at start and end
+    npts = len(data)
+    return _convolve_overlap_save(data, abs(myh), winlen // 2,
+                                  npts + winlen - 1 - winlen // 2)
 
 
 def integer_decimation(data, decimation_factor):
@@ -351,7 +445,7 @@ def integer_decimation(data, decimation_factor):
 
 
 def lowpass_cheby_2(data, freq, df, maxorder=12, ba=False,
-                    freq_passband=False):
+                    freq_passband=False, axis=-1):
     """
     Cheby2-Lowpass Filter
 
@@ -364,7 +458,7 @@ def lowpass_cheby_2(data, freq, df, maxorder=12, ba=False,
     values above the stop band frequency are lower than -96dB.
 
     :type data: numpy.ndarray
-    :param data: Data to filter.
+    :param data: Data to filter, can have more than one dimension.
     :param freq: The frequency above which signals are attenuated
         with 95 dB
     :param df: Sampling rate in Hz.
@@ -373,11 +467,26 @@ def lowpass_cheby_2(data, freq, df, maxorder=12, ba=False,
         of filtering
     :param freq_passband: If True return additionally to the filtered data,
         the iteratively determined pass band frequency
+    :type axis: int
+    :param axis: Axis of ``data`` along which to filter, all other axes are
+        filtered at once, e.g. the rows of a 2-D array with ``axis=-1``.
     :return: Filtered data.
     """
+    if ba:
+        order, wn, rs, _ = _lowpass_cheby_2_order(freq, df, maxorder)
+        return cheby2(order, rs, wn, btype='low', analog=0, output='ba')
+    sos, freq_pass = _lowpass_cheby_2_sos(freq, df, maxorder)
+    if freq_passband:
+        return sosfilt(sos, data, axis=axis), freq_pass
+    return sosfilt(sos, data, axis=axis)
+
+
+def _lowpass_cheby_2_order(freq, df, maxorder=12):
+    """
+    Iteratively determines order, natural frequency, stop band attenuation
+    and pass band frequency of the filter of :func:`lowpass_cheby_2`.
+    """
     nyquist = df * 0.5
-    # rp - maximum ripple of passband, rs - attenuation of stopband
-    rp, rs, order = 1, 96, 1e99
     ws = freq / nyquist  # stop band frequency
     wp = ws  # pass band frequency
     # raise for some bad scenarios
@@ -386,18 +495,36 @@ def lowpass_cheby_2(data, freq, df, maxorder=12, ba=False,
         msg = "Selected corner frequency is above Nyquist. " + \
               "Setting Nyquist as high corner."
         warnings.warn(msg)
+    order, wn, rs, wp = _get_cached_design(
+        ('cheby2_order', wp, ws, maxorder), _cheby_2_order, wp, ws, maxorder)
+    return order, wn, rs, wp * nyquist
+
+
+def _cheby_2_order(wp, ws, maxorder):
+    # rp - maximum ripple of passband, rs - attenuation of stopband
+    rp, rs, order = 1, 96, 1e99
     while True:
         if order <= maxorder:
             break
         wp = wp * 0.99
         order, wn = cheb2ord(wp, ws, rp, rs, analog=0)
-    if ba:
-        return cheby2(order, rs, wn, btype='low', analog=0, output='ba')
+    return order, wn, rs, wp
+
+
+def _lowpass_cheby_2_sos(freq, df, maxorder=12):
+    """
+    Designs the second-order sections of :func:`lowpass_cheby_2` and returns
+    them together with the pass band frequency.
+    """
+    order, wn, rs, freq_pass = _lowpass_cheby_2_order(freq, df, maxorder)
+    sos = _get_cached_design(('cheby2', order, rs, wn), _design_cheby_2_sos,
+                             order, rs, wn)
+    return sos, freq_pass
+
+
+def _design_cheby_2_sos(order, rs, wn):
     z, p, k = cheby2(order, rs, wn, btype='low', analog=0, output='zpk')
-    sos = zpk2sos(z, p, k)
-    if freq_passband:
-        return sosfilt(sos, data), wp * nyquist
-    return sosfilt(sos, data)
+    return zpk2sos(z, p, k)
 
 
 if __name__ == '__main__':
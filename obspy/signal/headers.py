@@ -8,6 +8,7 @@ from future.builtins import *  # NOQA
 from future.utils import native_str
 
 import ctypes as C
+import threading
 
 import numpy as np
 
@@ -18,6 +19,9 @@ from obspy.core.util.libnames import _load_cdll
 clibsignal = _load_cdll("signal")
 # Import shared libevresp
 clibevresp = _load_cdll("evresp")
+# evalresp uses global state (e.g. the current file name), so only one
+# thread at a time may call into it
+evresp_lock = threading.RLock()
 
 clibsignal.calcSteer.argtypes = [
     C.c_int, C.c_int, C.c_int, C.c_int, C.c_int, C.c_float,
@@ -13,6 +13,8 @@ from __future__ import (absolute_import, division, print_function,
                         unicode_literals)
 from future.builtins import *  # NOQA
 
+from fractions import Fraction
+
 import numpy as np
 import scipy.interpolate
 
@@ -442,6 +444,156 @@ def plot_lanczos_windows(a, filename=None):
         plt.close()
 
 
+# maximal numerator and denominator of the ratio of sampling rates for
+# polyphase resampling
+POLYPHASE_MAX_FACTOR = 1000
+# maximal number of cached polyphase filters
+POLYPHASE_CACHE_SIZE = 64
+_POLYPHASE_FILTER_CACHE = {}
+
+
+def get_rational_factors(old_sampling_rate, new_sampling_rate,
+                         max_factor=POLYPHASE_MAX_FACTOR):
+    """
+    Returns the smallest integer up- and downsampling factors changing the
+    sampling rate from ``old_sampling_rate`` to ``new_sampling_rate``.
+
+    :type old_sampling_rate: float
+    :param old_sampling_rate: Current sampling rate.
+    :type new_sampling_rate: float
+    :param new_sampling_rate: Desired sampling rate.
+    :type max_factor: int
+    :param max_factor: Maximal upsampling and downsampling factor.
+    :rtype: tuple of two ints
+    :return: Upsampling factor and downsampling factor.
+
+    >>> get_rational_factors(100.0, 40.0)
+    (2, 5)
+    >>> get_rational_factors(200.0, 250.0)
+    (5, 4)
+    """
+    if old_sampling_rate <= 0 or new_sampling_rate <= 0:
+        raise ValueError("Sampling rates must be positive.")
+    ratio = float(new_sampling_rate) / float(old_sampling_rate)
+    fraction = Fraction(ratio).limit_denominator(max_factor)
+    up, down = fraction.numerator, fraction.denominator
+    if up > max_factor or \
+            abs(up / down * old_sampling_rate - new_sampling_rate) > \
+            1e-9 * new_sampling_rate:
+        msg = ("The ratio of the sampling rates %s and %s can not be "
+               "expressed by integer factors of at most %d.") % (
+            old_sampling_rate, new_sampling_rate, max_factor)
+        raise ValueError(msg)
+    return up, down
+
+
+def _get_polyphase_filter(up, down, window):
+    """
+    Returns the anti-aliasing FIR filter for upsampling by ``up`` and
+    downsampling by ``down`` and the number of output samples to skip for
+    the filter delay.
+
+    The filter is designed like in :func:`scipy.signal.resample_poly` and
+    cached for every ratio.
+    """
+    key = (up, down, window)
+    try:
+        return _POLYPHASE_FILTER_CACHE[key]
+    except KeyError:
+        pass
+    from scipy.signal import firwin
+    max_rate = max(up, down)
+    half_len = 10 * max_rate
+    h = firwin(2 * half_len + 1, 1.0 / max_rate, window=window) * up
+    # pad the filter at the front so that its delay is a multiple of down
+    n_pre_pad = down - half_len % down
+    h = np.concatenate([np.zeros(n_pre_pad), h])
+    n_pre_remove = (half_len + n_pre_pad) // down
+    if len(_POLYPHASE_FILTER_CACHE) >= POLYPHASE_CACHE_SIZE:
+        _POLYPHASE_FILTER_CACHE.clear()
+    _POLYPHASE_FILTER_CACHE[key] = (h, n_pre_remove)
+    return h, n_pre_remove
+
+
+def _upfirdn(h, x, up, down, start, npts):
+    """
+    Returns ``npts`` samples starting at index ``start`` of the data
+    upsampled by ``up``, filtered with ``h`` and downsampled by ``down``.
+
+    Only the samples needed are computed, for every output sample only the
+    filter coefficients of one phase are applied.
+    """
+    # filter bank: row p holds the coefficients h[p], h[p + up], ...
+    ntaps = -(-len(h) // up)
+    bank = np.zeros(ntaps * up)
+    bank[:len(h)] = h
+    bank = bank.reshape(ntaps, up).T
+    # index of the output samples in the upsampled data
+    index = (np.arange(npts) + start) * down
+    phase = index % up
+    index = index // up + ntaps
+    x_padded = np.zeros(len(x) + 2 * ntaps + 1)
+    x_padded[ntaps:ntaps + len(x)] = x
+    index = np.minimum(index, len(x_padded) - 1)
+    y = np.zeros(npts)
+    for i in range(ntaps):
+        y += bank[phase, i] * x_padded[index - i]
+    return y
+
+
+def resample_polyphase(data, old_sampling_rate, new_sampling_rate,
+                       window=('kaiser', 5.0)):
+    """
+    Resamples data by a rational factor using a polyphase FIR filter.
+
+    The data is upsampled by ``up``, lowpass filtered and downsampled by
+    ``down`` where ``up / down`` is the ratio of the new and the old sampling
+    rate (see :func:`get_rational_factors`). The polyphase implementation
+    only evaluates the filter for the output samples so that the cost is
+    proportional to the number of samples. The filter is designed like in
+    :func:`scipy.signal.resample_poly`, it is cached for every ratio.
+
+    In contrast to Fourier methods the data is not assumed to be periodic,
+    there is an edge effect of the length of the filter at the start and the
+    end instead.
+
+    :type data: array_like
+    :param data: Array to resample.
+    :type old_sampling_rate: float
+    :param old_sampling_rate: Sampling rate of the data.
+    :type new_sampling_rate: float
+    :param new_sampling_rate: Desired sampling rate.
+    :type window: str or tuple, optional
+    :param window: Window used to design the FIR filter, see
+        :func:`scipy.signal.firwin`.
+    :rtype: :class:`numpy.ndarray`
+    :return: Resampled data with ``int(len(data) * up / down)`` samples, the
+        first sample is at the time of the first input sample.
+
+    .. rubric:: Example
+
+    >>> data = np.sin(np.arange(100) * 0.1)
+    >>> resampled = resample_polyphase(data, 100.0, 40.0)
+    >>> len(resampled)
+    40
+    >>> np.allclose(resampled[10:30], np.sin(np.arange(10, 30) * 0.25),
+    ...             atol=1e-2)
+    True
+    """
+    up, down = get_rational_factors(old_sampling_rate, new_sampling_rate)
+    data = np.require(data, dtype=np.float64)
+    npts = len(data) * up // down
+    if up == down == 1:
+        return data.copy()
+    h, n_pre_remove = _get_polyphase_filter(up, down, window)
+    try:
+        from scipy.signal import upfirdn
+    except ImportError:
+        # scipy < 0.18
+        return _upfirdn(h, data, up, down, n_pre_remove, npts)
+    return upfirdn(h, data, up, down)[n_pre_remove:n_pre_remove + npts]
+
+
 if __name__ == '__main__':
     import doctest
     doctest.testmod(exclude_empty=True)
@@ -25,6 +25,7 @@ from future.builtins import *  # NOQA
 from future.utils import native_str
 
 import ctypes as C
+import hashlib
 import math as M
 import os
 import warnings
@@ -34,10 +35,10 @@ import scipy.signal
 
 from obspy.core.util.attribdict import AttribDict
 from obspy.core.util.base import NamedTemporaryFile
-from obspy.core.inventory.response import Response
+from obspy.core.inventory.response import Response, _get_cached_response
 from obspy.signal import util
 from obspy.signal.detrend import simple as simple_detrend
-from obspy.signal.headers import clibevresp
+from obspy.signal.headers import clibevresp, evresp_lock
 from obspy.signal.util import _npts2nfft
 
 
@@ -275,22 +276,24 @@ def evalresp_for_frequencies(t_samp, frequencies, filename, date, station='*',
         fn = C.create_string_buffer(tempfile.encode('ascii', 'strict'))
         frequencies = np.asarray(frequencies)
         nfreqs = C.c_int(frequencies.shape[0])
-        res = clibevresp.evresp(sta, cha, net, locid, datime, unts, fn,
-                                frequencies, nfreqs, rtyp, vbs, start_stage,
-                                stop_stage, stdio_flag, C.c_int(0))
-        # optimizing performance, see
-        # https://wiki.python.org/moin/PythonSpeed/PerformanceTips
-        try:
-            nfreqs, rfreqs, rvec = \
-                res[0].nfreqs, res[0].freqs, res[0].rvec
-        except ValueError:
-            msg = "evalresp failed to calculate a response."
-            raise ValueError(msg)
-        h = np.empty(nfreqs, dtype=np.complex128)
-        for i in range(nfreqs):
-            h[i] = rvec[i].real + rvec[i].imag * 1j
-        clibevresp.free_response(res)
-        del nfreqs, rfreqs, rvec, res
+        with evresp_lock:
+            res = clibevresp.evresp(sta, cha, net, locid, datime, unts, fn,
+                                    frequencies, nfreqs, rtyp, vbs,
+                                    start_stage, stop_stage, stdio_flag,
+                                    C.c_int(0))
+            # optimizing performance, see
+            # https://wiki.python.org/moin/PythonSpeed/PerformanceTips
+            try:
+                nfreqs, rfreqs, rvec = \
+                    res[0].nfreqs, res[0].freqs, res[0].rvec
+            except ValueError:
+                msg = "evalresp failed to calculate a response."
+                raise ValueError(msg)
+            h = np.empty(nfreqs, dtype=np.complex128)
+            for i in range(nfreqs):
+                h[i] = rvec[i].real + rvec[i].imag * 1j
+            clibevresp.free_response(res)
+            del nfreqs, rfreqs, rvec, res
     return h
 
 
@@ -325,12 +328,34 @@ def evalresp(t_samp, nfft, filename, date, station='*', channel='*',
     :param debug: Verbose output to stdout. Disabled by default.
     :rtype: :class:`numpy.ndarray` complex128
     :return: Frequency response from SEED RESP-file of length nfft
+
+    Responses are cached, the same RESP information evaluated for the same
+    parameters again is taken from the cache (unless ``debug`` is set), see
+    :func:`~obspy.core.inventory.response.get_response_cache_info`.
     """
     fy = 1 / (t_samp * 2.0)
     # start at zero to get zero for offset/ DC of fft
     freqs = np.linspace(0, fy, nfft // 2 + 1)
-    h = evalresp_for_frequencies(t_samp, freqs, filename, date, station,
-                                 channel, network, locid, units, debug=debug)
+    if debug:
+        h = evalresp_for_frequencies(t_samp, freqs, filename, date, station,
+                                     channel, network, locid, units,
+                                     debug=debug)
+    else:
+        # the content of the RESP information is part of the cache key
+        if hasattr(filename, 'read'):
+            position = filename.tell()
+            content = filename.read()
+            filename.seek(position, 0)
+        else:
+            with open(filename, 'rb') as fh:
+                content = fh.read()
+        if not isinstance(content, bytes):
+            content = content.encode('utf-8')
+        key = ('evalresp', hashlib.sha1(content).hexdigest(), float(t_samp),
+               int(nfft), str(date), station, channel, network, locid, units)
+        h = _get_cached_response(key, evalresp_for_frequencies, t_samp, freqs,
+                                 filename, date, station, channel, network,
+                                 locid, units)
     if freq:
         return h, freqs
     return h
@@ -35,6 +35,7 @@ from matplotlib.ticker import FormatStrFormatter
 
 from obspy import Stream, Trace, UTCDateTime, __version__
 from obspy.core import Stats
+from obspy.core.utcdatetime import UTCDateTimeArray
 from obspy.imaging.scripts.scan import compress_start_end
 from obspy.core.inventory import Inventory
 from obspy.core.util import AttribDict
@@ -858,16 +859,14 @@ class PPSD(object):
                               (native_str('month'), np.int8)])
             times_all_details = np.empty(shape=len(self._times_processed),
                                          dtype=dtype)
-            utc_times_all = [UTCDateTime(t) for t in self._times_processed]
+            utc_times_all = UTCDateTimeArray(self._times_processed)
+            _, iso_week, iso_weekday = utc_times_all.isocalendar()
             times_all_details['time_of_day'][:] = \
-                [t._get_hours_after_midnight() for t in utc_times_all]
-            times_all_details['iso_weekday'][:] = \
-                [t.isoweekday() for t in utc_times_all]
-            times_all_details['iso_week'][:] = \
-                [t.isocalendar()[1] for t in utc_times_all]
-            times_all_details['year'][:] = \
-                [t.year for t in utc_times_all]
-            times_all_details['month'][:] = [t.month for t in utc_times_all]
+                utc_times_all._get_hours_after_midnight()
+            times_all_details['iso_weekday'][:] = iso_weekday
+            times_all_details['iso_week'][:] = iso_week
+            times_all_details['year'][:] = utc_times_all.year
+            times_all_details['month'][:] = utc_times_all.month
             self._current_times_all_details = times_all_details
             return times_all_details
 
@@ -1317,7 +1316,11 @@ class PPSD(object):
         """
         """
         t_diff_gapless = self.step
-        gap_indices = np.argwhere(np.diff(times) - t_diff_gapless)
+        if isinstance(times, UTCDateTimeArray):
+            t_diff = np.round(np.diff(times.ns) / 1e9, times.precision)
+        else:
+            t_diff = np.diff(times)
+        gap_indices = np.argwhere(t_diff - t_diff_gapless)
         gap_indices = (gap_indices.flatten() + 1).tolist()
 
         if not len(gap_indices):
@@ -1338,7 +1341,8 @@ class PPSD(object):
         timestamps are not separated by exactly
         ``self.ppsd_length * (1 - self.overlap)``.
         """
-        return self._split_lists(self.times_processed, self.psd_values)
+        return self._split_lists(UTCDateTimeArray(self._times_processed),
+                                 self.psd_values)
 
     def plot_spectrogram(self, cmap=obspy_sequential, clim=None, grid=True,
                          filename=None, show=True):
@@ -16,8 +16,11 @@ import numpy as np
 import scipy.signal as sg
 
 from obspy import read
-from obspy.signal.filter import (bandpass, highpass, lowpass, envelope,
-                                 lowpass_cheby_2)
+from obspy.signal import filter as signal_filter
+from obspy.signal.filter import (bandpass, bandstop, highpass, lowpass,
+                                 envelope, lowpass_cheby_2, lowpass_fir,
+                                 remez_fir)
+from obspy.signal.util import convolve_overlap_save
 
 
 class FilterTestCase(unittest.TestCase):
@@ -281,6 +284,110 @@ class FilterTestCase(unittest.TestCase):
                     np.testing.assert_allclose(got, expected, rtol=1e-3,
                                                atol=0.9)
 
+    def test_filter_design_cache(self):
+        """
+        Designed filters are cached and the cache is bounded.
+        """
+        signal_filter._SOS_CACHE.clear()
+        sos = signal_filter._bandpass_sos(1.0, 10.0, 100.0, 4)
+        key = ('butter', 'band', 4, (0.02, 0.2))
+        self.assertEqual(list(signal_filter._SOS_CACHE), [key])
+        z, p, k = sg.iirfilter(4, [0.02, 0.2], btype='band', ftype='butter',
+                               output='zpk')
+        np.testing.assert_array_equal(sos, sg.zpk2sos(z, p, k))
+        # copies of the cached design are handed out
+        self.assertTrue(sos.flags.writeable)
+        sos[:] = 0.0
+        np.testing.assert_array_equal(
+            signal_filter._bandpass_sos(1.0, 10.0, 100.0, 4),
+            sg.zpk2sos(z, p, k))
+        self.assertEqual(len(signal_filter._SOS_CACHE), 1)
+        sos2, freq = signal_filter._lowpass_cheby_2_sos(10.0, 100.0)
+        np.testing.assert_array_equal(
+            signal_filter._lowpass_cheby_2_sos(10.0, 100.0)[0], sos2)
+        self.assertEqual(len(signal_filter._SOS_CACHE), 3)
+        # filtering with a cached design gives the same result
+        data = np.random.RandomState(0).randn(1000)
+        expected = signal_filter.bandpass(data, 1.0, 10.0, 100.0)
+        np.testing.assert_array_equal(
+            signal_filter.bandpass(data, 1.0, 10.0, 100.0), expected)
+        np.testing.assert_array_equal(
+            signal_filter.lowpass_cheby_2(data, 10.0, 100.0),
+            signal_filter.lowpass_cheby_2(data, 10.0, 100.0))
+        # the least recently used filters are dropped
+        size = signal_filter.SOS_CACHE_SIZE
+        for i in range(size):
+            signal_filter._lowpass_sos(1.0 + i, 1000.0)
+        self.assertEqual(len(signal_filter._SOS_CACHE), size)
+        self.assertNotIn(key, signal_filter._SOS_CACHE)
+
+    def test_filter_2d(self):
+        """
+        Filtering all rows of a 2-D array at once gives the same as
+        filtering the rows one by one.
+        """
+        np.random.seed(815)
+        data = np.random.randn(4, 500)
+        for func, options in (
+                (bandpass, dict(freqmin=1.0, freqmax=10.0)),
+                (bandstop, dict(freqmin=5.0, freqmax=10.0, corners=2)),
+                (lowpass, dict(freq=5.0)),
+                (highpass, dict(freq=5.0)),
+                (lowpass_cheby_2, dict(freq=10.0))):
+            zerophases = (False,) if func is lowpass_cheby_2 else \
+                (False, True)
+            for zerophase in zerophases:
+                if func is not lowpass_cheby_2:
+                    options['zerophase'] = zerophase
+                expected = np.array([func(row, df=100.0, **options)
+                                     for row in data])
+                got = func(data, df=100.0, **options)
+                np.testing.assert_allclose(got, expected, rtol=1e-12)
+                got = func(data.T, df=100.0, axis=0, **options)
+                np.testing.assert_allclose(got.T, expected, rtol=1e-12)
+
+    def test_convolve_overlap_save(self):
+        """
+        Block-wise convolution equals numpy.convolve for all modes and
+        block sizes.
+        """
+        np.random.seed(815)
+        for npts, ntaps in ((1000, 50), (50, 1000), (10007, 333), (5, 5),
+                            (1, 1), (100000, 2049)):
+            data = np.random.randn(npts)
+            kernel = np.random.randn(ntaps)
+            for mode in ('full', 'same', 'valid'):
+                expected = np.convolve(data, kernel, mode=mode)
+                got = convolve_overlap_save(data, kernel, mode=mode)
+                self.assertEqual(got.shape, expected.shape)
+                np.testing.assert_allclose(got, expected, atol=1e-9)
+            got = convolve_overlap_save(data, kernel, nfft=ntaps + 7)
+            np.testing.assert_allclose(got, np.convolve(data, kernel),
+                                       atol=1e-9)
+        self.assertRaises(ValueError, convolve_overlap_save, data, kernel,
+                          mode='circular')
+        self.assertRaises(ValueError, convolve_overlap_save, data, kernel,
+                          nfft=ntaps - 1)
+        self.assertRaises(ValueError, convolve_overlap_save, data, [])
+
+    def test_fir_filters(self):
+        """
+        FIR filters give the same results as a direct convolution.
+        """
+        np.random.seed(815)
+        data = np.random.randn(10000)
+        got = remez_fir(data, 1.0, 5.0, 100.0)
+        filt = sg.remez(50, [0, 0.9, 1.0, 5.0, 5.5, 49.0], [0, 1, 0],
+                        Hz=100.0)
+        np.testing.assert_allclose(got, np.convolve(filt, data), atol=1e-12)
+        got = lowpass_fir(data, 5.0, 100.0, winlen=256)
+        w = np.fft.fftfreq(256, 0.01)
+        h = np.fft.ifft(np.where(abs(w) < 5.0, 1.0, 0.0))
+        filt = abs(np.fft.fftshift(h) * sg.get_window(11.7, 256))
+        np.testing.assert_allclose(got, np.convolve(filt, data)[128:-128],
+                                   atol=1e-12)
+        self.assertEqual(len(lowpass_fir(data[:100], 5.0, 100.0)), 99)
+
 
 def suite():
     return unittest.makeSuite(FilterTestCase, 'test')
@@ -16,7 +16,10 @@ import matplotlib.pyplot as plt
 from obspy.core.util.testing import ImageComparison
 from obspy.signal.interpolation import (lanczos_interpolation,
                                         calculate_lanczos_kernel,
-                                        plot_lanczos_windows)
+                                        plot_lanczos_windows,
+                                        get_rational_factors,
+                                        resample_polyphase,
+                                        _get_polyphase_filter, _upfirdn)
 
 
 class InterpolationTestCase(unittest.TestCase):
@@ -126,6 +129,38 @@ class InterpolationTestCase(unittest.TestCase):
         np.testing.assert_allclose(data[220:620], output[200:600], atol=1E-4,
                                    rtol=1E-4)
 
+    def test_resample_polyphase(self):
+        """
+        Tests polyphase resampling against scipy.signal.resample_poly and
+        the pure NumPy implementation used for old scipy versions.
+        """
+        from scipy.signal import resample_poly
+        np.random.seed(815)
+        data = np.random.randn(1009)
+        for old, new, up, down in ((100.0, 40.0, 2, 5), (200.0, 250.0, 5, 4),
+                                   (100.0, 99.0, 99, 100), (20.0, 1.0, 1, 20),
+                                   (1.0, 3.0, 3, 1)):
+            self.assertEqual(get_rational_factors(old, new), (up, down))
+            got = resample_polyphase(data, old, new)
+            self.assertEqual(len(got), len(data) * up // down)
+            np.testing.assert_allclose(
+                got, resample_poly(data, up, down)[:len(got)], atol=1e-12)
+            h, n_pre_remove = _get_polyphase_filter(up, down, ('kaiser', 5.0))
+            np.testing.assert_allclose(
+                _upfirdn(h, data, up, down, n_pre_remove, len(got)), got,
+                atol=1e-12)
+        # the filter is cached
+        self.assertIs(_get_polyphase_filter(2, 5, ('kaiser', 5.0))[0],
+                      _get_polyphase_filter(2, 5, ('kaiser', 5.0))[0])
+        # same sampling rate
+        np.testing.assert_array_equal(
+            resample_polyphase(data, 100.0, 100.0), data)
+        # integer data
+        got = resample_polyphase(np.arange(100), 10.0, 5.0)
+        self.assertEqual(got.dtype, np.float64)
+        self.assertRaises(ValueError, get_rational_factors, 100.0, np.pi)
+        self.assertRaises(ValueError, resample_polyphase, data, 0.0, 1.0)
+
     def test_plot_lanczos_window(self):
         """
         Tests the plot_lanczos_window function.
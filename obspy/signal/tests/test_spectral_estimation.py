@@ -190,6 +190,9 @@ class PsdTestCase(unittest.TestCase):
         # read results and compare
         result_hist = np.load(file_histogram)
         self.assertEqual(len(ppsd.times_processed), 4)
+        self.assertTrue(isinstance(ppsd.times_processed, list))
+        self.assertTrue(
+            isinstance(ppsd.times_processed[0], UTCDateTime))
         self.assertEqual(ppsd.nfft, 65536)
         self.assertEqual(ppsd.nlap, 49152)
         np.testing.assert_array_equal(ppsd.current_histogram, result_hist)
@@ -297,6 +297,124 @@ def _npts2nfft(npts, smart=True):
     return nfft
 
 
+# range of FFT lengths used for overlap-save convolution, shorter blocks
+# have too much overhead per block, longer blocks need too much memory
+OVERLAP_SAVE_MIN_NFFT = 2 ** 12
+OVERLAP_SAVE_MAX_NFFT = 2 ** 20
+
+
+def _overlap_save_nfft(ntaps, npts):
+    """
+    Returns the power of two FFT length with the lowest total cost of an
+    overlap-save convolution of ``npts`` output samples with a kernel of
+    ``ntaps`` samples.
+
+    >>> _overlap_save_nfft(100, 10 ** 7)
+    4096
+    >>> _overlap_save_nfft(10000, 10 ** 7)
+    131072
+    >>> _overlap_save_nfft(10, 100)
+    128
+    """
+    lower = next_pow_2(ntaps) if ntaps > 1 else 1
+    upper = max(lower, min(next_pow_2(npts + ntaps - 1),
+                           OVERLAP_SAVE_MAX_NFFT))
+    lower = min(max(lower, OVERLAP_SAVE_MIN_NFFT), upper)
+    best_nfft, best_cost = upper, None
+    nfft = lower
+    while nfft <= upper:
+        step = nfft - ntaps + 1
+        if step > 0:
+            nblocks = -(-npts // step)
+            cost = nblocks * nfft * M.log(nfft + 1)
+            if best_cost is None or cost < best_cost:
+                best_nfft, best_cost = nfft, cost
+        nfft *= 2
+    return best_nfft
+
+
+def _convolve_overlap_save(data, kernel, start, stop, nfft=None):
+    """
+    Returns the samples ``start`` to ``stop`` (exclusive) of the full
+    convolution of ``data`` and ``kernel``, see
+    :func:`convolve_overlap_save`.
+    """
+    data = np.asarray(data, dtype=np.float64)
+    kernel = np.asarray(kernel, dtype=np.float64)
+    npts, ntaps = len(data), len(kernel)
+    if nfft is None:
+        nfft = _overlap_save_nfft(ntaps, stop - start)
+    elif nfft < ntaps:
+        msg = "nfft (%d) must not be smaller than the kernel (%d samples)."
+        raise ValueError(msg % (nfft, ntaps))
+    step = nfft - ntaps + 1
+    spectrum = np.fft.rfft(kernel, nfft)
+    result = np.empty(stop - start, dtype=np.float64)
+    block = np.empty(nfft, dtype=np.float64)
+    for i in range(start, stop, step):
+        # output samples i to i + step - 1 need the input samples
+        # i - ntaps + 1 to i + step - 1, the first ntaps - 1 samples of each
+        # block are overlapping with the previous block
+        first = i - ntaps + 1
+        lo, hi = max(first, 0), min(first + nfft, npts)
+        block.fill(0.0)
+        if hi > lo:
+            block[lo - first:hi - first] = data[lo:hi]
+        y = np.fft.irfft(np.fft.rfft(block) * spectrum, nfft)
+        n = min(step, stop - i)
+        result[i - start:i - start + n] = y[ntaps - 1:ntaps - 1 + n]
+    return result
+
+
+def convolve_overlap_save(data, kernel, mode='full', nfft=None):
+    """
+    Convolution of long real data with an FIR kernel by the overlap-save
+    method.
+
+    The data is processed in blocks of ``nfft`` samples, each block is
+    convolved with the kernel in the frequency domain. In contrast to
+    :func:`scipy.signal.fftconvolve` no FFT of the whole data is needed, the
+    memory used in addition to the result is proportional to the block size
+    and the cost grows linearly with the number of samples.
+
+    :type data: :class:`numpy.ndarray`
+    :param data: Real 1-D data.
+    :type kernel: :class:`numpy.ndarray`
+    :param kernel: Real 1-D FIR kernel, e.g. filter coefficients.
+    :type mode: str, optional
+    :param mode: ``'full'``, ``'same'`` or ``'valid'``, see
+        :func:`numpy.convolve`.
+    :type nfft: int, optional
+    :param nfft: FFT length of a block, at least the length of the kernel.
+        By default the power of two with the lowest total cost is used.
+    :rtype: :class:`numpy.ndarray`
+    :return: Convolution of data and kernel.
+
+    >>> data = np.arange(10, dtype=np.float64)
+    >>> kernel = np.array([1.0, 0.0, -1.0])
+    >>> result = convolve_overlap_save(data, kernel, mode='valid')
+    >>> np.round(result, 10).tolist()
+    [2.0, 2.0, 2.0, 2.0, 2.0, 2.0, 2.0, 2.0]
+    """
+    npts, ntaps = len(data), len(kernel)
+    if not npts or not ntaps:
+        raise ValueError("Data and kernel must not be empty.")
+    full = npts + ntaps - 1
+    if mode == 'full':
+        start, stop = 0, full
+    elif mode == 'same':
+        length = max(npts, ntaps)
+        start = (full - length) // 2
+        stop = start + length
+    elif mode == 'valid':
+        start = min(npts, ntaps) - 1
+        stop = max(npts, ntaps)
+    else:
+        msg = "mode must be 'full', 'same' or 'valid', not '%s'." % mode
+        raise ValueError(msg)
+    return _convolve_overlap_save(data, kernel, start, stop, nfft=nfft)
+
+
 if __name__ == '__main__':
     import doctest
     doctest.testmod(exclude_empty=True)
@@ -90,7 +90,8 @@ KEYWORDS = [
     'focal mechanism', 'GCF', 'GSE1', 'GSE2', 'hob', 'Tau-P', 'imaging',
     'instrument correction', 'instrument simulation', 'IRIS', 'kinemetrics',
     'KML', 'magnitude', 'MiniSEED', 'misfit', 'mopad', 'MSEED', 'NDK', 'NERA',
-    'NERIES', 'NonLinLoc', 'NLLOC', 'Nordic', 'NRL', 'observatory', 'ORFEUS',
+    'NERIES', 'NonLinLoc', 'NLLOC', 'Nordic', 'NRL', 'OBSPYBIN',
+    'observatory', 'ORFEUS',
     'PDAS', 'picker', 'processing', 'PQLX', 'Q', 'real time', 'realtime',
     'REFTEK', 'REFTEK130', 'RT-130', 'RESP', 'response file', 'RT', 'SAC',
     'scardec', 'sc3ml', 'SDS', 'SEED', 'SeedLink', 'SEG-2', 'SEG Y', 'SEISAN',
@@ -148,6 +149,7 @@ ENTRY_POINTS = {
         'GSE1 = obspy.io.gse2.core',
         'GSE2 = obspy.io.gse2.core',
         'MSEED = obspy.io.mseed.core',
+        'OBSPYBIN = obspy.io.obspybin.core',
         'NNSA_KB_CORE = obspy.io.css.core',
         'PDAS = obspy.io.pdas.core',
         'SAC = obspy.io.sac.core',
@@ -278,6 +280,11 @@ ENTRY_POINTS = {
         'isFormat = obspy.io.reftek.core:_is_reftek130',
         'readFormat = obspy.io.reftek.core:_read_reftek130',
         ],
+    'obspy.plugin.waveform.OBSPYBIN': [
+        'isFormat = obspy.io.obspybin.core:_is_obspybin',
+        'readFormat = obspy.io.obspybin.core:_read_obspybin',
+        'writeFormat = obspy.io.obspybin.core:_write_obspybin',
+        ],
     'obspy.plugin.event': [
         'QUAKEML = obspy.io.quakeml.core',
         'SC3ML = obspy.io.seiscomp.event',